@@ -0,0 +1,165 @@
+"""Minimal stand-ins for the parts of Home Assistant the GDD coordinator touches."""
+from __future__ import annotations
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Coroutine, Dict, List, Optional
+
+from homeassistant.config_entries import ConfigEntryState
+
+from custom_components.gdd.const import DOMAIN
+
+
+class FakeState:
+    """State object with the attributes the integration reads."""
+
+    def __init__(self, entity_id: str, state: Any, attributes: Optional[Dict[str, Any]] = None):
+        self.entity_id = entity_id
+        self.domain = entity_id.split(".", 1)[0]
+        self.state = str(state)
+        self.attributes = attributes or {}
+        self.last_updated = datetime.now(timezone.utc)
+
+
+class FakeStates:
+    """State machine holding FakeState objects."""
+
+    def __init__(self):
+        self._states: Dict[str, FakeState] = {}
+
+    def get(self, entity_id: str) -> Optional[FakeState]:
+        return self._states.get(entity_id)
+
+    def set(self, entity_id: str, state: Any, attributes: Optional[Dict[str, Any]] = None) -> FakeState:
+        self._states[entity_id] = FakeState(entity_id, state, attributes)
+        return self._states[entity_id]
+
+    def async_entity_ids(self, domain: Optional[str] = None) -> List[str]:
+        return [
+            entity_id for entity_id in self._states
+            if domain is None or entity_id.startswith(f"{domain}.")
+        ]
+
+
+class FakeServices:
+    """Answers weather.get_forecasts from a canned forecast."""
+
+    def __init__(self, states: FakeStates):
+        self._states = states
+        self.calls = 0
+
+    async def async_call(self, domain, service, data=None, blocking=False, return_response=False):
+        self.calls += 1
+        if (domain, service) != ("weather", "get_forecasts"):
+            return None
+        entity_id = data["entity_id"]
+        state = self._states.get(entity_id)
+        forecast = state.attributes.get("forecast", []) if state else []
+        if data.get("type") != "daily":
+            forecast = []
+        return {entity_id: {"forecast": forecast}}
+
+    def async_register(self, *args, **kwargs) -> None:
+        pass
+
+    def async_remove(self, *args, **kwargs) -> None:
+        pass
+
+
+class FakeConfig:
+    """Loaded components; the recorder is left out so nothing touches a database."""
+
+    def __init__(self):
+        self.components: set = set()
+
+
+class FakeConfigEntries:
+    """Config entries known to the fake hass."""
+
+    def __init__(self):
+        self.entries: Dict[str, Any] = {}
+
+    def async_entries(self, domain: Optional[str] = None) -> List[Any]:
+        return [entry for entry in self.entries.values() if domain is None or entry.domain == domain]
+
+
+class FakeHass:
+    """Just enough of HomeAssistant for the coordinator, history and sensors."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.config = FakeConfig()
+        self.data: Dict[str, Any] = {}
+        self.states = FakeStates()
+        self.services = FakeServices(self.states)
+        self.config_entries = FakeConfigEntries()
+
+    def async_create_task(self, target, *args, **kwargs) -> asyncio.Task:
+        return self.loop.create_task(target)
+
+    def async_create_background_task(self, target, name: str, *args, **kwargs) -> asyncio.Task:
+        return self.loop.create_task(target)
+
+    def async_add_executor_job(self, target: Callable, *args) -> asyncio.Future:
+        return self.loop.run_in_executor(None, target, *args)
+
+
+class FakeStore:
+    """In-memory Store that still serializes on save so write cost is measured."""
+
+    writes = 0
+
+    def __init__(self, hass, version, key, *args, **kwargs):
+        self.key = key
+        self.data: Optional[Any] = None
+        self._pending: Optional[Callable[[], Any]] = None
+
+    async def async_load(self):
+        return self.data
+
+    async def async_save(self, data) -> None:
+        self.data = json.loads(json.dumps(data))
+        FakeStore.writes += 1
+
+    def async_delay_save(self, data_func: Callable[[], Any], delay: float = 0) -> None:
+        self._pending = data_func
+
+    async def async_remove(self) -> None:
+        self.data = None
+
+
+class FakeConfigEntry:
+    """Config entry carrying what the sensors and DataUpdateCoordinator read."""
+
+    def __init__(self, entry_id: str, data: Dict[str, Any]):
+        self.entry_id = entry_id
+        self.domain = DOMAIN
+        self.data = data
+        self.options: Dict[str, Any] = {}
+        self.title = "GDD Calculator"
+        self.state = ConfigEntryState.LOADED
+        self._on_unload: List[Callable] = []
+
+    def async_on_unload(self, func: Callable) -> None:
+        self._on_unload.append(func)
+
+    def async_create_background_task(
+        self, hass: FakeHass, target: Coroutine, name: str, *args, **kwargs
+    ) -> asyncio.Task:
+        return hass.async_create_background_task(target, name)
+
+    def async_start_reauth(self, hass: FakeHass, *args, **kwargs) -> None:
+        pass
+
+
+def daily_forecast(days: int = 10) -> List[Dict[str, Any]]:
+    """A weather.get_forecasts style daily forecast starting today."""
+    today = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0)
+    return [
+        {
+            "datetime": (today + timedelta(days=offset)).isoformat(),
+            "templow": 8.0 + offset % 4,
+            "temperature": 21.0 + offset % 5,
+        }
+        for offset in range(days)
+    ]
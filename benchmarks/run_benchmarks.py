@@ -0,0 +1,265 @@
+"""Benchmark the GDD math, coordinator update cycle and sensor rendering.
+
+Runs against the integration's real code with a fake hass and Store, so only
+the ``homeassistant`` package needs to be installed. Results are JSON:
+
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --compare bench.json
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from homeassistant import config_entries  # noqa: E402
+
+from custom_components.gdd import calculations, climatology, coordinator as gdd_coordinator  # noqa: E402
+from custom_components.gdd import history, sensor as gdd_sensor  # noqa: E402
+from custom_components.gdd.const import (  # noqa: E402
+    DOMAIN, CONF_WEATHER, CONF_BASE_TEMP, CONF_CALCULATION_METHOD, CONF_ZONES,
+    THRESHOLD_ENTITY, METHOD_SIMPLE_AVERAGE, METHOD_SINGLE_SINE,
+)
+
+from fakes import FakeConfigEntry, FakeHass, FakeStore, daily_forecast  # noqa: E402
+
+WEATHER_ENTITY = "weather.bench"
+HISTORY_YEARS = 3
+
+# Pairs spanning cold, crossing and hot days so every branch is exercised
+TEMPERATURE_PAIRS = [
+    (min_temp, min_temp + spread)
+    for min_temp in range(-5, 25, 3)
+    for spread in (2, 6, 10, 14, 18)
+]
+
+
+def _stats(samples: List[float], ops_per_round: int) -> Dict[str, Any]:
+    """Per-operation timings in microseconds."""
+    per_op = sorted(sample / ops_per_round * 1e6 for sample in samples)
+    return {
+        "unit": "us",
+        "rounds": len(per_op),
+        "ops_per_round": ops_per_round,
+        "min": round(per_op[0], 4),
+        "median": round(statistics.median(per_op), 4),
+        "mean": round(statistics.fmean(per_op), 4),
+        "p95": round(per_op[min(len(per_op) - 1, int(len(per_op) * 0.95))], 4),
+        "stdev": round(statistics.pstdev(per_op), 4),
+    }
+
+
+def bench(func: Callable[[], Any], rounds: int, calls: int, ops_per_call: int = 1) -> Dict[str, Any]:
+    """Time a synchronous callable that performs ops_per_call operations."""
+    func()  # Warm caches
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        samples.append(time.perf_counter() - start)
+    return _stats(samples, calls * ops_per_call)
+
+
+async def abench(func: Callable[[], Awaitable[Any]], rounds: int, ops_per_round: int) -> Dict[str, Any]:
+    """Time a coroutine function."""
+    await func()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(ops_per_round):
+            await func()
+        samples.append(time.perf_counter() - start)
+    return _stats(samples, ops_per_round)
+
+
+def _patch_storage() -> None:
+    """Swap the Store used by the integration for the in-memory fake."""
+    for module in (gdd_coordinator, history, climatology):
+        module.Store = FakeStore
+
+
+def _set_weather(hass: FakeHass, temperature: float) -> None:
+    hass.states.set(
+        WEATHER_ENTITY,
+        "sunny",
+        {"temperature": temperature, "forecast": daily_forecast()},
+    )
+
+
+def _seed_history(coordinator) -> None:
+    """Record a few years of finished days so normals and projections have data."""
+    start = date.today() - timedelta(days=365 * HISTORY_YEARS)
+    for offset in range(365 * HISTORY_YEARS):
+        day = start + timedelta(days=offset)
+        min_temp, max_temp = TEMPERATURE_PAIRS[offset % len(TEMPERATURE_PAIRS)]
+        coordinator._record_history_day(
+            day, min_temp, max_temp, coordinator._calculate_daily_gdd(min_temp, max_temp)
+        )
+    coordinator.history.loaded = True
+
+
+async def _setup(zones: int):
+    """Build a coordinator and its sensors on a fake hass."""
+    _patch_storage()
+    hass = FakeHass(asyncio.get_running_loop())
+    _set_weather(hass, 15.0)
+    hass.states.set(THRESHOLD_ENTITY, 800)
+
+    data = {
+        CONF_WEATHER: WEATHER_ENTITY,
+        CONF_BASE_TEMP: 10.0,
+        CONF_CALCULATION_METHOD: METHOD_SIMPLE_AVERAGE,
+        CONF_ZONES: [
+            {"zone_id": f"zone_{index}", "name": f"Zone {index}",
+             CONF_BASE_TEMP: 5.0 + index % 8, CONF_CALCULATION_METHOD: METHOD_SINGLE_SINE}
+            for index in range(zones)
+        ],
+    }
+    entry = FakeConfigEntry("bench", data)
+    if hasattr(config_entries, "current_entry"):
+        config_entries.current_entry.set(entry)
+
+    coordinator = gdd_coordinator.GDDCoordinator(hass, data, entry.entry_id)
+    coordinator._update_helper_cache(THRESHOLD_ENTITY, hass.states.get(THRESHOLD_ENTITY))
+    await coordinator.async_load()
+    _seed_history(coordinator)
+    coordinator.data = await coordinator._async_update_data()
+
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    sensors: List[Any] = []
+    await gdd_sensor.async_setup_entry(hass, entry, sensors.extend)
+    return hass, coordinator, sensors
+
+
+async def run(rounds: int, zones: int) -> Dict[str, Any]:
+    """Run every benchmark and return the results document."""
+    hass, coordinator, sensors = await _setup(zones)
+    results: Dict[str, Any] = {}
+
+    # Scalar GDD methods, one call per temperature pair
+    pairs = TEMPERATURE_PAIRS
+    for name, method in (
+        ("calc_simple_average", coordinator._calculate_gdd_simple_average),
+        ("calc_modified_average", coordinator._calculate_gdd_modified_average),
+        ("calc_single_sine", coordinator._calculate_gdd_single_sine),
+    ):
+        def calc(method=method):
+            for min_temp, max_temp in pairs:
+                method(min_temp, max_temp)
+        results[name] = bench(calc, rounds, 20, len(pairs))
+
+    # One season for every method and 51 base temperatures
+    season_min = [pairs[index % len(pairs)][0] for index in range(365)]
+    season_max = [pairs[index % len(pairs)][1] for index in range(365)]
+    bases = [index * 0.5 for index in range(51)]
+    results["calc_batch_season_python"] = bench(
+        lambda: calculations.calculate_gdd_batch(season_min, season_max, bases, use_numpy=False), rounds, 1
+    )
+    if calculations.np is not None:
+        results["calc_batch_season_numpy"] = bench(
+            lambda: calculations.calculate_gdd_batch(season_min, season_max, bases, use_numpy=True), rounds, 5
+        )
+
+    # Forecast: parse the legacy attribute from scratch, then a cached lookup
+    def forecast_cold():
+        coordinator._service_forecast = {}
+        coordinator._forecast_cache_key = None
+        coordinator._get_forecast_temps()
+    results["forecast_parse"] = bench(forecast_cold, rounds, 50)
+    results["forecast_index_service"] = bench(
+        lambda: coordinator._index_forecast(daily_forecast()), rounds, 50
+    )
+    coordinator._service_forecast_key = None
+    await coordinator._async_refresh_forecast()
+    results["forecast_lookup_cached"] = bench(coordinator._get_forecast_temps, rounds, 200)
+
+    # Full update cycle including the write; the temperature changes every
+    # cycle so the rolling window and storage data differ each time
+    temperatures = [12.0 + (index % 12) for index in range(24)]
+    cycle = {"index": 0}
+
+    async def update_cycle():
+        cycle["index"] += 1
+        _set_weather(hass, temperatures[cycle["index"] % len(temperatures)])
+        coordinator.data = await coordinator._async_update_data()
+        await coordinator.async_save()
+
+    writes_before = FakeStore.writes
+    results["update_cycle_with_save"] = await abench(update_cycle, rounds, 10)
+    results["update_cycle_with_save"]["store_writes"] = FakeStore.writes - writes_before
+
+    results["snapshot_build"] = bench(coordinator._build_snapshot, rounds, 20)
+
+    # Render every entity as a state write would
+    def render_all():
+        for entity in sensors:
+            entity._rendered_state()
+    results["sensor_render_all"] = bench(render_all, rounds, 20)
+    results["sensor_render_all"]["entities"] = len(sensors)
+
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": calculations.np is not None,
+        "zones": zones,
+        "history_days": len(coordinator.history),
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> bool:
+    """Print median ratios against a baseline; return False on any regression."""
+    ok = True
+    print(f"{'benchmark':32} {'baseline':>12} {'current':>12} {'ratio':>7}", file=sys.stderr)
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous.get("median"):
+            continue
+        ratio = result["median"] / previous["median"]
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  REGRESSION"
+            ok = False
+        print(
+            f"{name:32} {previous['median']:>12.3f} {result['median']:>12.3f} {ratio:>6.2f}x{flag}",
+            file=sys.stderr,
+        )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=30, help="Timed rounds per benchmark")
+    parser.add_argument("--zones", type=int, default=4, help="Zones configured on the entry")
+    parser.add_argument("--output", type=Path, help="Write results JSON to this file")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed median slowdown before failing (0.25 = 25%%)"
+    )
+    args = parser.parse_args()
+
+    document = asyncio.run(run(args.rounds, args.zones))
+    output = json.dumps(document, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        return 0 if compare(document, json.loads(args.compare.read_text()), args.tolerance) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
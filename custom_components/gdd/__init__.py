@@ -1,58 +1,153 @@
 """GDD integration setup with improved error handling."""
 from __future__ import annotations
+import asyncio
 import logging
+from datetime import timedelta
 
-from homeassistant.core import HomeAssistant, ServiceCall
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import device_registry as dr
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr, entity_registry as er
 from homeassistant.helpers.event import async_track_state_change_event
-
-from .const import DOMAIN, DEFAULT_THRESHOLD
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN, DEFAULT_THRESHOLD, ATTR_ENTRY_ID, ATTR_ZONE, CONF_ZONES, CONF_ZONE_ID, CONF_WEATHER, CONF_BASE_TEMP, CONF_CALCULATION_METHOD,
+    CONF_TEMPERATURE_SENSOR, CONF_INGESTION_MODE, INGESTION_MODE_POLL,
+    CONF_ROLLING_WINDOW_HOURS, CONF_USE_ROLLING_WINDOW, DEFAULT_ROLLING_WINDOW_HOURS,
+    STORAGE_KEY, STORAGE_VERSION, LEGACY_STORAGE_VERSION, DATA_LEGACY_STORAGE,
+    DATA_FORECAST_PROVIDER, PROJECTION_HORIZON_DAYS
+)
 from .coordinator import GDDCoordinator
+from .history import GDDHistory
+from .climatology import ClimatologyIndex
+from .ensemble import EnsembleCancelled
+from .recorder_history import recorder_available
 
 _LOGGER = logging.getLogger(__name__)
 
+QUERY_RANGE_SCHEMA = vol.Schema({
+    vol.Required("start_date"): cv.date,
+    vol.Optional("end_date"): cv.date,
+    vol.Optional(ATTR_ENTRY_ID): cv.string,
+})
+
+MAX_SWEEP_STEPS = 500
+
+
+def _validate_sweep(data: dict) -> dict:
+    """Validate the base temperature range of a sweep."""
+    if data["max_base"] < data["min_base"]:
+        raise vol.Invalid("max_base must not be below min_base")
+    if (data["max_base"] - data["min_base"]) / data["step"] >= MAX_SWEEP_STEPS:
+        raise vol.Invalid(f"Sweep is limited to {MAX_SWEEP_STEPS} base temperatures")
+    return data
+
+
+SWEEP_BASE_TEMPERATURE_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Optional("min_base", default=0.0): vol.Coerce(float),
+        vol.Optional("max_base", default=25.0): vol.Coerce(float),
+        vol.Optional("step", default=0.5): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+        vol.Optional("start_date"): cv.date,
+        vol.Optional("end_date"): cv.date,
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+    }),
+    _validate_sweep,
+)
+
+BACKFILL_SCHEMA = vol.Schema({
+    vol.Required("start_date"): cv.date,
+    vol.Optional("end_date"): cv.date,
+    vol.Optional("entity_id"): cv.entity_id,
+    vol.Optional(ATTR_ENTRY_ID): cv.string,
+})
+
+CANCEL_BACKFILL_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_ENTRY_ID): cv.string,
+})
+
+FORECAST_THRESHOLD_DATE_SCHEMA = vol.Schema({
+    vol.Optional("threshold"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional("horizon_days", default=PROJECTION_HORIZON_DAYS): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=PROJECTION_HORIZON_DAYS)
+    ),
+    vol.Optional(ATTR_ENTRY_ID): cv.string,
+})
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up GDD from a config entry."""
-    coordinator = GDDCoordinator(hass, entry.data)
+    """Set up GDD from a config entry.
 
-    # Load persistent GDD values before first refresh
-    await coordinator.async_load()
+    Only restoring from storage and adding entities happen here; helpers,
+    listeners and the first weather refresh finish in the background.
+    """
+    coordinator = GDDCoordinator(hass, entry.data, entry.entry_id)
 
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        _LOGGER.error(f"Failed to refresh GDD coordinator: {err}")
-        raise ConfigEntryNotReady from err
+    # Cache helper values up front; sensors never read them from the state machine
+    entry.async_on_unload(coordinator.async_start_helper_listeners())
+
+    # Load persistent GDD values so sensors start from them
+    await coordinator.async_load()
 
     # Store coordinator in hass data
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Create threshold input_number if it doesn't exist
-    await _ensure_threshold_entity(hass)
-    
-    # Create control helpers for frontend interaction
-    await _ensure_control_helpers(hass)
-
     # Register services
     await _register_services(hass, coordinator)
 
+    # Don't leave ensemble workers or a backfill running after unload
+    entry.async_on_unload(coordinator.async_cancel_ensembles)
+    entry.async_on_unload(coordinator.async_cancel_backfill)
+
+    # Apply options flow changes without a restart
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     # Forward setup to sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
-    
+
+    # Cancelled automatically if the entry unloads first
+    entry.async_create_background_task(
+        hass, _async_finish_setup(hass, entry, coordinator), f"{DOMAIN} setup {entry.entry_id}"
+    )
+
     _LOGGER.info(f"GDD integration setup complete for entry {entry.entry_id}")
     return True
 
 
+async def _async_finish_setup(hass: HomeAssistant, entry: ConfigEntry, coordinator: GDDCoordinator) -> None:
+    """Create helpers and run the first refresh concurrently, then start ingestion.
+
+    A weather entity that is not up yet only leaves the restored values in
+    place until a later poll succeeds.
+    """
+    results = await asyncio.gather(
+        _ensure_threshold_entity(hass),
+        _ensure_control_helpers(hass),
+        coordinator.async_refresh(),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            _LOGGER.error(f"Error finishing GDD setup: {result}")
+
+    # Follow the temperature source between polls when event ingestion is enabled
+    entry.async_on_unload(coordinator.async_start_ingestion())
+    _LOGGER.debug(f"GDD background setup finished for entry {entry.entry_id}")
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor"])
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: GDDCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        # Write any pending coalesced changes before the coordinator goes away
+        await coordinator.async_save()
         
         # Remove services if this was the last entry
         if not hass.data[DOMAIN]:
@@ -60,11 +155,57 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             hass.services.async_remove(DOMAIN, "set_seasonal_gdd")
             hass.services.async_remove(DOMAIN, "set_base_temperature")
             hass.services.async_remove(DOMAIN, "record_mowing")
+            hass.services.async_remove(DOMAIN, "query_range")
+            hass.services.async_remove(DOMAIN, "sweep_base_temperature")
+            hass.services.async_remove(DOMAIN, "forecast_threshold_date")
+            hass.services.async_remove(DOMAIN, "backfill")
+            hass.services.async_remove(DOMAIN, "cancel_backfill")
+            hass.data.pop(DATA_FORECAST_PROVIDER, None)
             _LOGGER.debug("GDD services removed")
     
     return unload_ok
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle config entry updates from the options flow."""
+    coordinator: GDDCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    if (
+        entry.data[CONF_WEATHER] != coordinator.weather_entity
+        or (entry.data.get(CONF_TEMPERATURE_SENSOR) or None) != coordinator.temperature_sensor
+        or entry.data.get(CONF_INGESTION_MODE, INGESTION_MODE_POLL) != coordinator.ingestion_mode
+        or float(entry.data.get(CONF_ROLLING_WINDOW_HOURS, DEFAULT_ROLLING_WINDOW_HOURS))
+        != coordinator.rolling_window_hours
+        or bool(entry.data.get(CONF_USE_ROLLING_WINDOW, False)) != coordinator.use_rolling_window
+        # Zones add or remove sensors
+        or list(entry.data.get(CONF_ZONES, [])) != coordinator.zone_config
+    ):
+        kept = {zone[CONF_ZONE_ID] for zone in entry.data.get(CONF_ZONES, [])}
+        removed = {zone[CONF_ZONE_ID] for zone in coordinator.zone_config} - kept
+        if removed:
+            _async_remove_zone_entities(hass, entry, removed)
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    await coordinator.async_apply_settings(
+        base_temp=entry.data.get(CONF_BASE_TEMP),
+        calculation_method=entry.data.get(CONF_CALCULATION_METHOD),
+    )
+    coordinator.async_schedule_save()
+    await coordinator.async_request_refresh()
+
+
+@callback
+def _async_remove_zone_entities(hass: HomeAssistant, entry: ConfigEntry, zone_ids: set) -> None:
+    """Remove the registry entries of deleted zones so their sensors do not linger."""
+    entity_registry = er.async_get(hass)
+    prefixes = tuple(f"{entry.entry_id}_gdd_zone_{zone_id}_" for zone_id in zone_ids)
+    for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
+        if entity.unique_id.startswith(prefixes):
+            entity_registry.async_remove(entity.entity_id)
+            _LOGGER.info(f"Removed {entity.entity_id} of deleted zone")
+
+
 async def _ensure_threshold_entity(hass: HomeAssistant) -> None:
     """Ensure the GDD threshold input_number exists."""
     entity_id = "input_number.gdd_threshold"
@@ -98,73 +239,70 @@ async def _ensure_threshold_entity(hass: HomeAssistant) -> None:
         _LOGGER.info("You can manually create input_number.gdd_threshold to set custom thresholds")
 
 
+async def _async_create_helper(
+    hass: HomeAssistant, domain: str, entity_id: str, data: dict, label: str
+) -> None:
+    """Create one helper entity unless it already exists."""
+    if entity_id in hass.states.async_entity_ids(domain):
+        return
+    try:
+        await hass.services.async_call(domain, "create", data, blocking=True)
+        _LOGGER.info(f"Created GDD {label} helper")
+    except Exception as err:
+        _LOGGER.warning(f"Could not create GDD {label} helper: {err}")
+
+
 async def _ensure_control_helpers(hass: HomeAssistant) -> None:
-    """Ensure the GDD control helper entities exist."""
-    
-    # GDD Threshold Control Helper
-    threshold_control_id = "input_number.gdd_threshold_control"
-    if threshold_control_id not in hass.states.async_entity_ids("input_number"):
-        try:
-            await hass.services.async_call(
-                "input_number",
-                "create",
-                {
-                    "name": "GDD Threshold Control",
-                    "min": 50,
-                    "max": 5000,
-                    "step": 10,
-                    "mode": "slider",
-                    "initial": 300,  # Good default for turf
-                    "unit_of_measurement": "°C·day",
-                    "icon": "mdi:target",
-                },
-                blocking=True
-            )
-            _LOGGER.info("Created GDD threshold control helper")
-        except Exception as err:
-            _LOGGER.warning(f"Could not create GDD threshold control helper: {err}")
-    
-    # Base Temperature Control Helper
-    base_temp_control_id = "input_number.gdd_base_temp_control"
-    if base_temp_control_id not in hass.states.async_entity_ids("input_number"):
-        try:
-            await hass.services.async_call(
-                "input_number",
-                "create",
-                {
-                    "name": "GDD Base Temperature Control",
-                    "min": 0,
-                    "max": 25,
-                    "step": 0.5,
-                    "mode": "slider",
-                    "initial": 14,
-                    "unit_of_measurement": "°C",
-                    "icon": "mdi:thermometer",
-                },
-                blocking=True
-            )
-            _LOGGER.info("Created GDD base temperature control helper")
-        except Exception as err:
-            _LOGGER.warning(f"Could not create GDD base temperature control helper: {err}")
-    
-    # Maintenance Level Helper
-    maintenance_id = "input_select.gdd_maintenance_level"
-    if maintenance_id not in hass.states.async_entity_ids("input_select"):
-        try:
-            await hass.services.async_call(
-                "input_select",
-                "create",
-                {
-                    "name": "GDD Maintenance Level",
-                    "options": ["low_maintenance", "medium_maintenance", "high_maintenance"],
-                    "initial": "medium_maintenance",
-                    "icon": "mdi:cog",
-                },
-                blocking=True
-            )
-            _LOGGER.info("Created GDD maintenance level helper")
-        except Exception as err:
-            _LOGGER.warning(f"Could not create GDD maintenance level helper: {err}")
+    """Ensure the GDD control helper entities exist, creating them concurrently."""
+    await asyncio.gather(
+        # GDD Threshold Control Helper
+        _async_create_helper(
+            hass,
+            "input_number",
+            "input_number.gdd_threshold_control",
+            {
+                "name": "GDD Threshold Control",
+                "min": 50,
+                "max": 5000,
+                "step": 10,
+                "mode": "slider",
+                "initial": 300,  # Good default for turf
+                "unit_of_measurement": "°C·day",
+                "icon": "mdi:target",
+            },
+            "threshold control",
+        ),
+        # Base Temperature Control Helper
+        _async_create_helper(
+            hass,
+            "input_number",
+            "input_number.gdd_base_temp_control",
+            {
+                "name": "GDD Base Temperature Control",
+                "min": 0,
+                "max": 25,
+                "step": 0.5,
+                "mode": "slider",
+                "initial": 14,
+                "unit_of_measurement": "°C",
+                "icon": "mdi:thermometer",
+            },
+            "base temperature control",
+        ),
+        # Maintenance Level Helper
+        _async_create_helper(
+            hass,
+            "input_select",
+            "input_select.gdd_maintenance_level",
+            {
+                "name": "GDD Maintenance Level",
+                "options": ["low_maintenance", "medium_maintenance", "high_maintenance"],
+                "initial": "medium_maintenance",
+                "icon": "mdi:cog",
+            },
+            "maintenance level",
+        ),
+    )
     
     # Setup sync automations
     await _setup_control_sync(hass)
@@ -216,8 +354,8 @@ async def _setup_control_sync(hass: HomeAssistant) -> None:
                 gdd_data = hass.data.get(DOMAIN, {})
                 for coordinator in gdd_data.values():
                     if hasattr(coordinator, 'set_base_temperature'):
-                        coordinator.set_base_temperature(float(control_state.state))
-                        await coordinator.async_save()
+                        await coordinator.async_apply_settings(base_temp=float(control_state.state))
+                        coordinator.async_schedule_save()
                         await coordinator.async_request_refresh()
                         break
             except Exception as err:
@@ -265,7 +403,7 @@ async def _register_services(hass: HomeAssistant, coordinator: GDDCoordinator) -
         """Service to reset all GDD values."""
         try:
             coordinator.reset_all()
-            await coordinator.async_save()
+            coordinator.async_schedule_save()
             await coordinator.async_request_refresh()
             _LOGGER.info("GDD values reset via service call")
         except Exception as err:
@@ -280,7 +418,7 @@ async def _register_services(hass: HomeAssistant, coordinator: GDDCoordinator) -
                 return
                 
             coordinator.set_seasonal_gdd(value)
-            await coordinator.async_save()
+            coordinator.async_schedule_save()
             await coordinator.async_request_refresh()
             _LOGGER.info(f"Seasonal GDD set to {value} via service call")
         except Exception as err:
@@ -294,8 +432,8 @@ async def _register_services(hass: HomeAssistant, coordinator: GDDCoordinator) -
                 _LOGGER.error("No temperature provided for set_base_temperature service")
                 return
                 
-            coordinator.set_base_temperature(value)
-            await coordinator.async_save()
+            await coordinator.async_apply_settings(base_temp=value)
+            coordinator.async_schedule_save()
             await coordinator.async_request_refresh()
             _LOGGER.info(f"Base temperature set to {value}°C via service call")
         except Exception as err:
@@ -304,21 +442,140 @@ async def _register_services(hass: HomeAssistant, coordinator: GDDCoordinator) -
     async def record_mowing_service(call: ServiceCall):
         """Service to record mowing event."""
         try:
-            coordinator.record_mowing()
-            await coordinator.async_save()
-            _LOGGER.info("Mowing event recorded via service call")
+            zone_id = call.data.get(ATTR_ZONE)
+            if zone_id is None:
+                coordinator.record_mowing()
+                coordinator.async_schedule_save()
+                await coordinator.async_request_refresh()
+                _LOGGER.info("Mowing event recorded via service call")
+                return
+
+            targets = [
+                target for target in hass.data.get(DOMAIN, {}).values() if zone_id in target.zones
+            ]
+            if not targets:
+                _LOGGER.error(f"No GDD zone with id {zone_id}")
+                return
+            for target in targets:
+                target.record_mowing(zone_id)
+                target.async_schedule_save()
+                await target.async_request_refresh()
+            _LOGGER.info(f"Mowing event recorded for zone {zone_id} via service call")
         except Exception as err:
             _LOGGER.error(f"Error recording mowing event: {err}")
 
+    async def query_range_service(call: ServiceCall) -> ServiceResponse:
+        """Service to return accumulated GDD between two dates."""
+        start = call.data["start_date"]
+        end = call.data.get("end_date")
+        if end is not None and end < start:
+            raise ServiceValidationError("end_date must not be before start_date")
+
+        return {
+            "entries": {
+                target.entry_id: await target.async_query_range(start, end)
+                for target in _get_target_coordinators(hass, call)
+            }
+        }
+
+    async def sweep_base_temperature_service(call: ServiceCall) -> ServiceResponse:
+        """Service to return seasonal GDD over a range of base temperatures."""
+        return {
+            "entries": {
+                target.entry_id: await target.async_sweep_base_temperature(
+                    call.data["min_base"],
+                    call.data["max_base"],
+                    call.data["step"],
+                    call.data.get("start_date"),
+                    call.data.get("end_date"),
+                )
+                for target in _get_target_coordinators(hass, call)
+            }
+        }
+
+    async def forecast_threshold_date_service(call: ServiceCall) -> ServiceResponse:
+        """Service to return the spread of threshold dates from past years."""
+        entries = {}
+        for target in _get_target_coordinators(hass, call):
+            threshold = call.data.get("threshold", target.threshold)
+            if threshold is None:
+                raise ServiceValidationError("No threshold given and the GDD threshold helper is not set")
+            try:
+                entries[target.entry_id] = await target.async_run_ensemble(
+                    threshold, call.data["horizon_days"]
+                )
+            except EnsembleCancelled as err:
+                raise HomeAssistantError("Threshold date forecast was cancelled") from err
+        return {"entries": entries}
+
+    async def backfill_service(call: ServiceCall):
+        """Service to rebuild days from the recorder's temperature history."""
+        start = call.data["start_date"]
+        yesterday = dt_util.now().date() - timedelta(days=1)
+        end = min(call.data.get("end_date", yesterday), yesterday)
+        if start > end:
+            raise ServiceValidationError("start_date must be before today and not after end_date")
+        if not recorder_available(hass):
+            raise ServiceValidationError("The recorder is not running")
+
+        targets = _get_target_coordinators(hass, call)
+        if any(target.backfill_running for target in targets):
+            raise ServiceValidationError("A backfill is already running")
+        for target in targets:
+            target.async_start_backfill(start, end, call.data.get("entity_id"))
+        _LOGGER.info(f"GDD backfill started for {start} to {end} via service call")
+
+    async def cancel_backfill_service(call: ServiceCall):
+        """Service to cancel running backfills."""
+        for target in _get_target_coordinators(hass, call):
+            if target.async_cancel_backfill():
+                _LOGGER.info(f"GDD backfill cancelled for entry {target.entry_id}")
+
     # Register services
     hass.services.async_register(DOMAIN, "reset_all", reset_all_service)
     hass.services.async_register(DOMAIN, "set_seasonal_gdd", set_seasonal_service)
     hass.services.async_register(DOMAIN, "set_base_temperature", set_base_temp_service)
     hass.services.async_register(DOMAIN, "record_mowing", record_mowing_service)
+    hass.services.async_register(
+        DOMAIN,
+        "query_range",
+        query_range_service,
+        schema=QUERY_RANGE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "sweep_base_temperature",
+        sweep_base_temperature_service,
+        schema=SWEEP_BASE_TEMPERATURE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "forecast_threshold_date",
+        forecast_threshold_date_service,
+        schema=FORECAST_THRESHOLD_DATE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(DOMAIN, "backfill", backfill_service, schema=BACKFILL_SCHEMA)
+    hass.services.async_register(
+        DOMAIN, "cancel_backfill", cancel_backfill_service, schema=CANCEL_BACKFILL_SCHEMA
+    )
     
     _LOGGER.debug("GDD services registered")
 
 
+def _get_target_coordinators(hass: HomeAssistant, call: ServiceCall) -> list[GDDCoordinator]:
+    """Return the coordinators a service call applies to (all entries by default)."""
+    coordinators = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    if entry_id is None:
+        return list(coordinators.values())
+    if entry_id not in coordinators:
+        raise ServiceValidationError(f"No GDD entry with id {entry_id}")
+    return [coordinators[entry_id]]
+
+
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle removal of an entry."""
     # Clean up device registry entry
@@ -329,3 +586,17 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     if device:
         device_registry.async_remove_device(device.id)
         _LOGGER.info(f"Removed GDD device for entry {entry.entry_id}")
+
+    # Remove the entry's storage, daily history and climatology
+    await Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}").async_remove()
+    await GDDHistory(hass, entry.entry_id).async_remove()
+    await ClimatologyIndex(hass, entry.entry_id).async_remove()
+
+    # The shared pre-v3 blob is only needed until the last entry is gone
+    remaining = [
+        other for other in hass.config_entries.async_entries(DOMAIN)
+        if other.entry_id != entry.entry_id
+    ]
+    if not remaining:
+        await Store(hass, LEGACY_STORAGE_VERSION, STORAGE_KEY).async_remove()
+        hass.data.pop(DATA_LEGACY_STORAGE, None)
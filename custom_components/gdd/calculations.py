@@ -0,0 +1,204 @@
+"""Batch GDD calculations for whole seasons of daily min/max pairs."""
+from __future__ import annotations
+import math
+from array import array
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy ships with Home Assistant core, but stay usable without it
+    np = None
+
+from .const import METHOD_SIMPLE_AVERAGE, METHOD_MODIFIED_AVERAGE, METHOD_SINGLE_SINE
+
+_HALF_PI = math.pi / 2
+
+ALL_METHODS = (METHOD_SIMPLE_AVERAGE, METHOD_MODIFIED_AVERAGE, METHOD_SINGLE_SINE)
+
+
+def gdd_simple_average(min_temp: float, max_temp: float, base_temp: float) -> float:
+    """Calculate GDD using simple average method."""
+    avg_temp = (max_temp + min_temp) / 2
+    return max(avg_temp - base_temp, 0.0)
+
+
+def gdd_modified_average(min_temp: float, max_temp: float, base_temp: float) -> float:
+    """Calculate GDD using modified average method (cap temps at base)."""
+    capped_min = max(min_temp, base_temp)
+    capped_max = max(max_temp, base_temp)
+    avg_temp = (capped_max + capped_min) / 2
+    return max(avg_temp - base_temp, 0.0)
+
+
+def gdd_single_sine(min_temp: float, max_temp: float, base_temp: float) -> float:
+    """Calculate GDD using single sine method."""
+    if max_temp <= base_temp:
+        return 0.0
+
+    if min_temp >= base_temp:
+        return (max_temp + min_temp) / 2 - base_temp
+
+    # Sine wave calculation when crossing base temperature
+    temp_range = max_temp - min_temp
+    if temp_range <= 0:
+        return 0.0
+
+    theta = math.asin((base_temp - min_temp) / temp_range)
+    gdd = ((max_temp + min_temp) / 2 - base_temp) * (1 - theta / _HALF_PI) + \
+          (temp_range * math.cos(theta)) / _HALF_PI
+
+    return max(gdd, 0.0)
+
+
+GDD_FUNCTIONS = {
+    METHOD_SIMPLE_AVERAGE: gdd_simple_average,
+    METHOD_MODIFIED_AVERAGE: gdd_modified_average,
+    METHOD_SINGLE_SINE: gdd_single_sine,
+}
+
+
+def calculate_gdd(min_temp: float, max_temp: float, base_temp: float, method: str) -> float:
+    """Calculate a single day's GDD, defaulting to simple average for unknown methods."""
+    return GDD_FUNCTIONS.get(method, gdd_simple_average)(min_temp, max_temp, base_temp)
+
+
+@dataclass
+class GDDBatchResult:
+    """Per-day and cumulative GDD for every requested method and base temperature.
+
+    ``daily[method][i]`` and ``cumulative[method][i]`` hold the series for
+    ``base_temps[i]``; they are NumPy rows or ``array('d')`` depending on the
+    backend used.
+    """
+
+    base_temps: Tuple[float, ...]
+    methods: Tuple[str, ...]
+    days: int
+    daily: Dict[str, list]
+    cumulative: Dict[str, list]
+
+    def total(self, method: str, base_index: int = 0) -> float:
+        """Return the accumulated GDD for one method and base temperature."""
+        if not self.days:
+            return 0.0
+        return float(self.cumulative[method][base_index][-1])
+
+    def totals(self, method: str) -> List[float]:
+        """Return the accumulated GDD for every base temperature of a method."""
+        return [self.total(method, index) for index in range(len(self.base_temps))]
+
+
+def calculate_gdd_batch(
+    min_temps: Sequence[float],
+    max_temps: Sequence[float],
+    base_temps: Union[float, Iterable[float]],
+    methods: Optional[Iterable[str]] = None,
+    use_numpy: Optional[bool] = None,
+) -> GDDBatchResult:
+    """Calculate per-day and cumulative GDD for whole seasons in one pass.
+
+    ``use_numpy`` defaults to using NumPy whenever it is importable.
+    """
+    if len(min_temps) != len(max_temps):
+        raise ValueError("min_temps and max_temps must have the same length")
+
+    if isinstance(base_temps, (int, float)):
+        bases = (float(base_temps),)
+    else:
+        bases = tuple(float(base) for base in base_temps)
+    selected = tuple(methods) if methods is not None else ALL_METHODS
+    for method in selected:
+        if method not in GDD_FUNCTIONS:
+            raise ValueError(f"Unknown calculation method: {method}")
+
+    if use_numpy is None:
+        use_numpy = np is not None
+    elif use_numpy and np is None:
+        raise RuntimeError("NumPy is not available")
+
+    if use_numpy:
+        daily = _batch_numpy(min_temps, max_temps, bases, selected)
+        cumulative = {method: np.cumsum(values, axis=1) for method, values in daily.items()}
+    else:
+        daily = _batch_python(min_temps, max_temps, bases, selected)
+        cumulative = {
+            method: [array("d", accumulate(row)) for row in rows]
+            for method, rows in daily.items()
+        }
+
+    return GDDBatchResult(
+        base_temps=bases,
+        methods=selected,
+        days=len(min_temps),
+        daily=daily,
+        cumulative=cumulative,
+    )
+
+
+def _batch_numpy(min_temps, max_temps, bases, methods) -> Dict[str, "np.ndarray"]:
+    """Vectorized calculation over a (base, day) grid."""
+    mins = np.asarray(min_temps, dtype=float)[np.newaxis, :]
+    maxs = np.asarray(max_temps, dtype=float)[np.newaxis, :]
+    base = np.asarray(bases, dtype=float)[:, np.newaxis]
+    avg = (maxs + mins) / 2
+
+    results = {}
+    if METHOD_SIMPLE_AVERAGE in methods:
+        results[METHOD_SIMPLE_AVERAGE] = np.maximum(avg - base, 0.0)
+
+    if METHOD_MODIFIED_AVERAGE in methods:
+        capped = (np.maximum(maxs, base) + np.maximum(mins, base)) / 2
+        results[METHOD_MODIFIED_AVERAGE] = np.maximum(capped - base, 0.0)
+
+    if METHOD_SINGLE_SINE in methods:
+        temp_range = maxs - mins
+        safe_range = np.where(temp_range > 0, temp_range, 1.0)
+        theta = np.arcsin(np.clip((base - mins) / safe_range, -1.0, 1.0))
+        crossing = (avg - base) * (1 - theta / _HALF_PI) + temp_range * np.cos(theta) / _HALF_PI
+        crossing = np.where(temp_range > 0, crossing, 0.0)
+        sine = np.where(maxs <= base, 0.0, np.where(mins >= base, avg - base, crossing))
+        results[METHOD_SINGLE_SINE] = np.maximum(sine, 0.0)
+
+    return {method: results[method] for method in methods}
+
+
+def _batch_python(min_temps, max_temps, bases, methods) -> Dict[str, List[array]]:
+    """Pure-Python fallback with the per-day work hoisted into tight loops."""
+    pairs = list(zip(min_temps, max_temps))
+    averages = [(mx + mn) / 2 for mn, mx in pairs]
+    asin = math.asin
+    cos = math.cos
+
+    results: Dict[str, List[array]] = {method: [] for method in methods}
+    for base in bases:
+        if METHOD_SIMPLE_AVERAGE in results:
+            results[METHOD_SIMPLE_AVERAGE].append(
+                array("d", [avg - base if avg > base else 0.0 for avg in averages])
+            )
+
+        if METHOD_MODIFIED_AVERAGE in results:
+            row = array("d")
+            append = row.append
+            for mn, mx in pairs:
+                capped = ((mx if mx > base else base) + (mn if mn > base else base)) / 2 - base
+                append(capped if capped > 0 else 0.0)
+            results[METHOD_MODIFIED_AVERAGE].append(row)
+
+        if METHOD_SINGLE_SINE in results:
+            row = array("d")
+            append = row.append
+            for (mn, mx), avg in zip(pairs, averages):
+                if mx <= base:
+                    append(0.0)
+                elif mn >= base:
+                    append(avg - base)
+                else:
+                    temp_range = mx - mn
+                    theta = asin((base - mn) / temp_range)
+                    gdd = (avg - base) * (1 - theta / _HALF_PI) + temp_range * cos(theta) / _HALF_PI
+                    append(gdd if gdd > 0 else 0.0)
+            results[METHOD_SINGLE_SINE].append(row)
+
+    return results
@@ -0,0 +1,249 @@
+"""Day-of-year climatology of daily GDD and temperatures, kept incrementally."""
+from __future__ import annotations
+import logging
+import time
+import math
+from array import array
+from bisect import bisect_left, insort
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import CLIMATOLOGY_STORAGE_KEY, CLIMATOLOGY_STORAGE_VERSION, SAVE_DELAY_SECONDS
+from .history import _encode, _decode
+from .projection import DAYS_IN_CYCLE, DailyNormals, day_of_year_index
+from .runtime_stats import RuntimeStats
+
+_LOGGER = logging.getLogger(__name__)
+
+FIELDS = ("gdd", "min", "max")
+PERCENTILES = (10, 50, 90)
+
+
+def _float32(value: float) -> float:
+    """Round a value the way the float32 value columns store it."""
+    return array("f", [value])[0]
+
+
+def _percentile(values: array, percent: float) -> Optional[float]:
+    """Linearly interpolated percentile of sorted values."""
+    if not values:
+        return None
+    position = (len(values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class ClimatologyIndex:
+    """Mean, variance and percentiles per day of year for daily GDD, min and max.
+
+    Means and variances are Welford running statistics, so adding or removing
+    a finished day is O(1), and only they are stored, a fixed size per day of
+    year. Percentiles need each slot's values sorted; those are rebuilt from
+    the history on first use with load_values and kept up to date from then on.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self.store = Store(hass, CLIMATOLOGY_STORAGE_VERSION, f"{CLIMATOLOGY_STORAGE_KEY}.{entry_id}")
+        self.days = 0  # Finished days folded into the index
+        self.revision = 0
+        self._saved_revision = 0
+        self.stats: Optional[RuntimeStats] = None  # Set by the coordinator
+        self._normals: Optional[DailyNormals] = None
+        self._normals_revision: Optional[int] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        """Empty every slot."""
+        self.counts = array("H", [0] * DAYS_IN_CYCLE)
+        self.means: Dict[str, array] = {name: array("d", [0.0] * DAYS_IN_CYCLE) for name in FIELDS}
+        self.m2: Dict[str, array] = {name: array("d", [0.0] * DAYS_IN_CYCLE) for name in FIELDS}
+        self.values: Optional[Dict[str, List[array]]] = self._empty_values()
+        self.days = 0
+
+    @staticmethod
+    def _empty_values() -> Dict[str, List[array]]:
+        """One empty sorted value list per field and slot."""
+        return {name: [array("f") for _ in range(DAYS_IN_CYCLE)] for name in FIELDS}
+
+    @property
+    def has_percentiles(self) -> bool:
+        """Whether the sorted values for percentiles are in memory."""
+        return self.values is not None
+
+    def add(self, day: date, gdd: float, min_temp: float, max_temp: float) -> None:
+        """Fold one finished day into its day-of-year slot."""
+        slot = day_of_year_index(day)
+        count = self.counts[slot] + 1
+        self.counts[slot] = count
+        for name, value in zip(FIELDS, (gdd, min_temp, max_temp)):
+            value = _float32(value)
+            means = self.means[name]
+            delta = value - means[slot]
+            means[slot] += delta / count
+            self.m2[name][slot] += delta * (value - means[slot])
+            if self.values is not None:
+                insort(self.values[name][slot], value)
+        self.days += 1
+        self.revision += 1
+
+    def remove(self, day: date, gdd: float, min_temp: float, max_temp: float) -> None:
+        """Take a previously added day back out, e.g. before replacing it."""
+        slot = day_of_year_index(day)
+        count = self.counts[slot]
+        if not count:
+            return
+        count -= 1
+        self.counts[slot] = count
+        for name, value in zip(FIELDS, (gdd, min_temp, max_temp)):
+            value = _float32(value)
+            means = self.means[name]
+            m2 = self.m2[name]
+            if count == 0:
+                means[slot] = 0.0
+                m2[slot] = 0.0
+            else:
+                delta = value - means[slot]
+                means[slot] -= delta / count
+                m2[slot] = max(m2[slot] - delta * (value - means[slot]), 0.0)
+            if self.values is not None:
+                values = self.values[name][slot]
+                index = bisect_left(values, value)
+                if index < len(values) and values[index] == value:
+                    del values[index]
+        self.days -= 1
+        self.revision += 1
+
+    def rebuild(self, columns: Dict[str, array]) -> None:
+        """Rebuild from history columns; used when the stored index is missing or stale."""
+        self._reset()
+        for ordinal, gdd, min_temp, max_temp in zip(
+            columns["day"], columns["gdd"], columns["min"], columns["max"]
+        ):
+            self.add(date.fromordinal(ordinal), gdd, min_temp, max_temp)
+        _LOGGER.debug(f"Rebuilt GDD climatology from {self.days} recorded days")
+
+    def load_values(self, columns: Dict[str, array]) -> None:
+        """Fill the sorted values for percentiles from history columns, leaving the statistics."""
+        values = self._empty_values()
+        for ordinal, gdd, min_temp, max_temp in zip(
+            columns["day"], columns["gdd"], columns["min"], columns["max"]
+        ):
+            slot = day_of_year_index(date.fromordinal(ordinal))
+            for name, value in zip(FIELDS, (gdd, min_temp, max_temp)):
+                values[name][slot].append(value)
+        for slots in values.values():
+            for slot_values in slots:
+                slot_values[:] = array("f", sorted(slot_values))
+        self.values = values
+
+    @property
+    def years(self) -> int:
+        """Most years seen for any day of year."""
+        return max(self.counts) if self.days else 0
+
+    def statistics(self, field: str, day: date) -> Optional[Dict[str, Any]]:
+        """Mean, standard deviation and, once loaded, percentiles of one field for a day of year."""
+        slot = day_of_year_index(day)
+        count = self.counts[slot]
+        if not count:
+            return None
+        stats = {
+            "mean": round(self.means[field][slot], 2),
+            "std_dev": round(math.sqrt(self.m2[field][slot] / (count - 1)), 2) if count > 1 else 0.0,
+            "years": count,
+        }
+        values = self.values[field][slot] if self.values is not None else None
+        if values:
+            for percent in PERCENTILES:
+                stats[f"p{percent}"] = round(_percentile(values, percent), 2)
+        return stats
+
+    def normals(self) -> Optional[DailyNormals]:
+        """Mean daily GDD per day of year with its cumulative sum, cached per revision."""
+        if self._normals_revision != self.revision:
+            means = self.means["gdd"]
+            self._normals = DailyNormals.from_means([
+                means[slot] if count else None for slot, count in enumerate(self.counts)
+            ])
+            self._normals_revision = self.revision
+        return self._normals
+
+    def normal_between(self, start: date, end: date) -> Optional[float]:
+        """Normal GDD accumulated from start to end inclusive, in O(1)."""
+        normals = self.normals()
+        if normals is None:
+            return None
+        if end < start:
+            return 0.0
+        return normals.sum_days(start, (end - start).days + 1)
+
+    async def async_load(self) -> None:
+        """Load the stored index."""
+        try:
+            data = await self.store.async_load()
+            if data:
+                self._restore(data)
+                self._saved_revision = self.revision
+        except Exception as err:
+            _LOGGER.error(f"Error loading GDD climatology: {err}")
+            self._reset()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed write if the index changed since the last one."""
+        if self.revision != self._saved_revision:
+            self.store.async_delay_save(self._data_to_save, SAVE_DELAY_SECONDS)
+
+    async def async_flush(self) -> None:
+        """Write pending changes now."""
+        if self.revision != self._saved_revision:
+            try:
+                data = self._data_to_save()
+                start = time.perf_counter()
+                await self.store.async_save(data)
+                if self.stats is not None:
+                    self.stats.record_store_write("climatology", time.perf_counter() - start)
+            except Exception as err:
+                _LOGGER.error(f"Error saving GDD climatology: {err}")
+
+    async def async_remove(self) -> None:
+        """Remove the backing store."""
+        await self.store.async_remove()
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data for a write and remember the saved revision."""
+        start = time.perf_counter()
+        self._saved_revision = self.revision
+        data = self._as_dict()
+        if self.stats is not None:
+            self.stats.record_store_build("climatology", time.perf_counter() - start)
+        return data
+
+    def _as_dict(self) -> Dict[str, Any]:
+        """Serialize the fixed-size statistics; percentile values come from the history."""
+        fields = {
+            name: {"mean": _encode(self.means[name]), "m2": _encode(self.m2[name])}
+            for name in FIELDS
+        }
+        return {"days": self.days, "counts": _encode(self.counts), "fields": fields}
+
+    def _restore(self, data: Dict[str, Any]) -> None:
+        """Rebuild the index from stored data."""
+        counts = _decode("H", data["counts"])
+        if len(counts) != DAYS_IN_CYCLE:
+            raise ValueError(f"Climatology has {len(counts)} slots, expected {DAYS_IN_CYCLE}")
+
+        self._reset()
+        self.counts = counts
+        for name in FIELDS:
+            stored = data["fields"][name]
+            self.means[name] = _decode("d", stored["mean"])
+            self.m2[name] = _decode("d", stored["m2"])
+        # Older stores also held every value; percentiles are rebuilt from the history
+        self.values = None
+        self.days = data.get("days", sum(counts))
+        self.revision += 1
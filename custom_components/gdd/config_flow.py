@@ -5,13 +5,67 @@ from typing import Any, Dict, Optional
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.helpers import selector
+from homeassistant.util import slugify
 
 from .const import (
     DOMAIN, CONF_WEATHER, CONF_BASE_TEMP, CONF_CALCULATION_METHOD,
-    DEFAULT_BASE, CALCULATION_METHODS, METHOD_SIMPLE_AVERAGE
+    CONF_TEMPERATURE_SENSOR, CONF_INGESTION_MODE,
+    CONF_ROLLING_WINDOW_HOURS, CONF_USE_ROLLING_WINDOW, DEFAULT_ROLLING_WINDOW_HOURS,
+    CONF_ZONES, CONF_ZONE_ID, CONF_ZONE_NAME, CONF_MAINTENANCE_LEVEL, MOWING_THRESHOLDS,
+    DEFAULT_BASE, CALCULATION_METHODS, METHOD_SIMPLE_AVERAGE,
+    INGESTION_MODES, INGESTION_MODE_POLL
 )
 
 
+def _validate_temperature_sensor(hass, user_input: Dict[str, Any], errors: Dict[str, str]) -> None:
+    """Check that an optional temperature sensor exists and reports a number."""
+    sensor = user_input.get(CONF_TEMPERATURE_SENSOR)
+    if not sensor:
+        return
+    state = hass.states.get(sensor)
+    if state is None:
+        errors[CONF_TEMPERATURE_SENSOR] = "temperature_sensor_not_found"
+        return
+    try:
+        float(state.state)
+    except (TypeError, ValueError):
+        errors[CONF_TEMPERATURE_SENSOR] = "temperature_sensor_not_numeric"
+
+
+def _ingestion_schema(current_sensor: Optional[str], current_mode: str) -> Dict[Any, Any]:
+    """Schema fields for the temperature source and ingestion mode."""
+    return {
+        vol.Optional(
+            CONF_TEMPERATURE_SENSOR, description={"suggested_value": current_sensor}
+        ): selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain="sensor",
+                device_class="temperature",
+                multiple=False
+            )
+        ),
+        vol.Required(CONF_INGESTION_MODE, default=current_mode): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[
+                    {"value": mode, "label": label}
+                    for mode, label in INGESTION_MODES.items()
+                ]
+            )
+        ),
+    }
+
+
+def _rolling_window_schema(current_hours: float, current_use: bool) -> Dict[Any, Any]:
+    """Schema fields for the rolling min/max window."""
+    return {
+        vol.Required(CONF_ROLLING_WINDOW_HOURS, default=current_hours): vol.All(
+            vol.Coerce(float),
+            vol.Range(min=1.0, max=168.0)
+        ),
+        vol.Required(CONF_USE_ROLLING_WINDOW, default=current_use): bool,
+    }
+
+
 class GDDConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for GDD integration."""
 
@@ -31,7 +85,8 @@ class GDDConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 state = self.hass.states.get(weather_entity)
                 if state and state.attributes.get("temperature") is None:
                     errors[CONF_WEATHER] = "no_temperature_attribute"
-                else:
+                _validate_temperature_sensor(self.hass, user_input, errors)
+                if not errors:
                     return self.async_create_entry(
                         title="GDD Calculator",
                         data=user_input
@@ -57,6 +112,8 @@ class GDDConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     ]
                 )
             ),
+            **_ingestion_schema(None, INGESTION_MODE_POLL),
+            **_rolling_window_schema(DEFAULT_ROLLING_WINDOW_HOURS, False),
         })
 
         return self.async_show_form(
@@ -83,6 +140,13 @@ class GDDOptionsFlow(config_entries.OptionsFlow):
         self.config_entry = config_entry
 
     async def async_step_init(self, user_input: Optional[Dict[str, Any]] = None):
+        """Choose between settings and zone management."""
+        menu_options = ["settings", "add_zone"]
+        if self.config_entry.data.get(CONF_ZONES):
+            menu_options.append("remove_zone")
+        return self.async_show_menu(step_id="init", menu_options=menu_options)
+
+    async def async_step_settings(self, user_input: Optional[Dict[str, Any]] = None):
         """Manage the options."""
         errors = {}
 
@@ -95,9 +159,11 @@ class GDDOptionsFlow(config_entries.OptionsFlow):
                 state = self.hass.states.get(weather_entity)
                 if state and state.attributes.get("temperature") is None:
                     errors[CONF_WEATHER] = "no_temperature_attribute"
-                else:
-                    # Update config entry data
+                _validate_temperature_sensor(self.hass, user_input, errors)
+                if not errors:
+                    # Update config entry data; a cleared sensor field is omitted from user_input
                     new_data = {**self.config_entry.data, **user_input}
+                    new_data[CONF_TEMPERATURE_SENSOR] = user_input.get(CONF_TEMPERATURE_SENSOR)
                     self.hass.config_entries.async_update_entry(
                         self.config_entry,
                         data=new_data
@@ -108,6 +174,10 @@ class GDDOptionsFlow(config_entries.OptionsFlow):
         current_weather = self.config_entry.data.get(CONF_WEATHER, "")
         current_base = self.config_entry.data.get(CONF_BASE_TEMP, DEFAULT_BASE)
         current_method = self.config_entry.data.get(CONF_CALCULATION_METHOD, METHOD_SIMPLE_AVERAGE)
+        current_sensor = self.config_entry.data.get(CONF_TEMPERATURE_SENSOR)
+        current_mode = self.config_entry.data.get(CONF_INGESTION_MODE, INGESTION_MODE_POLL)
+        current_hours = self.config_entry.data.get(CONF_ROLLING_WINDOW_HOURS, DEFAULT_ROLLING_WINDOW_HOURS)
+        current_use = self.config_entry.data.get(CONF_USE_ROLLING_WINDOW, False)
 
         schema = vol.Schema({
             vol.Required(CONF_WEATHER, default=current_weather): selector.EntitySelector(
@@ -128,13 +198,89 @@ class GDDOptionsFlow(config_entries.OptionsFlow):
                     ]
                 )
             ),
+            **_ingestion_schema(current_sensor, current_mode),
+            **_rolling_window_schema(current_hours, current_use),
         })
 
         return self.async_show_form(
-            step_id="init",
+            step_id="settings",
             data_schema=schema,
             errors=errors,
             description_placeholders={
                 "current_values": f"Current: Base={current_base}°C, Method={CALCULATION_METHODS.get(current_method, 'Unknown')}"
             }
         )
+
+    async def async_step_add_zone(self, user_input: Optional[Dict[str, Any]] = None):
+        """Add a zone sharing this entry's weather and temperature source."""
+        errors = {}
+        zones = list(self.config_entry.data.get(CONF_ZONES, []))
+
+        if user_input is not None:
+            zone_id = slugify(user_input[CONF_ZONE_NAME])
+            if not zone_id:
+                errors[CONF_ZONE_NAME] = "invalid_zone_name"
+            elif any(zone[CONF_ZONE_ID] == zone_id for zone in zones):
+                errors[CONF_ZONE_NAME] = "zone_exists"
+            else:
+                zones.append({CONF_ZONE_ID: zone_id, **user_input})
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry,
+                    data={**self.config_entry.data, CONF_ZONES: zones}
+                )
+                return self.async_create_entry(title="", data={})
+
+        schema = vol.Schema({
+            vol.Required(CONF_ZONE_NAME): str,
+            vol.Required(
+                CONF_BASE_TEMP, default=self.config_entry.data.get(CONF_BASE_TEMP, DEFAULT_BASE)
+            ): vol.All(
+                vol.Coerce(float),
+                vol.Range(min=-10.0, max=50.0)
+            ),
+            vol.Required(
+                CONF_CALCULATION_METHOD,
+                default=self.config_entry.data.get(CONF_CALCULATION_METHOD, METHOD_SIMPLE_AVERAGE)
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[
+                        {"value": method, "label": label}
+                        for method, label in CALCULATION_METHODS.items()
+                    ]
+                )
+            ),
+            vol.Optional(CONF_MAINTENANCE_LEVEL): selector.SelectSelector(
+                selector.SelectSelectorConfig(options=list(MOWING_THRESHOLDS))
+            ),
+        })
+
+        return self.async_show_form(step_id="add_zone", data_schema=schema, errors=errors)
+
+    async def async_step_remove_zone(self, user_input: Optional[Dict[str, Any]] = None):
+        """Remove zones; the update listener deletes their sensors and reloads the entry."""
+        zones = list(self.config_entry.data.get(CONF_ZONES, []))
+
+        if user_input is not None:
+            removed = set(user_input.get(CONF_ZONES, []))
+            self.hass.config_entries.async_update_entry(
+                self.config_entry,
+                data={
+                    **self.config_entry.data,
+                    CONF_ZONES: [zone for zone in zones if zone[CONF_ZONE_ID] not in removed],
+                }
+            )
+            return self.async_create_entry(title="", data={})
+
+        schema = vol.Schema({
+            vol.Optional(CONF_ZONES, default=[]): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[
+                        {"value": zone[CONF_ZONE_ID], "label": zone[CONF_ZONE_NAME]}
+                        for zone in zones
+                    ],
+                    multiple=True
+                )
+            ),
+        })
+
+        return self.async_show_form(step_id="remove_zone", data_schema=schema)
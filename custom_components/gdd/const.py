@@ -5,9 +5,26 @@ DOMAIN = "gdd"
 CONF_WEATHER = "weather_entity"
 CONF_BASE_TEMP = "base_temperature"
 CONF_CALCULATION_METHOD = "calculation_method"
+CONF_TEMPERATURE_SENSOR = "temperature_sensor"
+CONF_INGESTION_MODE = "ingestion_mode"
+CONF_ROLLING_WINDOW_HOURS = "rolling_window_hours"
+CONF_USE_ROLLING_WINDOW = "use_rolling_window"
+CONF_ZONES = "zones"
+CONF_ZONE_ID = "zone_id"
+CONF_ZONE_NAME = "name"
+CONF_MAINTENANCE_LEVEL = "maintenance_level"
+
+ATTR_ENTRY_ID = "entry_id"
+ATTR_ZONE = "zone"
 
 DEFAULT_BASE = 14
 DEFAULT_THRESHOLD = 250
+DEFAULT_ROLLING_WINDOW_HOURS = 24
+DEFAULT_MAINTENANCE_LEVEL = "medium_maintenance"
+
+# Helper entities
+THRESHOLD_ENTITY = "input_number.gdd_threshold"
+MAINTENANCE_LEVEL_ENTITY = "input_select.gdd_maintenance_level"
 
 # Calculation methods
 METHOD_SINGLE_SINE = "single_sine"
@@ -20,11 +37,46 @@ CALCULATION_METHODS = {
     METHOD_SINGLE_SINE: "Single Sine Method"
 }
 
-STORAGE_VERSION = 2
-STORAGE_KEY = f"{DOMAIN}_storage"
+STORAGE_VERSION = 3
+STORAGE_KEY = f"{DOMAIN}_storage"  # Suffixed with the entry id since version 3
+LEGACY_STORAGE_VERSION = 2  # Single blob shared by all entries
+DATA_LEGACY_STORAGE = f"{DOMAIN}_legacy_storage"
+LEGACY_PENDING_ENTRIES = "pending_entries"  # Entries that existed at the upgrade and have no copy yet
+DATA_FORECAST_PROVIDER = f"{DOMAIN}_forecast_provider"
+SAVE_DELAY_SECONDS = 30  # Coalesce bursts of changes into one write
+HISTORY_STORAGE_VERSION = 1
+HISTORY_STORAGE_KEY = f"{DOMAIN}_history"
+CLIMATOLOGY_STORAGE_VERSION = 1
+CLIMATOLOGY_STORAGE_KEY = f"{DOMAIN}_climatology"
+
+# Temperature ingestion modes
+INGESTION_MODE_POLL = "poll"
+INGESTION_MODE_EVENT = "event"
+
+INGESTION_MODES = {
+    INGESTION_MODE_POLL: "Hourly polling",
+    INGESTION_MODE_EVENT: "Every state change (rate limited)",
+}
 
 # Update intervals
 UPDATE_INTERVAL_HOURS = 1
+EVENT_SAMPLE_INTERVAL_SECONDS = 300  # Minimum spacing of buffered samples in event mode
+EVENT_PUBLISH_COOLDOWN_SECONDS = 60  # At most one sensor update per minute from events
+MAX_DAILY_SAMPLES = 288  # One day of 5-minute samples
+FORECAST_CACHE_MINUTES = 30  # weather.get_forecasts results shared by all entries
+PROJECTION_HORIZON_DAYS = 365  # Threshold dates further out are not projected
+RECORDER_CHUNK_DAYS = 7  # Days of recorder states read per query
+STATISTICS_IMPORT_BATCH = 366  # Long-term statistics rows per recorder import job
+MAX_PENDING_HOURLY_STATISTICS = 48  # Finished hours kept while waiting for an import
+
+# Backfill from recorder history
+BACKFILL_IDLE = "idle"
+BACKFILL_RUNNING = "running"
+BACKFILL_FINISHED = "finished"
+BACKFILL_CANCELLED = "cancelled"
+BACKFILL_FAILED = "failed"
+BACKFILL_SPARSE_READINGS = 6  # Days built from fewer readings likely miss their min or max
+BACKFILL_SPARSE_DAYS_LISTED = 20  # Sparsest days named on the backfill sensor
 DAILY_UPDATE_TIME = "00:30"  # Daily calculations at 12:30 AM
 
 # Turf Management Constants
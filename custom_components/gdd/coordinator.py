@@ -1,20 +1,55 @@
 """Enhanced GDD coordinator that uses weather forecast data when available."""
 from __future__ import annotations
+import asyncio
 import logging
 import math
+import threading
+import time
+from array import array
+from types import MappingProxyType
 from datetime import datetime, timedelta, date
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN, CONF_WEATHER, CONF_BASE_TEMP, CONF_CALCULATION_METHOD,
-    STORAGE_KEY, STORAGE_VERSION, UPDATE_INTERVAL_HOURS,
-    METHOD_SIMPLE_AVERAGE, METHOD_MODIFIED_AVERAGE, METHOD_SINGLE_SINE,
-    TURF_GROWTH_RATES, MOWING_THRESHOLDS, PGR_THRESHOLDS
+    CONF_TEMPERATURE_SENSOR, CONF_INGESTION_MODE, INGESTION_MODE_POLL, INGESTION_MODE_EVENT,
+    EVENT_SAMPLE_INTERVAL_SECONDS, EVENT_PUBLISH_COOLDOWN_SECONDS, MAX_DAILY_SAMPLES,
+    CONF_ROLLING_WINDOW_HOURS, CONF_USE_ROLLING_WINDOW, DEFAULT_ROLLING_WINDOW_HOURS, CONF_ZONES,
+    STORAGE_KEY, STORAGE_VERSION, LEGACY_STORAGE_VERSION, DATA_LEGACY_STORAGE, LEGACY_PENDING_ENTRIES,
+    UPDATE_INTERVAL_HOURS, SAVE_DELAY_SECONDS, PROJECTION_HORIZON_DAYS, RECORDER_CHUNK_DAYS,
+    BACKFILL_RUNNING, BACKFILL_FINISHED, BACKFILL_CANCELLED, BACKFILL_FAILED,
+    METHOD_SIMPLE_AVERAGE, TURF_GROWTH_RATES, MOWING_THRESHOLDS, PGR_THRESHOLDS,
+    THRESHOLD_ENTITY, MAINTENANCE_LEVEL_ENTITY, DEFAULT_MAINTENANCE_LEVEL
+)
+from .calculations import (
+    calculate_gdd, calculate_gdd_batch, gdd_simple_average, gdd_modified_average, gdd_single_sine
+)
+from .history import GDDHistory
+from .climatology import ClimatologyIndex
+from .zones import GDDZone, zones_from_config, calculate_zone_gdd, calculate_zone_gdd_days
+from .recorder_history import (
+    BackfillProgress, DailyTemperatures, async_iter_daily_temperatures, recorder_available
+)
+from .projection import DailyNormals, build_normals, project_threshold_date
+from .ensemble import run_ensemble
+from . import turf
+from .window import RollingMinMax
+from .long_term_statistics import (
+    HourlyTemperatures, async_import_daily_gdd, async_import_hourly_temperatures
+)
+from .runtime_stats import RuntimeStats
+from .snapshot import (
+    GDDSnapshot, parse_threshold, threshold_progress, development_stage, data_source_label
+)
+from .forecast import (
+    ForecastResult, FORECAST_DAILY, FORECAST_HOURLY, async_get_forecast_provider
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,9 +58,16 @@ _LOGGER = logging.getLogger(__name__)
 class GDDCoordinator(DataUpdateCoordinator):
     """Enhanced coordinator that uses weather forecast data when available."""
 
-    def __init__(self, hass: HomeAssistant, config: Dict[str, Any]):
+    def __init__(self, hass: HomeAssistant, config: Dict[str, Any], entry_id: str):
         self.hass = hass
+        self.entry_id = entry_id
         self.weather_entity = config[CONF_WEATHER]
+        self.temperature_sensor: Optional[str] = config.get(CONF_TEMPERATURE_SENSOR) or None
+        self.ingestion_mode = config.get(CONF_INGESTION_MODE, INGESTION_MODE_POLL)
+        self.use_rolling_window = bool(config.get(CONF_USE_ROLLING_WINDOW, False))
+        self.rolling = RollingMinMax(
+            timedelta(hours=float(config.get(CONF_ROLLING_WINDOW_HOURS, DEFAULT_ROLLING_WINDOW_HOURS)))
+        )
         self.base_temp = float(config[CONF_BASE_TEMP])
         self.calculation_method = config.get(CONF_CALCULATION_METHOD, METHOD_SIMPLE_AVERAGE)
 
@@ -53,15 +95,65 @@ class GDDCoordinator(DataUpdateCoordinator):
         self.estimated_growth_mm = 0.0  # Daily growth in millimeters
         self.days_since_mow = 0
         self.accumulated_growth = 0.0  # Total growth in mm
+
+        # Zones share this coordinator's temperatures and forecast
+        self.zone_config: List[Dict[str, Any]] = [dict(zone) for zone in config.get(CONF_ZONES, [])]
+        self.zones: Dict[str, GDDZone] = zones_from_config(self.zone_config)
         
         # Tracking variables
         self.last_calculation_date: Optional[str] = None
         self.last_week_number: Optional[int] = None
         self.daily_temps: list = []  # Store temps throughout the day
+        self.season_start: Optional[str] = None  # First day counted in seasonal_gdd
         
         # Storage
-        self.store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
-        self.last_known_data: Dict[str, Any] = {}
+        self.store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+        self.snapshot = GDDSnapshot()
+        self.snapshot_restored = False  # Showing the persisted snapshot until an update succeeds
+        self._updated_since_start = False
+        self._snapshot_dict: Optional[Dict[str, Any]] = None
+        self._snapshot_dict_source: Optional[GDDSnapshot] = None
+        self._last_saved_data: Optional[Dict[str, Any]] = None
+
+        # Finished days, loaded lazily on first use
+        self.history = GDDHistory(hass, entry_id)
+        self.climatology = ClimatologyIndex(hass, entry_id)
+        self._recompute_lock = asyncio.Lock()
+        self._ensemble_cancels: set[threading.Event] = set()
+        self.backfill = BackfillProgress()
+        self._backfill_task: Optional[asyncio.Task] = None
+
+        # Long-term statistics: hourly temperatures and history days not yet imported
+        self.hourly_temps = HourlyTemperatures()
+        self._statistics_dirty_from: Optional[date] = date.min
+
+        # Runtime instrumentation, reported through diagnostics
+        self.stats = RuntimeStats()
+        self.history.stats = self.stats
+        self.climatology.stats = self.stats
+        self._percentile_load: Optional[asyncio.Task] = None
+
+        # Day-of-year normals per (base, method), rebuilt when the history changes
+        self._normals: Dict[Tuple[float, str], DailyNormals] = {}
+        self._normals_key: Optional[tuple] = None
+
+        # Parsed forecast, keyed by the weather state's last_updated
+        self._forecast_cache_key: Optional[datetime] = None
+        self._forecast_by_date: Dict[date, Tuple[Any, Any]] = {}
+        # Forecasts from weather.get_forecasts, re-indexed per fetched result
+        self._service_forecast: Dict[date, Tuple[Any, Any]] = {}
+        self._service_forecast_key: Optional[ForecastResult] = None
+        self._hourly_forecast: Dict[date, Tuple[Any, Any]] = {}
+        self._hourly_forecast_key: Optional[ForecastResult] = None
+
+        # Helper values, cached from state subscriptions
+        self.threshold: Optional[float] = None
+        self.threshold_present = False
+        self.maintenance_level = DEFAULT_MAINTENANCE_LEVEL
+
+        # Event-driven ingestion
+        self._last_sample_time: Optional[datetime] = None
+        self._unsub_ingestion = None
 
         super().__init__(
             hass,
@@ -70,10 +162,184 @@ class GDDCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(hours=UPDATE_INTERVAL_HOURS),
         )
 
+        # Chatty sensors collapse into at most one sensor update per cooldown
+        self._publish_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=EVENT_PUBLISH_COOLDOWN_SECONDS,
+            immediate=True,
+            function=self._async_publish_ingested,
+        )
+
+    @callback
+    def async_start_helper_listeners(self):
+        """Cache the threshold and maintenance helpers and follow their changes.
+
+        Returns a callable that stops the subscription.
+        """
+        self._update_helper_cache(THRESHOLD_ENTITY, self.hass.states.get(THRESHOLD_ENTITY))
+        self._update_helper_cache(MAINTENANCE_LEVEL_ENTITY, self.hass.states.get(MAINTENANCE_LEVEL_ENTITY))
+        return async_track_state_change_event(
+            self.hass, [THRESHOLD_ENTITY, MAINTENANCE_LEVEL_ENTITY], self._async_handle_helper_event
+        )
+
+    @callback
+    def _update_helper_cache(self, entity_id: str, state) -> bool:
+        """Parse a helper state into the cache. Returns True if the cached value changed."""
+        if entity_id == THRESHOLD_ENTITY:
+            threshold, present = parse_threshold(state)
+            changed = (threshold, present) != (self.threshold, self.threshold_present)
+            self.threshold, self.threshold_present = threshold, present
+            return changed
+
+        level = state.state if state else DEFAULT_MAINTENANCE_LEVEL
+        if level not in MOWING_THRESHOLDS:
+            level = DEFAULT_MAINTENANCE_LEVEL
+        changed = level != self.maintenance_level
+        self.maintenance_level = level
+        return changed
+
+    @callback
+    def _async_handle_helper_event(self, event) -> None:
+        """Re-render sensors when a helper value changes, without polling the weather."""
+        if self._update_helper_cache(event.data["entity_id"], event.data.get("new_state")):
+            self.data = self._build_snapshot()
+            self.async_update_listeners()
+
+    @property
+    def temperature_source(self) -> str:
+        """Entity the current temperature is read from."""
+        return self.temperature_sensor or self.weather_entity
+
+    @staticmethod
+    def _extract_temperature(state) -> Optional[float]:
+        """Read a temperature from a weather entity or a temperature sensor state."""
+        if state is None:
+            return None
+        if state.domain == "weather":
+            value = state.attributes.get("temperature")
+        else:
+            value = state.state
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    @callback
+    def _ingest_temperature(self, temp: float, now: datetime) -> None:
+        """Fold one reading into the running min/max and the sample buffer in O(1)."""
+        self.current_temp = temp
+        self.rolling.add(now, temp)
+        self.hourly_temps.add(now, temp)
+
+        if self.tracked_daily_min is None or temp < self.tracked_daily_min:
+            self.tracked_daily_min = temp
+        if self.tracked_daily_max is None or temp > self.tracked_daily_max:
+            self.tracked_daily_max = temp
+
+        # Rate-limit the sample buffer so chatty sensors don't grow it unbounded
+        if (
+            self._last_sample_time is None
+            or (now - self._last_sample_time).total_seconds() >= EVENT_SAMPLE_INTERVAL_SECONDS
+        ):
+            self._last_sample_time = now
+            self.daily_temps.append(temp)
+            if len(self.daily_temps) > 2 * MAX_DAILY_SAMPLES:
+                del self.daily_temps[:-MAX_DAILY_SAMPLES]
+
+    @callback
+    def async_start_ingestion(self):
+        """Subscribe to temperature state changes when event ingestion is enabled.
+
+        Returns a callable that stops the subscription.
+        """
+        if self.ingestion_mode == INGESTION_MODE_EVENT and self._unsub_ingestion is None:
+            self._unsub_ingestion = async_track_state_change_event(
+                self.hass, [self.temperature_source], self._async_handle_temperature_event
+            )
+            _LOGGER.debug(f"Event ingestion started for {self.temperature_source}")
+        return self.async_stop_ingestion
+
+    @callback
+    def async_stop_ingestion(self) -> None:
+        """Stop event ingestion and any pending sensor update."""
+        if self._unsub_ingestion is not None:
+            self._unsub_ingestion()
+            self._unsub_ingestion = None
+        self._publish_debouncer.async_cancel()
+
+    @callback
+    def _async_handle_temperature_event(self, event) -> None:
+        """Handle a state change of the temperature source."""
+        temp = self._extract_temperature(event.data.get("new_state"))
+        if temp is None:
+            return
+
+        now = dt_util.now()
+        self._ingest_temperature(temp, now)
+
+        # Let the regular update handle the rollover as soon as the day changes
+        if self.last_calculation_date and now.date().isoformat() != self.last_calculation_date:
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+
+        # Coalesces bursts without creating a task per event
+        self._publish_debouncer.async_schedule_call()
+
+    async def _async_publish_ingested(self) -> None:
+        """Push ingested readings to sensors without a full refresh."""
+        self.daily_min, self.daily_max = self._determine_best_min_max()
+        # Not async_set_updated_data: that would keep postponing the hourly update
+        self.data = self._build_snapshot()
+        self.async_update_listeners()
+
+    def _legacy_storage(self) -> Tuple[Store, asyncio.Task]:
+        """The pre-v3 store and its load task, shared by all entries so the file is read once."""
+        legacy = self.hass.data.get(DATA_LEGACY_STORAGE)
+        if legacy is None:
+            legacy_store = Store(self.hass, LEGACY_STORAGE_VERSION, STORAGE_KEY)
+            legacy = (legacy_store, self.hass.async_create_task(legacy_store.async_load()))
+            self.hass.data[DATA_LEGACY_STORAGE] = legacy
+        return legacy
+
+    async def _async_load_legacy(self) -> Optional[Dict[str, Any]]:
+        """Load the pre-v3 blob shared by all entries if this entry still needs a copy.
+
+        The entries configured when the blob is first read are the ones that used
+        it; entries added after the upgrade start empty.
+        """
+        _, task = self._legacy_storage()
+        data = await asyncio.shield(task)
+        if not data:
+            return None
+        pending = data.setdefault(
+            LEGACY_PENDING_ENTRIES,
+            [entry.entry_id for entry in self.hass.config_entries.async_entries(DOMAIN)],
+        )
+        return data if self.entry_id in pending else None
+
+    def _finish_legacy_migration(self, data: Dict[str, Any]) -> None:
+        """Mark this entry as migrated and remove the blob once no entry needs it."""
+        legacy_store, _ = self._legacy_storage()
+        existing = {entry.entry_id for entry in self.hass.config_entries.async_entries(DOMAIN)}
+        data[LEGACY_PENDING_ENTRIES] = [
+            entry_id for entry_id in data[LEGACY_PENDING_ENTRIES]
+            if entry_id != self.entry_id and entry_id in existing
+        ]
+        if data[LEGACY_PENDING_ENTRIES]:
+            legacy_store.async_delay_save(lambda: data, 0)
+        else:
+            # Cancels any pending write of the list as well
+            self.hass.async_create_task(legacy_store.async_remove())
+
     async def async_load(self):
         """Load stored values on startup."""
         try:
             data = await self.store.async_load()
+            migrated = False
+            if data is None:
+                data = await self._async_load_legacy()
+                migrated = data is not None
             if data:
                 self.daily_gdd = data.get("daily_gdd", 0.0)
                 self.weekly_gdd = data.get("weekly_gdd", 0.0)
@@ -86,68 +352,254 @@ class GDDCoordinator(DataUpdateCoordinator):
                 self.weekly_gdd_history = data.get("weekly_gdd_history", [])
                 self.days_since_mow = data.get("days_since_mow", 0)
                 self.accumulated_growth = data.get("accumulated_growth", 0.0)
+                self.season_start = data.get("season_start")
+                dirty_from = data.get("statistics_dirty_from", date.min.isoformat())
+                self._statistics_dirty_from = date.fromisoformat(dirty_from) if dirty_from else None
+                self.rolling.restore(data.get("rolling_window", {}))
+                zone_data = data.get("zones", {})
+                for zone_id, zone in self.zones.items():
+                    zone.restore(zone_data.get(zone_id, {}))
+                if data.get("snapshot"):
+                    # Sensors render the last published values without re-deriving them
+                    self.snapshot = GDDSnapshot.from_dict(data["snapshot"])
+                    self.snapshot_restored = True
+                if migrated:
+                    # Give this entry its own copy of the shared blob
+                    await self.async_save()
+                    if self._last_saved_data is not None:
+                        self._finish_legacy_migration(data)
+                        _LOGGER.info(f"Migrated shared GDD storage to entry {self.entry_id}")
+                else:
+                    self._last_saved_data = self._as_storage_dict()
                 _LOGGER.info(f"Loaded GDD data: seasonal={self.seasonal_gdd}")
         except Exception as err:
             _LOGGER.error(f"Error loading GDD data: {err}")
+        await self.climatology.async_load()
+        if not self.snapshot_restored:
+            self._build_snapshot()
+
+    def _as_storage_dict(self) -> Dict[str, Any]:
+        """Build the data persisted to storage."""
+        return {
+            "daily_gdd": self.daily_gdd,
+            "weekly_gdd": self.weekly_gdd,
+            "seasonal_gdd": self.seasonal_gdd,
+            "last_calculation_date": self.last_calculation_date,
+            "last_week_number": self.last_week_number,
+            "tracked_daily_min": self.tracked_daily_min,
+            "tracked_daily_max": self.tracked_daily_max,
+            "daily_temps": self.daily_temps[-48:],  # Keep last 48 hours
+            "weekly_gdd_history": self.weekly_gdd_history[-4:],  # Keep last 4 weeks
+            "days_since_mow": self.days_since_mow,
+            "accumulated_growth": self.accumulated_growth,
+            "season_start": self.season_start,
+            "statistics_dirty_from": (
+                self._statistics_dirty_from.isoformat() if self._statistics_dirty_from else None
+            ),
+            "rolling_window": self.rolling.as_dict(),
+            "zones": {zone_id: zone.as_dict() for zone_id, zone in self.zones.items()},
+        }
+
+    def _snapshot_as_dict(self) -> Dict[str, Any]:
+        """Serialize the current snapshot, once per snapshot."""
+        if self._snapshot_dict_source is not self.snapshot:
+            self._snapshot_dict = self.snapshot.as_dict()
+            self._snapshot_dict_source = self.snapshot
+        return self._snapshot_dict
+
+    def _with_snapshot(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the current snapshot to data about to be written.
+
+        The snapshot changes on every update, so it rides along with writes
+        caused by other changes instead of taking part in the comparison.
+        """
+        return {**data, "snapshot": self._snapshot_as_dict()}
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data for a delayed write and remember it as saved."""
+        start = time.perf_counter()
+        data = self._as_storage_dict()
+        self._last_saved_data = data
+        to_write = self._with_snapshot(data)
+        self.stats.record_store_build("data", time.perf_counter() - start)
+        return to_write
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Coalesce changes into one delayed write, skipping it if nothing changed.
+
+        Pending writes are flushed by the Store when Home Assistant stops.
+        """
+        self.async_import_statistics()
+        if self._as_storage_dict() != self._last_saved_data:
+            self.store.async_delay_save(self._data_to_save, SAVE_DELAY_SECONDS)
+        self.history.async_schedule_save()
+        self.climatology.async_schedule_save()
 
     async def async_save(self):
-        """Persist values to storage."""
+        """Persist values to storage now if they changed."""
+        self.async_import_statistics()
         try:
-            data = {
-                "daily_gdd": self.daily_gdd,
-                "weekly_gdd": self.weekly_gdd,
-                "seasonal_gdd": self.seasonal_gdd,
-                "last_calculation_date": self.last_calculation_date,
-                "last_week_number": self.last_week_number,
-                "tracked_daily_min": self.tracked_daily_min,
-                "tracked_daily_max": self.tracked_daily_max,
-                "daily_temps": self.daily_temps[-48:],  # Keep last 48 hours
-                "weekly_gdd_history": self.weekly_gdd_history[-4:],  # Keep last 4 weeks
-                "days_since_mow": self.days_since_mow,
-                "accumulated_growth": self.accumulated_growth,
-            }
-            await self.store.async_save(data)
+            start = time.perf_counter()
+            data = self._as_storage_dict()
+            if data != self._last_saved_data:
+                to_write = self._with_snapshot(data)
+                self.stats.record_store_build("data", time.perf_counter() - start)
+                start = time.perf_counter()
+                await self.store.async_save(to_write)
+                self._last_saved_data = data
+                self.stats.record_store_write("data", time.perf_counter() - start)
         except Exception as err:
             _LOGGER.error(f"Error saving GDD data: {err}")
+        await self.history.async_flush()
+        await self.climatology.async_flush()
+
+    @callback
+    def async_import_statistics(self) -> None:
+        """Queue finished hours and changed history days for long-term statistics.
+
+        Daily rows are re-imported from the first changed day so the running
+        sums stay consistent after backfills and recomputes.
+        """
+        if not recorder_available(self.hass):
+            return
+        try:
+            hourly = self.hourly_temps.pop_finished()
+            if hourly:
+                async_import_hourly_temperatures(self.hass, self.entry_id, hourly)
+
+            # A running backfill imports once when it finishes
+            if (
+                self._statistics_dirty_from is None
+                or not self.history.loaded
+                or self.backfill.status == BACKFILL_RUNNING
+            ):
+                return
+            first_day = self.history.first_day
+            if first_day is not None:
+                start = max(self._statistics_dirty_from, first_day)
+                lo, hi = self.history.index_range(start)
+                columns = self.history.columns
+                async_import_daily_gdd(
+                    self.hass,
+                    self.entry_id,
+                    columns["day"][lo:hi],
+                    columns["gdd"][lo:hi],
+                    self.history.sum_gdd(None, start - timedelta(days=1)),
+                )
+            self._statistics_dirty_from = None
+        except Exception as err:
+            _LOGGER.error(f"Error importing GDD statistics: {err}")
+
+    def _mark_statistics_dirty(self, day: date) -> None:
+        """Re-import daily statistics from this day on."""
+        if self._statistics_dirty_from is None or day < self._statistics_dirty_from:
+            self._statistics_dirty_from = day
+
+    async def _async_ensure_history(self) -> None:
+        """Load the history on first use and rebuild the climatology if it is out of step."""
+        await self.history.async_ensure_loaded()
+        if self.climatology.days != len(self.history):
+            self.climatology.rebuild(self.history.columns)
+            self.climatology.async_schedule_save()
+        elif not self.climatology.has_percentiles:
+            self.climatology.load_values(self.history.columns)
+
+    async def _async_load_percentiles(self) -> None:
+        """Load the history in the background so the next snapshot has percentiles."""
+        await self._async_ensure_history()
+        self.data = self._build_snapshot()
+        self.async_update_listeners()
+
+    @staticmethod
+    def _index_forecast(forecast: Optional[List[Dict[str, Any]]]) -> Dict[date, Tuple[Any, Any]]:
+        """Parse forecast entries once into a date -> (templow, temperature) map."""
+        index: Dict[date, Tuple[Any, Any]] = {}
+        for day_forecast in forecast or []:
+            forecast_date_str = day_forecast.get("datetime")
+            if not forecast_date_str:
+                continue
+
+            # Parse forecast date; timestamps are usually UTC, so take their local date
+            if "T" in forecast_date_str:
+                when = dt_util.parse_datetime(forecast_date_str)
+                forecast_date = dt_util.as_local(when).date() if when else None
+            else:
+                forecast_date = dt_util.parse_date(forecast_date_str)
+            if forecast_date is None:
+                continue
+
+            # The first entry for a date wins
+            index.setdefault(forecast_date, (day_forecast.get("templow"), day_forecast.get("temperature")))
+        return index
+
+    @staticmethod
+    def _index_hourly_forecast(forecast: Optional[List[Dict[str, Any]]]) -> Dict[date, Tuple[Any, Any]]:
+        """Reduce hourly forecast entries to a date -> (min, max) map in local time."""
+        index: Dict[date, Tuple[Any, Any]] = {}
+        for hour_forecast in forecast or []:
+            temp = hour_forecast.get("temperature")
+            when = dt_util.parse_datetime(hour_forecast.get("datetime") or "")
+            if temp is None or when is None:
+                continue
+            forecast_date = dt_util.as_local(when).date()
+            low, high = index.get(forecast_date, (temp, temp))
+            index[forecast_date] = (min(low, temp), max(high, temp))
+        return index
+
+    async def _async_refresh_forecast(self) -> None:
+        """Fetch forecasts through the shared provider and re-index them when they change."""
+        provider = async_get_forecast_provider(self.hass)
+        today = dt_util.now().date()
+
+        daily = await provider.async_get_forecast(self.weather_entity, FORECAST_DAILY)
+        if daily is not self._service_forecast_key:
+            self._service_forecast_key = daily
+            start = time.perf_counter()
+            self._service_forecast = self._index_forecast(daily.forecast)
+            self.stats.forecast_parse.record(time.perf_counter() - start)
+
+        # Fall back to hourly entries when the daily forecast has no usable today
+        if None in self._service_forecast.get(today, (None, None)):
+            hourly = await provider.async_get_forecast(self.weather_entity, FORECAST_HOURLY)
+            if hourly is not self._hourly_forecast_key:
+                self._hourly_forecast_key = hourly
+                start = time.perf_counter()
+                self._hourly_forecast = self._index_hourly_forecast(hourly.forecast)
+                self.stats.forecast_parse.record(time.perf_counter() - start)
+            if today in self._hourly_forecast:
+                self._service_forecast = {**self._service_forecast, today: self._hourly_forecast[today]}
+
+    def _get_forecast_index(self) -> Dict[date, Tuple[Any, Any]]:
+        """Return the parsed forecast, re-parsing only when the source changed."""
+        if self._service_forecast:
+            return self._service_forecast
+
+        # Legacy weather entities still expose the forecast attribute
+        state = self.hass.states.get(self.weather_entity)
+        if not state:
+            return {}
+
+        if state.last_updated != self._forecast_cache_key:
+            start = time.perf_counter()
+            self._forecast_by_date = self._index_forecast(state.attributes.get("forecast"))
+            self.stats.forecast_parse.record(time.perf_counter() - start)
+            self._forecast_cache_key = state.last_updated
+        return self._forecast_by_date
 
     def _get_forecast_temps(self) -> tuple[Optional[float], Optional[float]]:
         """Extract today's min/max from weather forecast if available."""
         try:
-            state = self.hass.states.get(self.weather_entity)
-            if not state:
-                return None, None
-                
-            # Try to get forecast data
-            forecast = state.attributes.get("forecast")
+            forecast = self._get_forecast_index()
             if not forecast:
                 _LOGGER.debug("No forecast data available")
                 return None, None
-                
-            # Look for today's forecast
-            today = dt_util.now().date()
-            for day_forecast in forecast[:3]:  # Check today and next 2 days
-                forecast_date_str = day_forecast.get("datetime")
-                if not forecast_date_str:
-                    continue
-                    
-                # Parse forecast date
-                try:
-                    if "T" in forecast_date_str:
-                        forecast_date = datetime.fromisoformat(forecast_date_str.replace("Z", "+00:00")).date()
-                    else:
-                        forecast_date = datetime.fromisoformat(forecast_date_str).date()
-                except ValueError:
-                    continue
-                
-                if forecast_date == today:
-                    min_temp = day_forecast.get("templow")
-                    max_temp = day_forecast.get("temperature")
-                    
-                    if min_temp is not None and max_temp is not None:
-                        _LOGGER.debug(f"Found forecast temps: min={min_temp}°C, max={max_temp}°C")
-                        return float(min_temp), float(max_temp)
-                    break
-                    
+
+            min_temp, max_temp = forecast.get(dt_util.now().date(), (None, None))
+            if min_temp is not None and max_temp is not None:
+                _LOGGER.debug(f"Found forecast temps: min={min_temp}°C, max={max_temp}°C")
+                return float(min_temp), float(max_temp)
+
         except Exception as err:
             _LOGGER.debug(f"Error getting forecast temps: {err}")
             
@@ -159,9 +611,13 @@ class GDDCoordinator(DataUpdateCoordinator):
         # Priority 1: Use forecast data if available for today
         forecast_min, forecast_max = self._get_forecast_temps()
         
-        # Priority 2: Use tracked temperatures from hourly monitoring
+        # Priority 2: Use tracked temperatures from hourly monitoring,
+        # or the rolling window extremes when configured as the input
         tracked_min = self.tracked_daily_min
         tracked_max = self.tracked_daily_max
+        if self.use_rolling_window and self.rolling_min is not None:
+            tracked_min = self.rolling_min
+            tracked_max = self.rolling_max
         
         # Decision logic
         if forecast_min is not None and forecast_max is not None:
@@ -189,67 +645,61 @@ class GDDCoordinator(DataUpdateCoordinator):
 
     def _calculate_gdd_simple_average(self, min_temp: float, max_temp: float) -> float:
         """Calculate GDD using simple average method."""
-        avg_temp = (max_temp + min_temp) / 2
-        return max(avg_temp - self.base_temp, 0.0)
+        return gdd_simple_average(min_temp, max_temp, self.base_temp)
 
     def _calculate_gdd_modified_average(self, min_temp: float, max_temp: float) -> float:
         """Calculate GDD using modified average method (cap temps at base)."""
-        capped_min = max(min_temp, self.base_temp)
-        capped_max = max(max_temp, self.base_temp)
-        avg_temp = (capped_max + capped_min) / 2
-        return max(avg_temp - self.base_temp, 0.0)
+        return gdd_modified_average(min_temp, max_temp, self.base_temp)
 
     def _calculate_gdd_single_sine(self, min_temp: float, max_temp: float) -> float:
         """Calculate GDD using single sine method."""
-        if max_temp <= self.base_temp:
-            return 0.0
-        
-        if min_temp >= self.base_temp:
-            return (max_temp + min_temp) / 2 - self.base_temp
-        
-        # Sine wave calculation when crossing base temperature
-        temp_range = max_temp - min_temp
-        if temp_range <= 0:
-            return 0.0
-            
-        theta = math.asin((self.base_temp - min_temp) / temp_range)
-        gdd = ((max_temp + min_temp) / 2 - self.base_temp) * (1 - theta / (math.pi / 2)) + \
-              (temp_range * math.cos(theta)) / (math.pi / 2)
-        
-        return max(gdd, 0.0)
+        return gdd_single_sine(min_temp, max_temp, self.base_temp)
 
     def _calculate_daily_gdd(self, min_temp: float, max_temp: float) -> float:
         """Calculate daily GDD based on selected method."""
-        if self.calculation_method == METHOD_SINGLE_SINE:
-            return self._calculate_gdd_single_sine(min_temp, max_temp)
-        elif self.calculation_method == METHOD_MODIFIED_AVERAGE:
-            return self._calculate_gdd_modified_average(min_temp, max_temp)
-        else:  # Default to simple average
-            return self._calculate_gdd_simple_average(min_temp, max_temp)
-
-    async def _async_update_data(self) -> Dict[str, Any]:
+        return calculate_gdd(min_temp, max_temp, self.base_temp, self.calculation_method)
+
+    async def _async_update_data(self) -> GDDSnapshot:
+        """Run one update and record its latency."""
+        start = time.perf_counter()
+        try:
+            snapshot = await self._async_update_snapshot()
+            self.snapshot_restored = False
+            self._updated_since_start = True
+            return snapshot
+        finally:
+            self.stats.update_latency.record(time.perf_counter() - start)
+
+    async def _async_update_snapshot(self) -> GDDSnapshot:
         """Update current temperature and perform daily calculations if needed."""
         try:
-            # Get current weather state
-            state = self.hass.states.get(self.weather_entity)
+            # Get current temperature source state
+            state = self.hass.states.get(self.temperature_source)
             if not state:
-                _LOGGER.warning(f"Weather entity {self.weather_entity} not found")
-                return self.last_known_data or {}
+                _LOGGER.warning(f"Temperature source {self.temperature_source} not found")
+                return self._build_snapshot()
 
             # Extract current temperature
-            temp = state.attributes.get("temperature")
+            temp = self._extract_temperature(state)
             if temp is None:
-                _LOGGER.warning(f"No temperature attribute in {self.weather_entity}")
-                return self.last_known_data or {}
+                _LOGGER.warning(f"No temperature available from {self.temperature_source}")
+                return self._build_snapshot()
 
-            self.current_temp = float(temp)
-            self.daily_temps.append(self.current_temp)
-            
-            # Update tracked daily min/max from hourly monitoring
-            if self.tracked_daily_min is None or self.current_temp < self.tracked_daily_min:
-                self.tracked_daily_min = self.current_temp
-            if self.tracked_daily_max is None or self.current_temp > self.tracked_daily_max:
-                self.tracked_daily_max = self.current_temp
+            # Update tracked daily min/max and the sample buffer
+            self._ingest_temperature(temp, dt_util.now())
+
+            # Fetch forecasts (shared and cached across entries)
+            await self._async_refresh_forecast()
+
+            # Only zones with other settings than the entry project from normals
+            # rebuilt from the history, and an empty climatology may just not
+            # have been built yet; everything else reads the climatology index
+            own = (self.base_temp, self.calculation_method)
+            if not self.climatology.days or (
+                self.threshold is not None
+                and any((zone.base_temp, zone.calculation_method) != own for zone in self.zones.values())
+            ):
+                await self._async_ensure_history()
 
             # Determine best min/max to use
             best_min, best_max = self._determine_best_min_max()
@@ -263,8 +713,17 @@ class GDDCoordinator(DataUpdateCoordinator):
             current_year = now.year
 
             # If it's a new day, calculate yesterday's GDD
+            recorded: DailyTemperatures = {}
             if self.last_calculation_date and today_str != self.last_calculation_date:
-                await self._perform_daily_calculation()
+                last_day = date.fromisoformat(self.last_calculation_date)
+                # After downtime the tracked min/max miss part of the last day, so it is
+                # rebuilt from the recorder together with any missed days when possible
+                if not self._updated_since_start or last_day + timedelta(days=1) < now.date():
+                    recorded = await self._async_read_recorder_days(last_day, now.date())
+                if last_day in recorded:
+                    self._reset_daily_tracking()
+                else:
+                    await self._perform_daily_calculation()
 
             # Weekly reset check
             week_key = f"{current_year}-W{current_week}"
@@ -278,39 +737,205 @@ class GDDCoordinator(DataUpdateCoordinator):
                     if len(self.weekly_gdd_history) > 4:  # Keep last 4 weeks
                         self.weekly_gdd_history.pop(0)
                 self.weekly_gdd = 0.0
+                for zone in self.zones.values():
+                    zone.weekly_gdd = 0.0
+
+            # Credit the days rebuilt from the recorder
+            if recorded:
+                await self.async_apply_history_days(recorded)
 
             self.last_calculation_date = today_str
             self.last_week_number = current_week
 
-            # Save data
-            await self.async_save()
-
-            # Prepare return data
-            data = {
-                "current_temp": self.current_temp,
-                "tracked_daily_min": self.tracked_daily_min,
-                "tracked_daily_max": self.tracked_daily_max,
-                "forecast_daily_min": self.forecast_daily_min,
-                "forecast_daily_max": self.forecast_daily_max,
-                "daily_min": self.daily_min,
-                "daily_max": self.daily_max,
-                "daily_gdd": self.daily_gdd,
-                "weekly_gdd": self.weekly_gdd,
-                "seasonal_gdd": self.seasonal_gdd,
-            }
-            
-            self.last_known_data = data
-            return data
+            # Save data (coalesced, skipped when unchanged)
+            self.async_schedule_save()
+
+            # Prepare the snapshot read by all sensors
+            return self._build_snapshot()
 
         except Exception as err:
             _LOGGER.error(f"Error updating GDD data: {err}")
             raise UpdateFailed(f"Error updating GDD data: {err}") from err
 
+    def _build_snapshot(self) -> GDDSnapshot:
+        """Compute every derived value once and publish it as an immutable snapshot."""
+        maintenance_level = self.maintenance_level
+        threshold = self.threshold
+        projected = self._project_threshold_dates(threshold)
+        progress, progress_attributes = threshold_progress(self.seasonal_gdd, threshold, projected[None])
+        stage, stage_attributes = development_stage(self.seasonal_gdd, threshold, self.threshold_present)
+        source_info = self._data_source_info_for(*self._get_forecast_temps())
+        history = self.weekly_gdd_history
+        normal_seasonal, departure = self._departure_from_normal()
+        today = dt_util.now().date()
+        climatology_attributes = {
+            "normal_seasonal_gdd": normal_seasonal,
+            "season_start": self.season_start,
+            "years_of_history": self.climatology.years,
+        }
+        for name in ("gdd", "min", "max"):
+            stats = self.climatology.statistics(name, today)
+            if stats is not None:
+                climatology_attributes[f"normal_daily_{name}"] = stats
+        if self.climatology.days and not self.climatology.has_percentiles and self._percentile_load is None:
+            # Percentiles need the history, which is only read once they are shown
+            self._percentile_load = self.hass.async_create_task(self._async_load_percentiles())
+
+        # Today's estimate for every zone in one batch
+        if self.zones and self.daily_min is not None and self.daily_max is not None:
+            estimates = calculate_zone_gdd(self.zones.values(), self.daily_min, self.daily_max)
+        else:
+            estimates = {}
+        for zone_id, zone in self.zones.items():
+            zone.estimated_daily_gdd = estimates.get(zone_id, 0.0)
+
+        self.snapshot = GDDSnapshot(
+            current_temp=self.current_temp,
+            tracked_daily_min=self.tracked_daily_min,
+            tracked_daily_max=self.tracked_daily_max,
+            forecast_daily_min=self.forecast_daily_min,
+            forecast_daily_max=self.forecast_daily_max,
+            daily_min=self.daily_min,
+            daily_max=self.daily_max,
+            rolling_min=self.rolling_min,
+            rolling_max=self.rolling_max,
+            rolling_window_hours=self.rolling_window_hours,
+            use_rolling_window=self.use_rolling_window,
+            estimated_daily_gdd=self.estimated_daily_gdd,
+            daily_gdd=self.daily_gdd,
+            weekly_gdd=self.weekly_gdd,
+            seasonal_gdd=self.seasonal_gdd,
+            average_weekly_gdd=round(sum(history) / len(history), 1) if history else None,
+            threshold=threshold,
+            progress=progress,
+            progress_attributes=progress_attributes,
+            projected_target_date=projected[None],
+            normal_seasonal_gdd=normal_seasonal,
+            departure_from_normal=departure,
+            climatology_attributes=MappingProxyType(climatology_attributes),
+            development_stage=stage,
+            development_attributes=stage_attributes,
+            data_source=data_source_label(source_info),
+            data_source_info=MappingProxyType(source_info),
+            growth_multiplier=self.growth_rate_multiplier,
+            estimated_growth_mm=self.estimated_growth_mm,
+            accumulated_growth=self.accumulated_growth,
+            days_since_mow=self.days_since_mow,
+            days_to_next_mow=self._days_to_next_mow_for(maintenance_level),
+            mowing_recommendation=self._mowing_recommendation_for(maintenance_level),
+            pgr_recommendation=self.pgr_recommendation,
+            growth_forecast=self.growth_forecast,
+            zones=MappingProxyType({
+                zone_id: zone.snapshot(maintenance_level, projected.get(zone_id))
+                for zone_id, zone in self.zones.items()
+            }),
+        )
+        return self.snapshot
+
+    def _near_term_temps(self) -> Tuple[List[float], List[float]]:
+        """Today's best min/max followed by every consecutive forecast day."""
+        mins: List[float] = []
+        maxs: List[float] = []
+        if self.daily_min is None or self.daily_max is None:
+            return mins, maxs
+        mins.append(self.daily_min)
+        maxs.append(self.daily_max)
+
+        forecast = self._get_forecast_index()
+        day = dt_util.now().date() + timedelta(days=1)
+        while True:
+            low, high = forecast.get(day, (None, None))
+            try:
+                low, high = float(low), float(high)
+            except (TypeError, ValueError):
+                break
+            mins.append(low)
+            maxs.append(high)
+            day += timedelta(days=1)
+        return mins, maxs
+
+    def _get_normals(self, settings: Tuple[Tuple[float, str], ...]) -> Dict[Tuple[float, str], DailyNormals]:
+        """Per-day-of-year normal GDD for each setting.
+
+        The entry's own settings come from the climatology index; other zone
+        settings are rebuilt from the history only when it changes.
+        """
+        normals: Dict[Tuple[float, str], DailyNormals] = {}
+        own = (self.base_temp, self.calculation_method)
+        climatology = self.climatology.normals()
+        if climatology is not None:
+            normals[own] = climatology
+
+        others = tuple(setting for setting in settings if setting != own)
+        if others and self.history.loaded:
+            key = (self.history.revision, others)
+            if key != self._normals_key:
+                columns = self.history.columns
+                self._normals = build_normals(
+                    (date.fromordinal(ordinal) for ordinal in columns["day"]),
+                    columns["min"],
+                    columns["max"],
+                    others,
+                )
+                self._normals_key = key
+            normals.update(self._normals)
+        return normals
+
+    def _departure_from_normal(self) -> Tuple[Optional[float], Optional[float]]:
+        """Seasonal GDD and its difference from the normal for the same days, in O(1).
+
+        Without a known season start the span of seasonal GDD is unknown, so
+        there is nothing to compare against.
+        """
+        if not self.season_start:
+            return None, None
+        today = dt_util.now().date()
+        normal = self.climatology.normal_between(
+            date.fromisoformat(self.season_start), today - timedelta(days=1)
+        )
+        if normal is None:
+            return None, None
+        return round(normal, 1), round(self.seasonal_gdd - normal, 1)
+
+    def _project_threshold_dates(self, threshold: Optional[float]) -> Dict[Optional[str], Optional[date]]:
+        """Projected threshold date for the entry (key None) and every zone.
+
+        Forecast days are run through each target's method in one batch;
+        later days come from the day-of-year normals of the stored history.
+        """
+        targets = {None: (self.seasonal_gdd, self.base_temp, self.calculation_method)}
+        for zone_id, zone in self.zones.items():
+            targets[zone_id] = (zone.seasonal_gdd, zone.base_temp, zone.calculation_method)
+        if threshold is None:
+            return dict.fromkeys(targets)
+
+        settings = tuple(dict.fromkeys((base, method) for _, base, method in targets.values()))
+        normals = self._get_normals(settings)
+        mins, maxs = self._near_term_temps()
+        bases = sorted({base for base, _ in settings})
+        near = calculate_gdd_batch(mins, maxs, bases, tuple(dict.fromkeys(method for _, method in settings)))
+
+        today = dt_util.now().date()
+        projected: Dict[Optional[str], Optional[date]] = {}
+        for key, (seasonal, base, method) in targets.items():
+            if seasonal >= threshold:
+                projected[key] = None
+                continue
+            projected[key] = project_threshold_date(
+                today,
+                threshold - seasonal,
+                near.daily[method][bases.index(base)],
+                normals.get((base, method)),
+                PROJECTION_HORIZON_DAYS,
+            )
+        return projected
+
     async def _perform_daily_calculation(self):
         """Perform the daily GDD calculation."""
         if self.daily_min is None or self.daily_max is None:
             _LOGGER.warning("No min/max temperature data available for daily calculation")
             return
+        start = time.perf_counter()
 
         # Calculate daily GDD
         daily_gdd = self._calculate_daily_gdd(self.daily_min, self.daily_max)
@@ -321,6 +946,15 @@ class GDDCoordinator(DataUpdateCoordinator):
             f"method={self.calculation_method}, result={daily_gdd:.2f}"
         )
 
+        # Keep the finished day in the long-term history and climatology
+        if self.last_calculation_date:
+            await self._async_ensure_history()
+            self._record_history_day(
+                date.fromisoformat(self.last_calculation_date), self.daily_min, self.daily_max, daily_gdd
+            )
+            self.history.async_schedule_save()
+            self.climatology.async_schedule_save()
+
         # Update totals
         self.daily_gdd = daily_gdd
         self.weekly_gdd += daily_gdd
@@ -330,23 +964,191 @@ class GDDCoordinator(DataUpdateCoordinator):
         self.days_since_mow += 1
         self._calculate_turf_growth(daily_gdd)
 
-        # Reset daily tracking for new day
+        # Every zone's day in one batch
+        zone_gdd = calculate_zone_gdd(self.zones.values(), self.daily_min, self.daily_max)
+        for zone_id, zone in self.zones.items():
+            zone.finish_day(zone_gdd[zone_id])
+
+        self._reset_daily_tracking()
+
+        self.stats.record_rollover(dt_util.now(), self.last_calculation_date, time.perf_counter() - start)
+
+    def _reset_daily_tracking(self) -> None:
+        """Reset daily tracking for new day."""
         self.tracked_daily_min = self.current_temp
         self.tracked_daily_max = self.current_temp
         self.daily_temps = []
+        self._last_sample_time = None
+
+    async def _async_read_recorder_days(self, start: date, end: date) -> DailyTemperatures:
+        """Rebuild the days in [start, end) from the recorder; empty when it can't."""
+        if not recorder_available(self.hass):
+            _LOGGER.warning(f"Recorder not available, days from {start} to {end} not rebuilt")
+            return {}
+
+        days: DailyTemperatures = {}
+        try:
+            async for chunk, _readings in async_iter_daily_temperatures(
+                self.hass, self.temperature_source, start, end, self._extract_temperature
+            ):
+                days.update(chunk)
+        except Exception as err:
+            _LOGGER.error(f"Error reading recorder history for {start} to {end}: {err}")
+            return {}
+
+        if len(days) < (end - start).days:
+            _LOGGER.warning(
+                f"Recorder has temperatures for {len(days)} of {(end - start).days} days to rebuild"
+            )
+        return days
+
+    async def async_apply_history_days(self, days: DailyTemperatures) -> int:
+        """Compute finished days from their min/max in one batch and apply them together.
+
+        Every day is written to the history, climatology and statistics. Only
+        days not yet credited, from last_calculation_date on, advance daily
+        GDD, turf growth, mowing and the zones like a rollover. Earlier days
+        reach the seasonal and weekly totals only on or after an explicit
+        season start, adjusting by their difference when already recorded;
+        without one they only feed the history. Everything is persisted in
+        one scheduled save. Returns the number of applied days.
+        """
+        if not days:
+            return 0
+
+        async with self._recompute_lock:
+            await self._async_ensure_history()
+            base_temp = self.base_temp
+            method = self.calculation_method
+            ordered = sorted(days)
+            min_temps = [days[day][0] for day in ordered]
+            max_temps = [days[day][1] for day in ordered]
+            result = await self.hass.async_add_executor_job(
+                calculate_gdd_batch, min_temps, max_temps, base_temp, [method]
+            )
+            zone_gdd = calculate_zone_gdd_days(self.zones.values(), min_temps, max_temps)
+
+            today = dt_util.now().date()
+            week_start = today - timedelta(days=today.weekday())
+            season_start = date.fromisoformat(self.season_start) if self.season_start else None
+            # The day being tracked is the first one not yet in the totals
+            first_uncredited = (
+                date.fromisoformat(self.last_calculation_date) if self.last_calculation_date else today
+            )
+            for index, day in enumerate(ordered):
+                gdd = float(result.daily[method][0][index])
+                previous = self._record_history_day(day, min_temps[index], max_temps[index], gdd)
+                in_season = season_start is None or day >= season_start
+                in_week = day >= week_start
+                new_day = day >= first_uncredited
+                if not new_day and (season_start is None or not in_season):
+                    continue
+
+                if in_season:
+                    self.seasonal_gdd += gdd - (previous or 0.0)
+                    if in_week:
+                        self.weekly_gdd += gdd - (previous or 0.0)
+
+                if new_day:
+                    self.daily_gdd = gdd
+                    self.days_since_mow += 1
+                    self._calculate_turf_growth(gdd)
+                    for zone_id, zone in self.zones.items():
+                        zone.finish_day(zone_gdd[zone_id][index], in_week, in_season)
+                elif previous is None and in_season:
+                    for zone_id, zone in self.zones.items():
+                        zone.add_past_day(zone_gdd[zone_id][index], in_week)
+
+            self.seasonal_gdd = max(self.seasonal_gdd, 0.0)
+            self.weekly_gdd = max(self.weekly_gdd, 0.0)
+            self.async_schedule_save()
+            _LOGGER.info(
+                f"Applied {len(ordered)} days from {ordered[0]} to {ordered[-1]}: "
+                f"seasonal={self.seasonal_gdd:.1f}"
+            )
+            return len(ordered)
+
+    @property
+    def backfill_running(self) -> bool:
+        """Return True while a backfill task is active."""
+        return self._backfill_task is not None and not self._backfill_task.done()
+
+    @callback
+    def async_start_backfill(self, start: date, end: date, entity_id: Optional[str] = None) -> None:
+        """Start rebuilding the days start..end from the recorder in the background.
+
+        Raises RuntimeError if a backfill is already running.
+        """
+        if self.backfill_running:
+            raise RuntimeError("A backfill is already running")
+        self.backfill = BackfillProgress(
+            status=BACKFILL_RUNNING,
+            entity_id=entity_id or self.temperature_source,
+            start=start,
+            end=end,
+            days_total=(end - start).days + 1,
+        )
+        self._backfill_task = self.hass.async_create_background_task(
+            self._async_backfill(self.backfill), f"{DOMAIN} backfill {self.entry_id}"
+        )
+        self.async_update_listeners()
+
+    @callback
+    def async_cancel_backfill(self) -> bool:
+        """Cancel a running backfill; days applied so far are kept."""
+        if not self.backfill_running:
+            return False
+        self._backfill_task.cancel()
+        return True
+
+    async def _async_backfill(self, progress: BackfillProgress) -> None:
+        """Stream the range from the recorder and apply it one chunk at a time."""
+        _LOGGER.info(f"Backfilling {progress.start} to {progress.end} from {progress.entity_id}")
+        try:
+            async for chunk, readings in async_iter_daily_temperatures(
+                self.hass,
+                progress.entity_id,
+                progress.start,
+                progress.end + timedelta(days=1),
+                self._extract_temperature,
+            ):
+                progress.days_applied += await self.async_apply_history_days(chunk)
+                progress.readings.update(readings)
+                progress.days_read = min(progress.days_total, progress.days_read + RECORDER_CHUNK_DAYS)
+                self.async_update_listeners()
+            progress.status = BACKFILL_FINISHED
+            _LOGGER.info(f"Backfill finished: {progress.days_applied} of {progress.days_total} days applied")
+        except asyncio.CancelledError:
+            progress.status = BACKFILL_CANCELLED
+            _LOGGER.info(f"Backfill cancelled after {progress.days_applied} days")
+            raise
+        except Exception as err:
+            progress.status = BACKFILL_FAILED
+            progress.error = str(err)
+            _LOGGER.error(f"Error backfilling GDD history: {err}")
+        finally:
+            # Publish the new totals together with the final progress
+            self.async_schedule_save()
+            self.data = self._build_snapshot()
+            self.async_update_listeners()
+
+    def _record_history_day(self, day: date, min_temp: float, max_temp: float, gdd: float) -> Optional[float]:
+        """Record a finished day in the history and the climatology index.
+
+        Returns the previously recorded GDD for that day, if any.
+        """
+        old = self.history.get(day)
+        previous = self.history.record(day, min_temp, max_temp, gdd, self.base_temp, self.calculation_method)
+        self._mark_statistics_dirty(day)
+        if old is not None:
+            self.climatology.remove(day, old["gdd"], old["min"], old["max"])
+        self.climatology.add(day, gdd, min_temp, max_temp)
+        return previous
 
     def _calculate_turf_growth(self, daily_gdd: float):
         """Calculate daily turf growth and update accumulated growth."""
         # Use warm season grass defaults
-        growth_config = TURF_GROWTH_RATES
-        
-        # Calculate daily growth in mm
-        base_growth = growth_config["base_growth_rate"]
-        daily_growth = daily_gdd * base_growth
-        
-        # Apply growth multiplier based on conditions
-        multiplier = self._calculate_growth_multiplier(daily_gdd, growth_config)
-        actual_growth = daily_growth * multiplier
+        actual_growth, multiplier = turf.daily_growth(daily_gdd, TURF_GROWTH_RATES)
         
         # Update accumulated growth
         self.accumulated_growth += actual_growth
@@ -360,26 +1162,7 @@ class GDDCoordinator(DataUpdateCoordinator):
 
     def _calculate_growth_multiplier(self, daily_gdd: float, growth_config: dict) -> float:
         """Calculate growth rate multiplier based on GDD conditions."""
-        optimal_min, optimal_max = growth_config["optimal_gdd_range"]
-        dormancy_threshold = growth_config["dormancy_threshold"]
-        stress_threshold = growth_config["stress_threshold"]
-        
-        if daily_gdd <= dormancy_threshold:
-            # Dormant/minimal growth
-            return 0.1
-        elif daily_gdd < optimal_min:
-            # Slow growth, ramping up
-            return 0.3 + (daily_gdd - dormancy_threshold) * 0.7 / (optimal_min - dormancy_threshold)
-        elif optimal_min <= daily_gdd <= optimal_max:
-            # Optimal growth range
-            return 1.0
-        elif daily_gdd <= stress_threshold:
-            # Fast growth, stress building
-            excess_ratio = (daily_gdd - optimal_max) / (stress_threshold - optimal_max)
-            return 1.0 + (excess_ratio * 1.5)  # Up to 2.5x normal growth
-        else:
-            # Heat stress, reduced growth
-            return 0.8
+        return turf.growth_multiplier(daily_gdd, growth_config)
 
     def reset_all(self):
         """Reset all GDD values."""
@@ -392,10 +1175,23 @@ class GDDCoordinator(DataUpdateCoordinator):
         self.weekly_gdd_history = []
         self.days_since_mow = 0
         self.accumulated_growth = 0.0
+        for zone in self.zones.values():
+            zone.reset_all()
+        self.season_start = dt_util.now().date().isoformat()
         _LOGGER.info("All GDD values reset")
 
-    def record_mowing(self):
-        """Record that mowing occurred, reset growth tracking."""
+    def record_mowing(self, zone_id: Optional[str] = None):
+        """Record that mowing occurred, reset growth tracking.
+
+        With a zone id only that zone is reset.
+        """
+        if zone_id is not None:
+            zone = self.zones.get(zone_id)
+            if zone is None:
+                raise KeyError(zone_id)
+            zone.record_mowing()
+            _LOGGER.info(f"Mowing recorded for zone {zone.name}, growth tracking reset")
+            return
         self.days_since_mow = 0
         self.accumulated_growth = 0.0
         _LOGGER.info("Mowing recorded, growth tracking reset")
@@ -410,6 +1206,200 @@ class GDDCoordinator(DataUpdateCoordinator):
         self.base_temp = float(base_temp)
         _LOGGER.info(f"Base temperature updated to {self.base_temp}°C")
 
+    async def async_apply_settings(
+        self, base_temp: Optional[float] = None, calculation_method: Optional[str] = None
+    ) -> None:
+        """Change base temperature and/or method and recompute the recorded season."""
+        changed = False
+        if base_temp is not None and float(base_temp) != self.base_temp:
+            self.set_base_temperature(base_temp)
+            changed = True
+        if calculation_method is not None and calculation_method != self.calculation_method:
+            self.calculation_method = calculation_method
+            _LOGGER.info(f"Calculation method updated to {self.calculation_method}")
+            changed = True
+
+        if changed:
+            await self.async_recompute_season()
+
+    async def async_recompute_season(self) -> int:
+        """Recompute recorded days under the current settings.
+
+        Only days recorded with a different base temperature or method are
+        recomputed, in one batch off the event loop. Every recorded year is
+        rewritten so the history and the climatology built from it agree, but
+        only days of the season adjust the totals, by the difference, so manual
+        offsets from set_seasonal_gdd are kept. Returns the number of recomputed days.
+        """
+        async with self._recompute_lock:
+            await self._async_ensure_history()
+            base_temp = self.base_temp
+            method = self.calculation_method
+            season_start = date.fromisoformat(self.season_start) if self.season_start else None
+
+            stale = [
+                record for record in self.history.iter_records()
+                # Bases are stored as float32, so compare with a tolerance
+                if abs(record["base"] - base_temp) > 1e-3 or record["method"] != method
+            ]
+            if not stale:
+                return 0
+
+            result = await self.hass.async_add_executor_job(
+                calculate_gdd_batch,
+                [record["min"] for record in stale],
+                [record["max"] for record in stale],
+                base_temp,
+                [method],
+            )
+
+            today = dt_util.now().date()
+            week_start = today - timedelta(days=today.weekday())
+            last_day = self.history.last_day
+            for record, new_gdd in zip(stale, result.daily[method][0]):
+                new_gdd = float(new_gdd)
+                previous = self.history.record(
+                    record["date"], record["min"], record["max"], new_gdd, base_temp, method
+                )
+                if season_start is not None and record["date"] < season_start:
+                    continue
+                delta = new_gdd - (previous or 0.0)
+                self.seasonal_gdd += delta
+                if record["date"] >= week_start:
+                    self.weekly_gdd += delta
+                if record["date"] == last_day:
+                    self.daily_gdd = new_gdd
+
+            self.seasonal_gdd = max(self.seasonal_gdd, 0.0)
+            self.weekly_gdd = max(self.weekly_gdd, 0.0)
+            self._mark_statistics_dirty(stale[0]["date"])
+            self.history.async_schedule_save()
+
+            # Normals describe every recorded year under the current settings
+            self.climatology.rebuild(self.history.columns)
+            self.climatology.async_schedule_save()
+            _LOGGER.info(
+                f"Recomputed {len(stale)} recorded days with base={base_temp}°C, "
+                f"method={method}: seasonal={self.seasonal_gdd:.1f}"
+            )
+            return len(stale)
+
+    async def async_sweep_base_temperature(
+        self,
+        min_base: float,
+        max_base: float,
+        step: float,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """Return recorded-season GDD for a range of base temperatures and every method."""
+        await self._async_ensure_history()
+        if start is None and self.season_start:
+            start = date.fromisoformat(self.season_start)
+
+        # Never past max_base; the epsilon keeps exact multiples of step despite float error
+        count = int(math.floor((max_base - min_base) / step + 1e-9)) + 1
+        bases = [round(min_base + index * step, 3) for index in range(count)]
+        records = list(self.history.iter_records(start, end))
+
+        result = await self.hass.async_add_executor_job(
+            calculate_gdd_batch,
+            [record["min"] for record in records],
+            [record["max"] for record in records],
+            bases,
+        )
+
+        return {
+            "start_date": records[0]["date"].isoformat() if records else None,
+            "end_date": records[-1]["date"].isoformat() if records else None,
+            "days": len(records),
+            "base_temperatures": bases,
+            "methods": {
+                method: [round(total, 2) for total in result.totals(method)]
+                for method in result.methods
+            },
+        }
+
+    async def async_run_ensemble(
+        self, threshold: float, horizon_days: int = PROJECTION_HORIZON_DAYS
+    ) -> Dict[str, Any]:
+        """Threshold crossing dates (p10/p50/p90) from replaying every recorded year.
+
+        The entry and all zones are replayed in one executor job. Cancelling
+        the call or unloading the entry stops the worker between years.
+        """
+        await self._async_ensure_history()
+        targets = {None: (self.seasonal_gdd, self.base_temp, self.calculation_method)}
+        for zone_id, zone in self.zones.items():
+            targets[zone_id] = (zone.seasonal_gdd, zone.base_temp, zone.calculation_method)
+
+        # The worker gets its own copies so recording a day can't race it
+        columns = {name: array(column.typecode, column) for name, column in self.history.columns.items()}
+        cancel = threading.Event()
+        self._ensemble_cancels.add(cancel)
+        try:
+            results = await self.hass.async_add_executor_job(
+                run_ensemble,
+                dt_util.now().date(),
+                threshold,
+                targets,
+                columns["day"],
+                columns["min"],
+                columns["max"],
+                horizon_days,
+                cancel,
+            )
+        except asyncio.CancelledError:
+            cancel.set()
+            raise
+        finally:
+            self._ensemble_cancels.discard(cancel)
+
+        return {
+            "threshold": threshold,
+            "horizon_days": horizon_days,
+            **results.pop(None),
+            "zones": results,
+        }
+
+    @callback
+    def async_cancel_ensembles(self) -> None:
+        """Stop running ensemble workers."""
+        for cancel in self._ensemble_cancels:
+            cancel.set()
+
+    async def async_query_range(self, start: date, end: Optional[date] = None) -> Dict[str, Any]:
+        """Return recorded GDD between two dates (inclusive) from the history index."""
+        await self._async_ensure_history()
+        if end is None:
+            end = dt_util.now().date()
+        lo, hi = self.history.index_range(start, end)
+        normal = self.climatology.normal_between(start, end)
+        return {
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "gdd": round(self.history.sum_gdd(start, end), 2),
+            "days_recorded": hi - lo,
+            "normal_gdd": round(normal, 2) if normal is not None else None,
+        }
+
+    @property
+    def rolling_min(self) -> Optional[float]:
+        """Lowest temperature over the rolling window."""
+        self.rolling.expire(dt_util.now())
+        return self.rolling.min
+
+    @property
+    def rolling_max(self) -> Optional[float]:
+        """Highest temperature over the rolling window."""
+        self.rolling.expire(dt_util.now())
+        return self.rolling.max
+
+    @property
+    def rolling_window_hours(self) -> float:
+        """Length of the rolling window in hours."""
+        return self.rolling.window.total_seconds() / 3600
+
     @property
     def estimated_daily_gdd(self) -> float:
         """Estimate today's GDD based on current best min/max."""
@@ -422,25 +1412,18 @@ class GDDCoordinator(DataUpdateCoordinator):
         """Current growth rate multiplier."""
         return getattr(self, 'growth_multiplier', 1.0)
 
+    def _maintenance_level(self) -> str:
+        """Return the cached maintenance level."""
+        return self.maintenance_level
+
     @property
     def mowing_recommendation(self) -> str:
         """Get mowing recommendation based on accumulated growth."""
-        # Get maintenance level from helper
-        maintenance_state = self.hass.states.get("input_select.gdd_maintenance_level")
-        maintenance_level = maintenance_state.state if maintenance_state else "medium_maintenance"
-        
-        threshold = MOWING_THRESHOLDS.get(maintenance_level, MOWING_THRESHOLDS["medium_maintenance"])
-        
-        if self.accumulated_growth < threshold * 0.5:
-            return "No mowing needed"
-        elif self.accumulated_growth < threshold * 0.8:
-            return "Mowing soon"
-        elif self.accumulated_growth < threshold:
-            return "Mowing recommended"
-        elif self.accumulated_growth < threshold * 1.5:
-            return "Mowing overdue"
-        else:
-            return "Mowing critical"
+        return self._mowing_recommendation_for(self._maintenance_level())
+
+    def _mowing_recommendation_for(self, maintenance_level: str) -> str:
+        """Get mowing recommendation for a maintenance level."""
+        return turf.mowing_recommendation(self.accumulated_growth, maintenance_level)
 
     @property
     def pgr_recommendation(self) -> str:
@@ -473,27 +1456,21 @@ class GDDCoordinator(DataUpdateCoordinator):
     @property
     def days_to_next_mow(self) -> int:
         """Estimate days until next mowing needed."""
-        if self.growth_multiplier <= 0:
-            return 14  # Default for dormant conditions
-            
-        # Get maintenance threshold
-        maintenance_state = self.hass.states.get("input_select.gdd_maintenance_level")
-        maintenance_level = maintenance_state.state if maintenance_state else "medium_maintenance"
-        threshold = MOWING_THRESHOLDS.get(maintenance_level, MOWING_THRESHOLDS["medium_maintenance"])
-        
-        # Calculate remaining growth needed
-        remaining_growth = max(0, threshold - self.accumulated_growth)
-        
-        # Estimate based on recent growth rate
-        if self.estimated_growth_mm > 0:
-            return max(1, int(remaining_growth / self.estimated_growth_mm))
-        
-        return 7  # Default weekly interval
+        return self._days_to_next_mow_for(self._maintenance_level())
+
+    def _days_to_next_mow_for(self, maintenance_level: str) -> int:
+        """Estimate days until next mowing needed for a maintenance level."""
+        return turf.days_to_next_mow(
+            self.growth_multiplier, self.accumulated_growth, self.estimated_growth_mm, maintenance_level
+        )
 
     @property
     def data_source_info(self) -> dict:
         """Return information about data sources being used."""
-        forecast_min, forecast_max = self._get_forecast_temps()
+        return self._data_source_info_for(*self._get_forecast_temps())
+
+    def _data_source_info_for(self, forecast_min: Optional[float], forecast_max: Optional[float]) -> dict:
+        """Return data source information for already-looked-up forecast temps."""
         return {
             "has_forecast_data": forecast_min is not None and forecast_max is not None,
             "has_tracked_data": self.tracked_daily_min is not None and self.tracked_daily_max is not None,
@@ -0,0 +1,42 @@
+"""Diagnostics support for GDD."""
+from __future__ import annotations
+from typing import Any, Dict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import GDDCoordinator
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+    """Return the entry's configuration, coordinator state and runtime statistics."""
+    coordinator: GDDCoordinator | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    diagnostics: Dict[str, Any] = {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+    }
+    if coordinator is None:
+        return diagnostics
+
+    diagnostics["coordinator"] = {
+        "temperature_source": coordinator.temperature_source,
+        "ingestion_mode": coordinator.ingestion_mode,
+        "base_temp": coordinator.base_temp,
+        "calculation_method": coordinator.calculation_method,
+        "last_update_success": coordinator.last_update_success,
+        "last_calculation_date": coordinator.last_calculation_date,
+        "season_start": coordinator.season_start,
+        "seasonal_gdd": coordinator.seasonal_gdd,
+        "threshold": coordinator.threshold,
+        "zones": list(coordinator.zones),
+        "history_loaded": coordinator.history.loaded,
+        "history_read_only": coordinator.history.read_only,
+        "history_days": len(coordinator.history),
+        "climatology_days": coordinator.climatology.days,
+    }
+    diagnostics["runtime"] = coordinator.stats.as_dict()
+    return diagnostics
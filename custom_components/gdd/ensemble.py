@@ -0,0 +1,105 @@
+"""Analog-year ensemble of threshold crossing dates, run off the event loop."""
+from __future__ import annotations
+import threading
+from bisect import bisect_left
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from .calculations import calculate_gdd_batch
+from .projection import build_normals, day_of_year_index
+
+ENSEMBLE_PERCENTILES = (10, 50, 90)
+
+
+class EnsembleCancelled(Exception):
+    """Raised inside the worker when the ensemble was cancelled."""
+
+
+def _analog_start(today: date, year: int) -> date:
+    """Today's calendar date in an analog year (Feb 29 falls back to Feb 28)."""
+    try:
+        return today.replace(year=year)
+    except ValueError:
+        return today.replace(year=year, day=28)
+
+
+def _percentile_offset(offsets: List[Optional[int]], percent: float) -> Optional[int]:
+    """Nearest-rank percentile; years that never cross sort last and yield None."""
+    ranked = sorted(offsets, key=lambda offset: (offset is None, offset or 0))
+    if not ranked:
+        return None
+    return ranked[min(len(ranked) - 1, int(round((len(ranked) - 1) * percent / 100)))]
+
+
+def run_ensemble(
+    today: date,
+    threshold: float,
+    targets: Dict[Hashable, Tuple[float, float, str]],
+    days: Sequence[int],
+    min_temps: Sequence[float],
+    max_temps: Sequence[float],
+    horizon_days: int,
+    cancel: threading.Event,
+) -> Dict[Hashable, Dict[str, Any]]:
+    """Replay each recorded year's remaining days from today's seasonal GDD.
+
+    ``targets`` maps a key to (seasonal GDD, base temperature, method) and
+    ``days`` are history ordinals with matching temperatures. Days missing
+    from an analog year use that target's day-of-year normal. Checks
+    ``cancel`` between analog years and raises EnsembleCancelled.
+    """
+    settings = list(dict.fromkeys((base, method) for _, base, method in targets.values()))
+    if not days or not settings:
+        return {key: _summary(today, []) for key in targets}
+
+    bases = sorted({base for base, _ in settings})
+    methods = tuple(dict.fromkeys(method for _, method in settings))
+    daily = calculate_gdd_batch(min_temps, max_temps, bases, methods).daily
+    normals = build_normals((date.fromordinal(day) for day in days), min_temps, max_temps, settings)
+    row_of = {day: row for row, day in enumerate(days)}
+
+    # Every year with at least one recorded day in the replay window
+    analogs = []
+    for year in sorted({date.fromordinal(day).year for day in days}):
+        start = _analog_start(today, year).toordinal()
+        if any(start + offset in row_of for offset in range(horizon_days)):
+            analogs.append((year, start))
+
+    results: Dict[Hashable, Dict[str, Any]] = {}
+    for key, (seasonal, base, method) in targets.items():
+        remaining = threshold - seasonal
+        series = daily[method][bases.index(base)]
+        normal = normals.get((base, method))
+        offsets: List[Optional[int]] = []
+        for year, start in analogs:
+            if cancel.is_set():
+                raise EnsembleCancelled
+            if remaining <= 0:
+                offsets.append(0)
+                continue
+            replay = []
+            for offset in range(horizon_days):
+                row = row_of.get(start + offset)
+                if row is not None:
+                    replay.append(series[row])
+                elif normal is not None:
+                    replay.append(normal.mean[day_of_year_index(date.fromordinal(start + offset))])
+                else:
+                    replay.append(0.0)
+            cumulative = list(accumulate(replay))
+            index = bisect_left(cumulative, remaining)
+            offsets.append(index if index < len(cumulative) else None)
+        results[key] = _summary(today, offsets, [year for year, _ in analogs])
+    return results
+
+
+def _summary(today: date, offsets: List[Optional[int]], years: Optional[List[int]] = None) -> Dict[str, Any]:
+    """Percentile crossing dates for one target."""
+    summary: Dict[str, Any] = {}
+    for percent in ENSEMBLE_PERCENTILES:
+        offset = _percentile_offset(offsets, percent)
+        summary[f"p{percent}"] = (today + timedelta(days=offset)).isoformat() if offset is not None else None
+    summary["analog_years"] = years or []
+    summary["years_reaching"] = sum(1 for offset in offsets if offset is not None)
+    return summary
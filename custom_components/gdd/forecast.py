@@ -0,0 +1,88 @@
+"""Shared, cached access to weather forecasts via weather.get_forecasts."""
+from __future__ import annotations
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DATA_FORECAST_PROVIDER, FORECAST_CACHE_MINUTES
+
+_LOGGER = logging.getLogger(__name__)
+
+FORECAST_DAILY = "daily"
+FORECAST_HOURLY = "hourly"
+
+
+@dataclass(frozen=True)
+class ForecastResult:
+    """One fetched forecast; a new object per fetch so consumers can cache by identity."""
+
+    entity_id: str
+    forecast_type: str
+    fetched_at: float
+    forecast: Optional[List[Dict[str, Any]]]
+
+
+class ForecastProvider:
+    """Fetch forecasts with a TTL cache shared by every coordinator.
+
+    Concurrent requests for the same entity and type share one in-flight
+    service call, so N entries on one weather entity cost one call per TTL.
+    """
+
+    def __init__(self, hass: HomeAssistant, ttl: timedelta):
+        self.hass = hass
+        self.ttl = ttl.total_seconds()
+        self._cache: Dict[Tuple[str, str], ForecastResult] = {}
+        self._pending: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    async def async_get_forecast(self, entity_id: str, forecast_type: str) -> ForecastResult:
+        """Return a cached forecast, fetching it if missing or expired."""
+        key = (entity_id, forecast_type)
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached.fetched_at < self.ttl:
+            return cached
+
+        task = self._pending.get(key)
+        if task is None:
+            task = self.hass.async_create_task(self._async_fetch(entity_id, forecast_type))
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        # Shield so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _async_fetch(self, entity_id: str, forecast_type: str) -> ForecastResult:
+        """Call weather.get_forecasts for one entity and type."""
+        forecast = None
+        try:
+            response = await self.hass.services.async_call(
+                "weather",
+                "get_forecasts",
+                {"entity_id": entity_id, "type": forecast_type},
+                blocking=True,
+                return_response=True,
+            )
+            forecast = (response or {}).get(entity_id, {}).get("forecast")
+        except HomeAssistantError as err:
+            # Entities only support some forecast types
+            _LOGGER.debug(f"No {forecast_type} forecast from {entity_id}: {err}")
+        except Exception as err:
+            _LOGGER.debug(f"Error fetching {forecast_type} forecast from {entity_id}: {err}")
+
+        result = ForecastResult(entity_id, forecast_type, time.monotonic(), forecast)
+        self._cache[(entity_id, forecast_type)] = result
+        return result
+
+
+def async_get_forecast_provider(hass: HomeAssistant) -> ForecastProvider:
+    """Return the forecast provider shared by all GDD entries."""
+    provider = hass.data.get(DATA_FORECAST_PROVIDER)
+    if provider is None:
+        provider = ForecastProvider(hass, timedelta(minutes=FORECAST_CACHE_MINUTES))
+        hass.data[DATA_FORECAST_PROVIDER] = provider
+    return provider
@@ -0,0 +1,309 @@
+"""Compact per-entry store of finished days backed by typed arrays."""
+from __future__ import annotations
+import base64
+import logging
+import time
+import sys
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import HISTORY_STORAGE_KEY, HISTORY_STORAGE_VERSION, SAVE_DELAY_SECONDS
+from .calculations import ALL_METHODS
+from .runtime_stats import RuntimeStats
+
+_LOGGER = logging.getLogger(__name__)
+
+# Column name -> array typecode. Temperatures and GDD fit comfortably in float32.
+COLUMNS = {
+    "day": "l",     # date.toordinal()
+    "min": "f",
+    "max": "f",
+    "gdd": "f",
+    "base": "f",
+    "method": "B",  # index into ALL_METHODS
+}
+
+METHOD_CODES = {method: code for code, method in enumerate(ALL_METHODS)}
+
+
+def _encode(column: array) -> str:
+    """Encode an array column as base64 of little-endian, zlib-compressed bytes."""
+    if sys.byteorder != "little":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return base64.b64encode(zlib.compress(column.tobytes(), 6)).decode("ascii")
+
+
+def _decode(typecode: str, payload: str) -> array:
+    """Decode a column produced by _encode."""
+    column = array(typecode)
+    column.frombytes(zlib.decompress(base64.b64decode(payload)))
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column
+
+
+class GDDHistory:
+    """Columnar history of finished days, sorted by date.
+
+    Records are kept in parallel ``array`` columns so that many seasons cost a
+    few bytes per day. The backing store is only read when the history is first
+    needed, not at integration startup.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self.hass = hass
+        self.store = Store(hass, HISTORY_STORAGE_VERSION, f"{HISTORY_STORAGE_KEY}.{entry_id}")
+        self.columns: Dict[str, array] = {name: array(code) for name, code in COLUMNS.items()}
+        self.revision = 0  # Bumped on every change so derived caches can invalidate
+        self.loaded = False
+        self.read_only = False  # Set when the stored history could not be read
+        self._saved_revision = 0
+        self.stats: Optional[RuntimeStats] = None  # Set by the coordinator
+
+        # Dense cumulative-sum index: _prefix[k] is the GDD of all days before
+        # _prefix_first + k, so any date range is answered with two lookups.
+        self._prefix = array("d", [0.0])
+        self._prefix_first: Optional[int] = None
+        self._prefix_dirty: Optional[int] = 0  # First stale offset, None when current
+
+    def __len__(self) -> int:
+        return len(self.columns["day"])
+
+    @property
+    def first_day(self) -> Optional[date]:
+        """Return the earliest recorded day."""
+        days = self.columns["day"]
+        return date.fromordinal(days[0]) if days else None
+
+    @property
+    def last_day(self) -> Optional[date]:
+        """Return the latest recorded day."""
+        days = self.columns["day"]
+        return date.fromordinal(days[-1]) if days else None
+
+    async def async_ensure_loaded(self) -> None:
+        """Load stored history on first use."""
+        if self.loaded:
+            return
+        try:
+            data = await self.store.async_load()
+            if data and not self.loaded:
+                self._restore(data)
+                self._saved_revision = self.revision
+                _LOGGER.debug(f"Loaded {len(self)} days of GDD history")
+        except Exception as err:
+            # Saving now would replace the unreadable file with a near-empty history
+            self.read_only = True
+            _LOGGER.error(f"Error loading GDD history, changes will not be saved: {err}")
+        self.loaded = True
+
+    async def async_save(self) -> None:
+        """Persist the history in its compact encoding."""
+        if self.read_only:
+            return
+        try:
+            data = self._data_to_save()
+            start = time.perf_counter()
+            await self.store.async_save(data)
+            if self.stats is not None:
+                self.stats.record_store_write("history", time.perf_counter() - start)
+        except Exception as err:
+            _LOGGER.error(f"Error saving GDD history: {err}")
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed write if the history changed since the last one."""
+        if self.revision != self._saved_revision and not self.read_only:
+            self.store.async_delay_save(self._data_to_save, SAVE_DELAY_SECONDS)
+
+    async def async_flush(self) -> None:
+        """Write pending changes now."""
+        if self.revision != self._saved_revision:
+            await self.async_save()
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data for a write and remember the saved revision."""
+        start = time.perf_counter()
+        self._saved_revision = self.revision
+        data = self._as_dict()
+        if self.stats is not None:
+            self.stats.record_store_build("history", time.perf_counter() - start)
+        return data
+
+    async def async_remove(self) -> None:
+        """Remove the backing store."""
+        await self.store.async_remove()
+
+    def _as_dict(self) -> Dict[str, Any]:
+        """Serialize columns for storage."""
+        return {
+            "count": len(self),
+            "methods": list(ALL_METHODS),
+            "columns": {name: _encode(column) for name, column in self.columns.items()},
+        }
+
+    def _restore(self, data: Dict[str, Any]) -> None:
+        """Rebuild columns from stored data."""
+        stored = data.get("columns", {})
+        count = data.get("count", 0)
+        columns = {}
+        for name, typecode in COLUMNS.items():
+            column = _decode(typecode, stored[name]) if name in stored else array(typecode)
+            if len(column) != count:
+                raise ValueError(f"History column {name} has {len(column)} rows, expected {count}")
+            columns[name] = column
+
+        # Remap method codes if the method list ever changes order
+        stored_methods = data.get("methods", list(ALL_METHODS))
+        if list(stored_methods) != list(ALL_METHODS):
+            columns["method"] = array("B", (
+                METHOD_CODES.get(stored_methods[code], 0) for code in columns["method"]
+            ))
+
+        self.columns = columns
+        self.revision += 1
+        self._invalidate_prefix(None)
+
+    def record(
+        self,
+        day: date,
+        min_temp: float,
+        max_temp: float,
+        gdd: float,
+        base_temp: float,
+        method: str,
+    ) -> Optional[float]:
+        """Insert or replace one day's record.
+
+        Returns the previously recorded GDD for that day, if any.
+        """
+        ordinal = day.toordinal()
+        days = self.columns["day"]
+        values = {
+            "day": ordinal,
+            "min": min_temp,
+            "max": max_temp,
+            "gdd": gdd,
+            "base": base_temp,
+            "method": METHOD_CODES.get(method, 0),
+        }
+
+        previous = None
+        if days and ordinal > days[-1]:
+            for name, column in self.columns.items():
+                column.append(values[name])
+        else:
+            index = bisect_left(days, ordinal)
+            if index < len(days) and days[index] == ordinal:
+                previous = float(self.columns["gdd"][index])
+                for name, column in self.columns.items():
+                    column[index] = values[name]
+            else:
+                for name, column in self.columns.items():
+                    column.insert(index, values[name])
+
+        self.revision += 1
+        self._invalidate_prefix(ordinal)
+        return previous
+
+    def index_range(self, start: Optional[date] = None, end: Optional[date] = None) -> Tuple[int, int]:
+        """Return the [lo, hi) row range covering start..end inclusive."""
+        days = self.columns["day"]
+        lo = bisect_left(days, start.toordinal()) if start else 0
+        hi = bisect_right(days, end.toordinal()) if end else len(days)
+        return lo, max(lo, hi)
+
+    def get(self, day: date) -> Optional[Dict[str, Any]]:
+        """Return one day's record."""
+        lo, hi = self.index_range(day, day)
+        if lo == hi:
+            return None
+        return self._row(lo)
+
+    def iter_records(self, start: Optional[date] = None, end: Optional[date] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over records between start and end inclusive."""
+        lo, hi = self.index_range(start, end)
+        for index in range(lo, hi):
+            yield self._row(index)
+
+    def _row(self, index: int) -> Dict[str, Any]:
+        """Return one row as a dictionary."""
+        columns = self.columns
+        return {
+            "date": date.fromordinal(columns["day"][index]),
+            "min": columns["min"][index],
+            "max": columns["max"][index],
+            "gdd": columns["gdd"][index],
+            "base": columns["base"][index],
+            "method": ALL_METHODS[columns["method"][index]],
+        }
+
+    def clear(self) -> None:
+        """Drop all records."""
+        self.columns = {name: array(code) for name, code in COLUMNS.items()}
+        self.revision += 1
+        self._invalidate_prefix(None)
+
+    def _invalidate_prefix(self, ordinal: Optional[int]) -> None:
+        """Mark the prefix index stale from ordinal onward (None for everything)."""
+        if ordinal is None or self._prefix_first is None or ordinal < self._prefix_first:
+            self._prefix_first = None
+            self._prefix_dirty = 0
+            return
+        offset = ordinal - self._prefix_first
+        if self._prefix_dirty is None or offset < self._prefix_dirty:
+            self._prefix_dirty = offset
+
+    def _ensure_prefix(self) -> None:
+        """Bring the prefix index up to date, rebuilding only the stale tail."""
+        if self._prefix_dirty is None:
+            return
+
+        days = self.columns["day"]
+        gdd = self.columns["gdd"]
+        if not days:
+            self._prefix = array("d", [0.0])
+            self._prefix_first = None
+            self._prefix_dirty = None
+            return
+
+        first = days[0]
+        if self._prefix_first != first:
+            self._prefix_first = first
+            self._prefix_dirty = 0
+
+        offset = min(self._prefix_dirty, len(self._prefix) - 1)
+        prefix = self._prefix[:offset + 1]
+        total = prefix[offset]
+        index = bisect_left(days, first + offset)
+        append = prefix.append
+        for ordinal in range(first + offset, days[-1] + 1):
+            if index < len(days) and days[index] == ordinal:
+                total += gdd[index]
+                index += 1
+            append(total)
+
+        self._prefix = prefix
+        self._prefix_dirty = None
+
+    def sum_gdd(self, start: Optional[date] = None, end: Optional[date] = None) -> float:
+        """Return recorded GDD between start and end inclusive in O(1)."""
+        self._ensure_prefix()
+        if self._prefix_first is None:
+            return 0.0
+
+        last = len(self._prefix) - 1
+        lo = 0 if start is None else start.toordinal() - self._prefix_first
+        hi = last if end is None else end.toordinal() - self._prefix_first + 1
+        lo = min(max(lo, 0), last)
+        hi = min(max(hi, 0), last)
+        if hi <= lo:
+            return 0.0
+        return self._prefix[hi] - self._prefix[lo]
@@ -0,0 +1,117 @@
+"""Daily GDD and hourly temperatures imported into recorder long-term statistics."""
+from __future__ import annotations
+from datetime import date, datetime
+from typing import List, Optional, Sequence
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN, MAX_PENDING_HOURLY_STATISTICS, STATISTICS_IMPORT_BATCH
+
+
+def statistic_id(kind: str, entry_id: str) -> str:
+    """External statistic id for one entry, e.g. gdd:daily_gdd_<entry>."""
+    return f"{DOMAIN}:{kind}_{slugify(entry_id)}"
+
+
+def _hour_start(when: datetime) -> datetime:
+    """Start of the UTC hour; statistics rows must be aligned to whole hours."""
+    return dt_util.as_utc(when).replace(minute=0, second=0, microsecond=0)
+
+
+def daily_gdd_rows(days: Sequence[int], gdds: Sequence[float], sum_before: float) -> List[StatisticData]:
+    """One row per finished day (date ordinals) with its GDD and the running total."""
+    rows: List[StatisticData] = []
+    total = sum_before
+    for ordinal, gdd in zip(days, gdds):
+        total += gdd
+        rows.append(StatisticData(
+            start=_hour_start(dt_util.start_of_local_day(date.fromordinal(ordinal))),
+            state=round(gdd, 3),
+            sum=round(total, 3),
+        ))
+    return rows
+
+
+@callback
+def async_import_daily_gdd(
+    hass: HomeAssistant, entry_id: str, days: Sequence[int], gdds: Sequence[float], sum_before: float
+) -> None:
+    """Queue daily GDD rows for the recorder in batches of STATISTICS_IMPORT_BATCH."""
+    metadata = StatisticMetaData(
+        has_mean=False,
+        has_sum=True,
+        name="Daily GDD",
+        source=DOMAIN,
+        statistic_id=statistic_id("daily_gdd", entry_id),
+        unit_of_measurement="°C·day",
+    )
+    for offset in range(0, len(days), STATISTICS_IMPORT_BATCH):
+        rows = daily_gdd_rows(
+            days[offset:offset + STATISTICS_IMPORT_BATCH],
+            gdds[offset:offset + STATISTICS_IMPORT_BATCH],
+            sum_before,
+        )
+        sum_before = rows[-1]["sum"]
+        async_add_external_statistics(hass, metadata, rows)
+
+
+@callback
+def async_import_hourly_temperatures(hass: HomeAssistant, entry_id: str, rows: List[StatisticData]) -> None:
+    """Queue hourly mean/min/max temperature rows for the recorder."""
+    metadata = StatisticMetaData(
+        has_mean=True,
+        has_sum=False,
+        name="GDD Temperature",
+        source=DOMAIN,
+        statistic_id=statistic_id("temperature", entry_id),
+        unit_of_measurement=UnitOfTemperature.CELSIUS,
+    )
+    async_add_external_statistics(hass, metadata, rows)
+
+
+class HourlyTemperatures:
+    """Mean, min and max of the readings in each clock hour, waiting to be imported."""
+
+    def __init__(self):
+        self.finished: List[StatisticData] = []
+        self._hour: Optional[datetime] = None
+        self._count = 0
+        self._total = 0.0
+        self._min = 0.0
+        self._max = 0.0
+
+    def add(self, when: datetime, temp: float) -> None:
+        """Fold one reading into its hour, closing the previous hour when it changes."""
+        hour = _hour_start(when)
+        if hour != self._hour:
+            self._close()
+            self._hour = hour
+        if self._count:
+            self._min = min(self._min, temp)
+            self._max = max(self._max, temp)
+        else:
+            self._min = self._max = temp
+        self._count += 1
+        self._total += temp
+
+    def _close(self) -> None:
+        if self._count:
+            self.finished.append(StatisticData(
+                start=self._hour,
+                mean=round(self._total / self._count, 2),
+                min=self._min,
+                max=self._max,
+            ))
+            # Without a recorder nothing drains the list, so keep it bounded
+            del self.finished[:-MAX_PENDING_HOURLY_STATISTICS]
+        self._count = 0
+        self._total = 0.0
+
+    def pop_finished(self) -> List[StatisticData]:
+        """Return and forget the finished hours."""
+        rows, self.finished = self.finished, []
+        return rows
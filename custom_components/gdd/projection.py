@@ -0,0 +1,180 @@
+"""Project the date the seasonal GDD reaches a threshold."""
+from __future__ import annotations
+from array import array
+from bisect import bisect_left
+from calendar import isleap
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .calculations import calculate_gdd_batch
+
+DAYS_IN_CYCLE = 366  # Day-of-year slots, Feb 29 included
+LEAP_DAY_SLOT = 59  # Feb 29, only a real day in leap years
+
+
+def day_of_year_index(day: date) -> int:
+    """Slot of a date in a leap-year calendar, so a date maps to the same slot every year."""
+    return date(2000, day.month, day.day).timetuple().tm_yday - 1
+
+
+def _fill_gaps(values: Sequence[Optional[float]]) -> Optional[List[float]]:
+    """Fill missing slots by linear interpolation around the year; None if all are missing."""
+    known = [index for index, value in enumerate(values) if value is not None]
+    if not known:
+        return None
+
+    size = len(values)
+    filled = list(values)
+    for position, start in enumerate(known):
+        end = known[(position + 1) % len(known)]
+        span = (end - start) % size or size
+        for step in range(1, span):
+            filled[(start + step) % size] = values[start] + (values[end] - values[start]) * step / span
+    return filled
+
+
+@dataclass(frozen=True)
+class DailyNormals:
+    """Normal daily GDD per day of year with a two-cycle cumulative sum.
+
+    ``prefix[k]`` is the normal GDD from slot 0 up to (not including) slot k,
+    continuing into a second year, so any run of up to a year starting at
+    any slot is answered with one bisect. Runs are given by their start date
+    so the Feb 29 slot can be left out in years that don't have one.
+    """
+
+    mean: array
+    prefix: array
+
+    @classmethod
+    def from_means(cls, means: Sequence[Optional[float]]) -> Optional["DailyNormals"]:
+        """Build normals from per-slot means; slots without data are interpolated."""
+        filled = _fill_gaps(means)
+        if filled is None:
+            return None
+        mean = array("d", (max(value, 0.0) for value in filled))
+        prefix = array("d", accumulate(mean * 2, initial=0.0))
+        return cls(mean=mean, prefix=prefix)
+
+    @staticmethod
+    def _skipped_leap_slots(start: date, slots: int) -> List[int]:
+        """Offsets from start, below slots, of Feb 29 slots that fall in non-leap years."""
+        start_slot = day_of_year_index(start)
+        year = start.year if start_slot <= LEAP_DAY_SLOT else start.year + 1
+        offset = (LEAP_DAY_SLOT - start_slot) % DAYS_IN_CYCLE
+        skipped = []
+        while offset < slots:
+            if not isleap(year):
+                skipped.append(offset)
+            offset += DAYS_IN_CYCLE
+            year += 1
+        return skipped
+
+    def sum_days(self, start: date, days: int) -> float:
+        """Normal GDD over days consecutive calendar days starting at start."""
+        total = 0.0
+        days = max(days, 0)
+        while days:
+            run = min(days, DAYS_IN_CYCLE - 1)  # Fits in the two cycles with a skipped leap day
+            start_slot = day_of_year_index(start)
+            skipped = len(self._skipped_leap_slots(start, run + 1))
+            total += (
+                self.prefix[start_slot + run + skipped] - self.prefix[start_slot]
+                - skipped * self.mean[LEAP_DAY_SLOT]
+            )
+            start += timedelta(days=run)
+            days -= run
+        return total
+
+    def days_to_accumulate(self, start: date, amount: float, max_days: int) -> Optional[int]:
+        """Number of calendar days from start (inclusive) until normals add up to amount.
+
+        Feb 29 slots of non-leap years add nothing and take no day, so the slots
+        between them are searched one run at a time with the skipped GDD added
+        to the target.
+        """
+        if amount <= 0:
+            return 0
+        max_days = min(max_days, DAYS_IN_CYCLE)
+        start_slot = day_of_year_index(start)
+        base = self.prefix[start_slot] + amount
+        last = len(self.prefix) - 1 - start_slot
+        lo = 1
+        skipped = self._skipped_leap_slots(start, max_days + 2)
+        for count, offset in enumerate(skipped + [None]):
+            # Slot counts in this run, with count skipped slots before it
+            hi = min(max_days + count, last if offset is None else offset)
+            if lo <= hi:
+                target = base + count * self.mean[LEAP_DAY_SLOT]
+                index = bisect_left(self.prefix, target, start_slot + lo, start_slot + hi + 1)
+                if index <= start_slot + hi:
+                    return index - start_slot - count
+            if offset is not None:
+                lo = offset + 2
+        return None
+
+
+def build_normals(
+    days: Iterable[date],
+    min_temps: Sequence[float],
+    max_temps: Sequence[float],
+    settings: Iterable[Tuple[float, str]],
+) -> Dict[Tuple[float, str], DailyNormals]:
+    """Compute normals for several (base temperature, method) pairs in one batch."""
+    settings = list(dict.fromkeys(settings))
+    slots = [day_of_year_index(day) for day in days]
+    if not slots or not settings:
+        return {}
+
+    bases = sorted({base for base, _ in settings})
+    methods = tuple(dict.fromkeys(method for _, method in settings))
+    result = calculate_gdd_batch(min_temps, max_temps, bases, methods)
+    base_index = {base: index for index, base in enumerate(bases)}
+
+    normals: Dict[Tuple[float, str], DailyNormals] = {}
+    for base, method in settings:
+        totals = [0.0] * DAYS_IN_CYCLE
+        counts = [0] * DAYS_IN_CYCLE
+        for slot, value in zip(slots, result.daily[method][base_index[base]]):
+            totals[slot] += value
+            counts[slot] += 1
+        built = DailyNormals.from_means([
+            total / count if count else None for total, count in zip(totals, counts)
+        ])
+        if built is not None:
+            normals[(base, method)] = built
+    return normals
+
+
+def project_threshold_date(
+    today: date,
+    remaining: float,
+    near_term: Sequence[float],
+    normals: Optional[DailyNormals],
+    horizon_days: int,
+) -> Optional[date]:
+    """Date the remaining GDD is reached, or None if not within the horizon.
+
+    ``near_term`` holds expected GDD for today and the following forecast days;
+    later days use the normals.
+    """
+    if remaining <= 0:
+        return today
+
+    cumulative = list(accumulate(near_term))
+    index = bisect_left(cumulative, remaining)
+    if index < len(cumulative):
+        return today + timedelta(days=index)
+
+    covered = len(cumulative)
+    if normals is None or covered >= horizon_days:
+        return None
+
+    start = today + timedelta(days=covered)
+    left = remaining - (cumulative[-1] if cumulative else 0.0)
+    days = normals.days_to_accumulate(start, left, horizon_days - covered)
+    if days is None:
+        return None
+    return start + timedelta(days=days - 1)
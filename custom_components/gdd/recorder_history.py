@@ -0,0 +1,132 @@
+"""Daily min/max temperatures rebuilt from the recorder's stored states."""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from statistics import median
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+
+from .const import RECORDER_CHUNK_DAYS, BACKFILL_IDLE, BACKFILL_SPARSE_READINGS, BACKFILL_SPARSE_DAYS_LISTED
+
+DailyTemperatures = Dict[date, Tuple[float, float]]
+DailyReadings = Dict[date, int]
+
+
+@dataclass(slots=True)
+class BackfillProgress:
+    """State of the running or last backfill, shown by the backfill sensor."""
+
+    status: str = BACKFILL_IDLE
+    entity_id: Optional[str] = None
+    start: Optional[date] = None
+    end: Optional[date] = None
+    days_total: int = 0
+    days_read: int = 0  # Calendar days queried so far
+    days_applied: int = 0  # Days that had temperatures and were applied
+    readings: DailyReadings = field(default_factory=dict)  # Readings behind each applied day, summarized
+    error: Optional[str] = None
+
+    @property
+    def percent(self) -> Optional[float]:
+        """Share of the range read so far."""
+        if not self.days_total:
+            return None
+        return round(100 * self.days_read / self.days_total, 1)
+
+    def readings_summary(self) -> Dict[str, Any]:
+        """Aggregate reading counts, naming only the sparsest days so the attributes stay small."""
+        counts = self.readings.values()
+        sparse = sorted(
+            (count, day) for day, count in self.readings.items() if count < BACKFILL_SPARSE_READINGS
+        )
+        return {
+            "days_with_readings": len(self.readings),
+            "sparse_days": len(sparse),
+            "min_readings_per_day": min(counts) if counts else None,
+            "median_readings_per_day": median(counts) if counts else None,
+            "sparsest_days": sorted(day.isoformat() for _, day in sparse[:BACKFILL_SPARSE_DAYS_LISTED]),
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Attributes for the backfill sensor."""
+        return {
+            "status": self.status,
+            "entity_id": self.entity_id,
+            "start_date": self.start.isoformat() if self.start else None,
+            "end_date": self.end.isoformat() if self.end else None,
+            "days_total": self.days_total,
+            "days_read": self.days_read,
+            "days_applied": self.days_applied,
+            **self.readings_summary(),
+            "error": self.error,
+        }
+
+
+def recorder_available(hass: HomeAssistant) -> bool:
+    """Return True when the recorder is set up."""
+    return "recorder" in hass.config.components
+
+
+def _daily_min_max(
+    hass: HomeAssistant,
+    entity_id: str,
+    start: date,
+    end: date,
+    extract: Callable[[State], Optional[float]],
+) -> Tuple[DailyTemperatures, DailyReadings]:
+    """Read one chunk of states and reduce it to per-day extremes and reading counts.
+
+    Runs on the recorder's executor so only the reduced days reach the event loop.
+    """
+    start_time = dt_util.start_of_local_day(start)
+    end_time = dt_util.start_of_local_day(end)
+    # Every recorded row, not only state changes: a weather entity's temperature
+    # lives in an attribute, so most of its updates leave the state unchanged
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        [entity_id],
+        include_start_time_state=True,
+        significant_changes_only=False,
+        no_attributes=not entity_id.startswith("weather."),
+    ).get(entity_id, [])
+
+    days: DailyTemperatures = {}
+    readings: DailyReadings = {}
+    for state in states:
+        temp = extract(state)
+        if temp is None:
+            continue
+        # The start time state may carry an earlier timestamp
+        day = dt_util.as_local(max(state.last_updated, start_time)).date()
+        low, high = days.get(day, (temp, temp))
+        days[day] = (min(low, temp), max(high, temp))
+        readings[day] = readings.get(day, 0) + 1
+    return days, readings
+
+
+async def async_iter_daily_temperatures(
+    hass: HomeAssistant,
+    entity_id: str,
+    start: date,
+    end: date,
+    extract: Callable[[State], Optional[float]],
+    chunk_days: int = RECORDER_CHUNK_DAYS,
+) -> AsyncIterator[Tuple[DailyTemperatures, DailyReadings]]:
+    """Yield ({day: (min, max)}, {day: readings}) for the local days in [start, end), one chunk at a time.
+
+    Days without any readable state are left out. Few readings on a day mean its
+    extremes are likely missed.
+    """
+    instance = get_instance(hass)
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + timedelta(days=chunk_days), end)
+        yield await instance.async_add_executor_job(
+            _daily_min_max, hass, entity_id, chunk_start, chunk_end, extract
+        )
+        chunk_start = chunk_end
@@ -0,0 +1,131 @@
+"""Runtime instrumentation for a GDD coordinator, exposed through diagnostics."""
+from __future__ import annotations
+from bisect import bisect_left
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence
+
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations; recording is O(log buckets)."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # Last bucket is the overflow
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms: Optional[float] = None
+
+    def record(self, seconds: float) -> None:
+        """Add one duration."""
+        ms = seconds * 1000
+        self.counts[bisect_left(self.buckets, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.last_ms = ms
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Summary and bucket counts."""
+        buckets = {f"<={bound}ms": count for bound, count in zip(self.buckets, self.counts)}
+        buckets[f">{self.buckets[-1]}ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "max_ms": round(self.max_ms, 3),
+            "last_ms": round(self.last_ms, 3) if self.last_ms is not None else None,
+            "buckets": buckets,
+        }
+
+
+class StoreWriteCounter:
+    """Writes to one store, timed the same way whichever path they take.
+
+    ``build`` covers producing the data of every write, delayed or immediate.
+    Delayed writes are encoded and written by the Store later, so only
+    immediate writes, awaited in place, also report ``write`` time.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.build_total_ms = 0.0
+        self.build_last_ms: Optional[float] = None
+        self.immediate_count = 0
+        self.write_total_ms = 0.0
+        self.write_last_ms: Optional[float] = None
+
+    def record_build(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self.count += 1
+        self.build_total_ms += ms
+        self.build_last_ms = ms
+
+    def record_write(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self.immediate_count += 1
+        self.write_total_ms += ms
+        self.write_last_ms = ms
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "build_total_ms": round(self.build_total_ms, 3),
+            "build_last_ms": round(self.build_last_ms, 3) if self.build_last_ms is not None else None,
+            "immediate_count": self.immediate_count,
+            "write_total_ms": round(self.write_total_ms, 3),
+            "write_last_ms": round(self.write_last_ms, 3) if self.write_last_ms is not None else None,
+        }
+
+
+class RuntimeStats:
+    """Counters and timings collected by one coordinator and its sensors."""
+
+    def __init__(self):
+        self.update_latency = LatencyHistogram()
+        self.forecast_parse = LatencyHistogram()
+        self.store_writes: Dict[str, StoreWriteCounter] = {}
+        self.entities: Dict[str, Any] = {}  # unique_id -> sensor entity
+        self.last_rollover: Optional[datetime] = None
+        self.last_rollover_day: Optional[str] = None
+        self.last_rollover_ms: Optional[float] = None
+
+    def _store_counter(self, store: str) -> StoreWriteCounter:
+        counter = self.store_writes.get(store)
+        if counter is None:
+            counter = self.store_writes[store] = StoreWriteCounter()
+        return counter
+
+    def record_store_build(self, store: str, seconds: float) -> None:
+        """Count one write to a store and the time spent building its data."""
+        self._store_counter(store).record_build(seconds)
+
+    def record_store_write(self, store: str, seconds: float) -> None:
+        """Record the time an immediate write spent encoding and writing."""
+        self._store_counter(store).record_write(seconds)
+
+    def record_rollover(self, when: datetime, day: Optional[str], seconds: float) -> None:
+        """Remember the last daily rollover."""
+        self.last_rollover = when
+        self.last_rollover_day = day
+        self.last_rollover_ms = round(seconds * 1000, 3)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Everything collected so far, JSON serializable."""
+        return {
+            "update_latency": self.update_latency.as_dict(),
+            "forecast_parse": self.forecast_parse.as_dict(),
+            "store_writes": {name: counter.as_dict() for name, counter in self.store_writes.items()},
+            "state_writes": {
+                unique_id: {
+                    "entity_id": entity.entity_id,
+                    "state_writes": entity.state_writes,
+                    "suppressed_writes": entity.suppressed_writes,
+                }
+                for unique_id, entity in self.entities.items()
+            },
+            "last_rollover": self.last_rollover.isoformat() if self.last_rollover else None,
+            "last_rollover_day": self.last_rollover_day,
+            "last_rollover_ms": self.last_rollover_ms,
+        }
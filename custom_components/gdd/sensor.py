@@ -1,16 +1,23 @@
 """GDD sensor entities with proper state management."""
 from __future__ import annotations
-from typing import Optional
-
-from homeassistant.components.sensor import SensorEntity, SensorStateClass, SensorDeviceClass
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from homeassistant.components.sensor import (
+    RestoreSensor,
+    SensorDeviceClass,
+    SensorExtraStoredData,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.const import UnitOfTemperature
 
 from .const import DOMAIN
 from .coordinator import GDDCoordinator
+from .snapshot import GDDSnapshot
+from .zones import ZoneSnapshot
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
@@ -21,10 +28,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         GDDCurrentTempSensor(coordinator, entry),
         GDDDailyMinSensor(coordinator, entry),
         GDDDailyMaxSensor(coordinator, entry),
+        GDDRollingMinSensor(coordinator, entry),
+        GDDRollingMaxSensor(coordinator, entry),
         GDDEstimatedDailySensor(coordinator, entry),
         GDDDailySensor(coordinator, entry),
         GDDWeeklySensor(coordinator, entry),
         GDDSeasonalSensor(coordinator, entry),
+        GDDDepartureSensor(coordinator, entry),
         GDDProgressSensor(coordinator, entry, hass),
         GDDStatusSensor(coordinator, entry, hass),
         GDDDataSourceSensor(coordinator, entry),
@@ -33,13 +43,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         GDDPGRRecommendationSensor(coordinator, entry),
         GDDGrowthForecastSensor(coordinator, entry),
         GDDAccumulatedGrowthSensor(coordinator, entry),
+        GDDUpdateLatencySensor(coordinator, entry),
+        GDDBackfillSensor(coordinator, entry),
     ]
 
+    for zone_id in coordinator.zones:
+        sensors.extend([
+            GDDZoneDailySensor(coordinator, entry, zone_id),
+            GDDZoneWeeklySensor(coordinator, entry, zone_id),
+            GDDZoneSeasonalSensor(coordinator, entry, zone_id),
+            GDDZoneMowingSensor(coordinator, entry, zone_id),
+        ])
+
     async_add_entities(sensors)
 
 
-class GDDBaseSensor(SensorEntity, RestoreEntity):
-    """Base class for GDD sensors."""
+@dataclass
+class GDDSensorExtraStoredData(SensorExtraStoredData):
+    """Sensor value and attributes kept across restarts."""
+
+    attributes: Optional[Dict[str, Any]] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a dict representation of the sensor data."""
+        return {**super().as_dict(), "attributes": self.attributes}
+
+    @classmethod
+    def from_dict(cls, restored: Dict[str, Any]) -> Optional[GDDSensorExtraStoredData]:
+        """Initialize stored sensor data from a dict."""
+        data = SensorExtraStoredData.from_dict(restored)
+        if data is None:
+            return None
+        return cls(data.native_value, data.native_unit_of_measurement, restored.get("attributes"))
+
+
+class GDDBaseSensor(RestoreSensor):
+    """Base class for GDD sensors.
+
+    Subclasses compute their value and attributes in _live_value and
+    _live_attributes; until the first coordinator update the restored ones
+    are shown instead.
+    """
 
     _attr_has_entity_name = True
     _attr_should_poll = False
@@ -47,6 +91,10 @@ class GDDBaseSensor(SensorEntity, RestoreEntity):
     def __init__(self, coordinator: GDDCoordinator, entry: ConfigEntry):
         self.coordinator = coordinator
         self._entry = entry
+        self._last_rendered: Optional[tuple] = None
+        self._restored_data: Optional[GDDSensorExtraStoredData] = None  # Shown until the first coordinator update
+        self.state_writes = 0  # Writes caused by coordinator updates
+        self.suppressed_writes = 0  # Updates skipped because nothing changed
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
             manufacturer="Custom",
@@ -65,13 +113,93 @@ class GDDBaseSensor(SensorEntity, RestoreEntity):
         """Handle entity added to hass."""
         await super().async_added_to_hass()
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
         )
+        # Report this entity's write counters in diagnostics
+        self.coordinator.stats.entities[self.unique_id] = self
+        self.async_on_remove(lambda: self.coordinator.stats.entities.pop(self.unique_id, None))
+
+        # Without a persisted snapshot, keep the last value until live values arrive
+        if not self.coordinator.snapshot_restored and self.coordinator.data is None:
+            last_data = await self.async_get_last_sensor_data()
+            if last_data is not None and last_data.native_value is not None:
+                self._restored_data = last_data
+
+    async def async_get_last_sensor_data(self) -> Optional[GDDSensorExtraStoredData]:
+        """Restore the value and attributes saved before the last shutdown."""
+        if (restored := await self.async_get_last_extra_data()) is None:
+            return None
+        return GDDSensorExtraStoredData.from_dict(restored.as_dict())
+
+    @property
+    def extra_restore_state_data(self) -> GDDSensorExtraStoredData:
+        """Return the value and attributes to restore on the next start."""
+        attributes = self.extra_state_attributes
+        return GDDSensorExtraStoredData(
+            self.native_value,
+            self.native_unit_of_measurement,
+            dict(attributes) if attributes else None,
+        )
+
+    def _rendered_state(self) -> tuple:
+        """Everything that ends up in the state machine for this entity."""
+        attributes = self.extra_state_attributes
+        return (
+            self.available,
+            self.native_value,
+            self.icon,
+            dict(attributes) if attributes else None,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the rendered state or attributes changed."""
+        self._restored_data = None
+        rendered = self._rendered_state()
+        if rendered == self._last_rendered:
+            self.suppressed_writes += 1
+            return
+        self._last_rendered = rendered
+        self.state_writes += 1
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self):
+        """Return the restored value until the first update, then the live value."""
+        if self._restored_data is not None:
+            return self._restored_data.native_value
+        return self._live_value
+
+    @property
+    def _live_value(self):
+        """Return the value computed from the current snapshot."""
+        return None
+
+    @property
+    def extra_state_attributes(self) -> Optional[dict]:
+        """Return the restored attributes until the first update, then the live ones."""
+        if self._restored_data is not None:
+            return self._restored_data.attributes
+        return self._live_attributes
+
+    @property
+    def _live_attributes(self) -> Optional[dict]:
+        """Return the attributes computed from the current snapshot."""
+        return None
 
     @property
     def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+        """Available from restored data until the first successful update, then while updates succeed."""
+        return (
+            self._restored_data is not None
+            or self.coordinator.snapshot_restored
+            or self.coordinator.last_update_success
+        )
+
+    @property
+    def snapshot(self) -> GDDSnapshot:
+        """Values computed once per coordinator update."""
+        return self.coordinator.snapshot
 
 
 class GDDCurrentTempSensor(GDDBaseSensor):
@@ -84,11 +212,10 @@ class GDDCurrentTempSensor(GDDBaseSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
 
     @property
-    def native_value(self) -> Optional[float]:
+    def _live_value(self) -> Optional[float]:
         """Return current temperature."""
-        if hasattr(self.coordinator, 'current_temp') and self.coordinator.current_temp is not None:
-            return round(self.coordinator.current_temp, 1)
-        return None
+        value = self.snapshot.current_temp
+        return round(value, 1) if value is not None else None
 
 
 class GDDDailyMinSensor(GDDBaseSensor):
@@ -101,11 +228,10 @@ class GDDDailyMinSensor(GDDBaseSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
 
     @property
-    def native_value(self) -> Optional[float]:
+    def _live_value(self) -> Optional[float]:
         """Return daily minimum temperature."""
-        if hasattr(self.coordinator, 'daily_min') and self.coordinator.daily_min is not None:
-            return round(self.coordinator.daily_min, 1)
-        return None
+        value = self.snapshot.daily_min
+        return round(value, 1) if value is not None else None
 
 
 class GDDDailyMaxSensor(GDDBaseSensor):
@@ -118,11 +244,58 @@ class GDDDailyMaxSensor(GDDBaseSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
 
     @property
-    def native_value(self) -> Optional[float]:
+    def _live_value(self) -> Optional[float]:
         """Return daily maximum temperature."""
-        if hasattr(self.coordinator, 'daily_max') and self.coordinator.daily_max is not None:
-            return round(self.coordinator.daily_max, 1)
-        return None
+        value = self.snapshot.daily_max
+        return round(value, 1) if value is not None else None
+
+
+class GDDRollingMinSensor(GDDBaseSensor):
+    """Minimum temperature over the rolling window."""
+    
+    _attr_name = "Rolling Min Temperature"
+    _attr_unique_id = "gdd_rolling_min"
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def _live_value(self) -> Optional[float]:
+        """Return rolling minimum temperature."""
+        value = self.snapshot.rolling_min
+        return round(value, 1) if value is not None else None
+
+    @property
+    def _live_attributes(self) -> dict:
+        """Return window details."""
+        return {
+            "window_hours": self.snapshot.rolling_window_hours,
+            "used_for_gdd": self.snapshot.use_rolling_window,
+        }
+
+
+class GDDRollingMaxSensor(GDDBaseSensor):
+    """Maximum temperature over the rolling window."""
+    
+    _attr_name = "Rolling Max Temperature"
+    _attr_unique_id = "gdd_rolling_max"
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def _live_value(self) -> Optional[float]:
+        """Return rolling maximum temperature."""
+        value = self.snapshot.rolling_max
+        return round(value, 1) if value is not None else None
+
+    @property
+    def _live_attributes(self) -> dict:
+        """Return window details."""
+        return {
+            "window_hours": self.snapshot.rolling_window_hours,
+            "used_for_gdd": self.snapshot.use_rolling_window,
+        }
 
 
 class GDDEstimatedDailySensor(GDDBaseSensor):
@@ -135,11 +308,9 @@ class GDDEstimatedDailySensor(GDDBaseSensor):
     _attr_icon = "mdi:calculator-variant"
 
     @property
-    def native_value(self) -> Optional[float]:
+    def _live_value(self) -> Optional[float]:
         """Return estimated daily GDD."""
-        if hasattr(self.coordinator, 'estimated_daily_gdd'):
-            return round(self.coordinator.estimated_daily_gdd, 2)
-        return None
+        return round(self.snapshot.estimated_daily_gdd, 2)
 
 
 class GDDDailySensor(GDDBaseSensor):
@@ -152,11 +323,9 @@ class GDDDailySensor(GDDBaseSensor):
     _attr_icon = "mdi:weather-sunny"
 
     @property
-    def native_value(self) -> Optional[float]:
+    def _live_value(self) -> Optional[float]:
         """Return daily GDD."""
-        if hasattr(self.coordinator, 'daily_gdd'):
-            return round(self.coordinator.daily_gdd, 2)
-        return None
+        return round(self.snapshot.daily_gdd, 2)
 
 
 class GDDWeeklySensor(GDDBaseSensor):
@@ -169,11 +338,9 @@ class GDDWeeklySensor(GDDBaseSensor):
     _attr_icon = "mdi:fire"
 
     @property
-    def native_value(self) -> Optional[float]:
+    def _live_value(self) -> Optional[float]:
         """Return weekly GDD."""
-        if hasattr(self.coordinator, 'weekly_gdd'):
-            return round(self.coordinator.weekly_gdd, 2)
-        return None
+        return round(self.snapshot.weekly_gdd, 2)
 
 
 class GDDSeasonalSensor(GDDBaseSensor):
@@ -186,11 +353,36 @@ class GDDSeasonalSensor(GDDBaseSensor):
     _attr_icon = "mdi:sun"
 
     @property
-    def native_value(self) -> Optional[float]:
+    def _live_value(self) -> Optional[float]:
         """Return seasonal GDD."""
-        if hasattr(self.coordinator, 'seasonal_gdd'):
-            return round(self.coordinator.seasonal_gdd, 2)
-        return None
+        return round(self.snapshot.seasonal_gdd, 2)
+
+
+class GDDDepartureSensor(GDDBaseSensor):
+    """Seasonal GDD ahead (positive) or behind (negative) the day-of-year normal."""
+    
+    _attr_name = "GDD Departure From Normal"
+    _attr_unique_id = "gdd_departure_from_normal"
+    _attr_native_unit_of_measurement = "°C·day"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def _live_value(self) -> Optional[float]:
+        """Return the departure from normal."""
+        return self.snapshot.departure_from_normal
+
+    @property
+    def _live_attributes(self) -> dict:
+        """Return normals for the season and today."""
+        return self.snapshot.climatology_attributes
+
+    @property
+    def icon(self) -> str:
+        """Return icon based on the departure."""
+        departure = self.snapshot.departure_from_normal
+        if departure is None:
+            return "mdi:chart-bell-curve"
+        return "mdi:arrow-up-bold" if departure >= 0 else "mdi:arrow-down-bold"
 
 
 class GDDProgressSensor(GDDBaseSensor):
@@ -207,76 +399,22 @@ class GDDProgressSensor(GDDBaseSensor):
         self.hass = hass
 
     @property
-    def native_value(self) -> Optional[float]:
+    def _live_value(self) -> Optional[float]:
         """Return GDD progress toward threshold (positive = progress made, negative = over target)."""
-        threshold_entity = self.hass.states.get("input_number.gdd_threshold")
-        if not threshold_entity or not hasattr(self.coordinator, 'seasonal_gdd'):
-            return None
-        
-        try:
-            threshold = float(threshold_entity.state)
-            seasonal = self.coordinator.seasonal_gdd
-            
-            if seasonal <= threshold:
-                # Show positive progress toward target
-                return round(seasonal, 1)
-            else:
-                # Show negative when over target (excess)
-                return round(seasonal - threshold, 1)
-                
-        except (ValueError, TypeError):
-            return None
+        return self.snapshot.progress
 
     @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional progress info."""
-        threshold_entity = self.hass.states.get("input_number.gdd_threshold")
-        if not threshold_entity or not hasattr(self.coordinator, 'seasonal_gdd'):
-            return {}
-        
-        try:
-            threshold = float(threshold_entity.state)
-            seasonal = self.coordinator.seasonal_gdd
-            remaining = max(0, threshold - seasonal)
-            percentage = min(100, (seasonal / threshold) * 100) if threshold > 0 else 0
-            
-            return {
-                "threshold": threshold,
-                "seasonal_gdd": seasonal,
-                "remaining_to_target": round(remaining, 1),
-                "percentage_complete": round(percentage, 1),
-                "over_target": seasonal > threshold
-            }
-        except (ValueError, TypeError):
-            return {}
-
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _live_attributes(self) -> dict:
         """Return additional state attributes."""
-        threshold_entity = self.hass.states.get("input_number.gdd_threshold")
-        attrs = {}
-        
-        if threshold_entity and hasattr(self.coordinator, 'seasonal_gdd'):
-            try:
-                threshold = float(threshold_entity.state)
-                seasonal = self.coordinator.seasonal_gdd
-                attrs['threshold'] = threshold
-                attrs['seasonal_gdd'] = seasonal
-                attrs['percentage_complete'] = round((seasonal / threshold) * 100, 1) if threshold > 0 else 0
-                attrs['gdd_remaining'] = round(threshold - seasonal, 1) if seasonal < threshold else 0
-                attrs['status'] = "Above Threshold" if seasonal >= threshold else "Below Threshold"
-            except (ValueError, TypeError):
-                pass
-                
-        return attrs
+        return self.snapshot.progress_attributes
 
     @property
     def icon(self) -> str:
         """Return icon based on progress."""
-        if self.native_value is None:
+        progress = self.snapshot.progress
+        if progress is None:
             return "mdi:thermometer-alert"
         
-        progress = self.native_value
         if progress >= 0:
             return "mdi:thermometer-chevron-up"  # Above threshold
         else:
@@ -295,36 +433,14 @@ class GDDStatusSensor(GDDBaseSensor):
         self.hass = hass
 
     @property
-    def native_value(self) -> str:
+    def _live_value(self) -> str:
         """Return GDD development stage."""
-        threshold_entity = self.hass.states.get("input_number.gdd_threshold")
-        if not threshold_entity or not hasattr(self.coordinator, 'seasonal_gdd'):
-            return "No Target Set"
-
-        try:
-            threshold = float(threshold_entity.state)
-            seasonal = self.coordinator.seasonal_gdd
-
-            if seasonal < threshold * 0.25:
-                return "Early Development"
-            elif seasonal < threshold * 0.5:
-                return "Active Growth"
-            elif seasonal < threshold * 0.75:
-                return "Advanced Growth"
-            elif seasonal < threshold:
-                percentage = round((seasonal / threshold) * 100, 1) if threshold > 0 else 0
-                return f"Near Target ({percentage}%)"
-            elif abs(seasonal - threshold) < 5:  # Within 5 GDD
-                return "Target Reached"
-            else:
-                return "Target Exceeded"
-        except (ValueError, TypeError):
-            return "Invalid Target"
+        return self.snapshot.development_stage
 
     @property
     def icon(self) -> str:
         """Return icon based on development stage."""
-        status = self.native_value
+        status = self.snapshot.development_stage
         if "Exceeded" in status:
             return "mdi:sprout"
         elif "Target Reached" in status:
@@ -341,37 +457,9 @@ class GDDStatusSensor(GDDBaseSensor):
             return "mdi:thermometer-alert"
 
     @property
-    def extra_state_attributes(self) -> dict:
+    def _live_attributes(self) -> dict:
         """Return additional state attributes."""
-        threshold_entity = self.hass.states.get("input_number.gdd_threshold")
-        attrs = {}
-        
-        if threshold_entity and hasattr(self.coordinator, 'seasonal_gdd'):
-            try:
-                threshold = float(threshold_entity.state)
-                seasonal = self.coordinator.seasonal_gdd
-                attrs['target_gdd'] = threshold
-                attrs['current_gdd'] = seasonal
-                attrs['completion_percentage'] = round((seasonal / threshold) * 100, 1) if threshold > 0 else 0
-                attrs['gdd_remaining'] = round(threshold - seasonal, 1) if seasonal < threshold else 0
-                attrs['development_phase'] = self._get_development_phase(seasonal, threshold)
-            except (ValueError, TypeError):
-                pass
-                
-        return attrs
-    
-    def _get_development_phase(self, seasonal: float, threshold: float) -> str:
-        """Get a more detailed development phase description."""
-        if seasonal < threshold * 0.25:
-            return "Germination & Early Emergence"
-        elif seasonal < threshold * 0.5:
-            return "Vegetative Growth"
-        elif seasonal < threshold * 0.75:
-            return "Reproductive Development"
-        elif seasonal < threshold:
-            return "Maturation Phase"
-        else:
-            return "Harvest Ready"
+        return self.snapshot.development_attributes
 
 
 class GDDDataSourceSensor(GDDBaseSensor):
@@ -383,44 +471,27 @@ class GDDDataSourceSensor(GDDBaseSensor):
     _attr_entity_category = "diagnostic"
 
     @property
-    def native_value(self) -> str:
+    def _live_value(self) -> str:
         """Return the current data source being used."""
-        if hasattr(self.coordinator, 'data_source_info'):
-            info = self.coordinator.data_source_info
-            if info.get('using_combined'):
-                return "Combined Forecast + Tracked"
-            elif info.get('using_forecast'):
-                return "Weather Forecast"
-            elif info.get('using_tracked'):
-                return "Hourly Tracking"
-            else:
-                return "No Data"
-        return "Unknown"
-
-    @property
-    def extra_state_attributes(self) -> dict:
+        return self.snapshot.data_source
+
+    @property
+    def _live_attributes(self) -> dict:
         """Return detailed data source information."""
-        attrs = {}
-        if hasattr(self.coordinator, 'data_source_info'):
-            info = self.coordinator.data_source_info
-            attrs.update(info)
-            
-        # Add current temperature values for debugging
-        if hasattr(self.coordinator, 'tracked_daily_min'):
-            attrs['tracked_min'] = self.coordinator.tracked_daily_min
-        if hasattr(self.coordinator, 'tracked_daily_max'):
-            attrs['tracked_max'] = self.coordinator.tracked_daily_max
-        if hasattr(self.coordinator, 'daily_min'):
-            attrs['final_min'] = self.coordinator.daily_min
-        if hasattr(self.coordinator, 'daily_max'):
-            attrs['final_max'] = self.coordinator.daily_max
-            
-        return attrs
+        snapshot = self.snapshot
+        return {
+            **snapshot.data_source_info,
+            # Add current temperature values for debugging
+            'tracked_min': snapshot.tracked_daily_min,
+            'tracked_max': snapshot.tracked_daily_max,
+            'final_min': snapshot.daily_min,
+            'final_max': snapshot.daily_max,
+        }
 
     @property
     def icon(self) -> str:
         """Return icon based on data source."""
-        source = self.native_value
+        source = self.snapshot.data_source
         if "Combined" in source:
             return "mdi:weather-cloudy"
         elif "Forecast" in source:
@@ -441,21 +512,17 @@ class GDDGrowthRateSensor(GDDBaseSensor):
     _attr_icon = "mdi:trending-up"
 
     @property
-    def native_value(self) -> Optional[float]:
+    def _live_value(self) -> Optional[float]:
         """Return growth rate multiplier."""
-        if hasattr(self.coordinator, 'growth_rate_multiplier'):
-            return round(self.coordinator.growth_rate_multiplier, 2)
-        return None
+        return round(self.snapshot.growth_multiplier, 2)
 
     @property
-    def extra_state_attributes(self) -> dict:
+    def _live_attributes(self) -> dict:
         """Return additional attributes."""
-        attrs = {}
-        if hasattr(self.coordinator, 'estimated_growth_mm'):
-            attrs['daily_growth_mm'] = round(self.coordinator.estimated_growth_mm, 1)
-        if hasattr(self.coordinator, 'weekly_gdd'):
-            attrs['weekly_gdd'] = self.coordinator.weekly_gdd
-        return attrs
+        return {
+            'daily_growth_mm': round(self.snapshot.estimated_growth_mm, 1),
+            'weekly_gdd': self.snapshot.weekly_gdd,
+        }
 
 
 class GDDMowingRecommendationSensor(GDDBaseSensor):
@@ -471,28 +538,24 @@ class GDDMowingRecommendationSensor(GDDBaseSensor):
         self.hass = hass
 
     @property
-    def native_value(self) -> str:
+    def _live_value(self) -> str:
         """Return mowing recommendation."""
-        if hasattr(self.coordinator, 'mowing_recommendation'):
-            return self.coordinator.mowing_recommendation
-        return "Unknown"
+        return self.snapshot.mowing_recommendation
 
     @property
-    def extra_state_attributes(self) -> dict:
+    def _live_attributes(self) -> dict:
         """Return additional mowing info."""
-        attrs = {}
-        if hasattr(self.coordinator, 'accumulated_growth'):
-            attrs['accumulated_growth_mm'] = round(self.coordinator.accumulated_growth, 1)
-        if hasattr(self.coordinator, 'days_since_mow'):
-            attrs['days_since_mow'] = self.coordinator.days_since_mow
-        if hasattr(self.coordinator, 'days_to_next_mow'):
-            attrs['estimated_days_to_mow'] = self.coordinator.days_to_next_mow
-        return attrs
+        snapshot = self.snapshot
+        return {
+            'accumulated_growth_mm': round(snapshot.accumulated_growth, 1),
+            'days_since_mow': snapshot.days_since_mow,
+            'estimated_days_to_mow': snapshot.days_to_next_mow,
+        }
 
     @property
     def icon(self) -> str:
         """Return icon based on recommendation urgency."""
-        recommendation = self.native_value
+        recommendation = self.snapshot.mowing_recommendation
         if "critical" in recommendation.lower():
             return "mdi:lawn-mower-alert"
         elif "overdue" in recommendation.lower():
@@ -514,28 +577,22 @@ class GDDPGRRecommendationSensor(GDDBaseSensor):
     _attr_icon = "mdi:spray"
 
     @property
-    def native_value(self) -> str:
+    def _live_value(self) -> str:
         """Return PGR recommendation."""
-        if hasattr(self.coordinator, 'pgr_recommendation'):
-            return self.coordinator.pgr_recommendation
-        return "Unknown"
+        return self.snapshot.pgr_recommendation
 
     @property
-    def extra_state_attributes(self) -> dict:
+    def _live_attributes(self) -> dict:
         """Return additional PGR info."""
-        attrs = {}
-        if hasattr(self.coordinator, 'weekly_gdd'):
-            attrs['weekly_gdd'] = self.coordinator.weekly_gdd
-        if hasattr(self.coordinator, 'weekly_gdd_history') and self.coordinator.weekly_gdd_history:
-            attrs['average_weekly_gdd'] = round(
-                sum(self.coordinator.weekly_gdd_history) / len(self.coordinator.weekly_gdd_history), 1
-            )
+        attrs = {'weekly_gdd': self.snapshot.weekly_gdd}
+        if self.snapshot.average_weekly_gdd is not None:
+            attrs['average_weekly_gdd'] = self.snapshot.average_weekly_gdd
         return attrs
 
     @property
     def icon(self) -> str:
         """Return icon based on PGR urgency."""
-        recommendation = self.native_value
+        recommendation = self.snapshot.pgr_recommendation
         if "rescue" in recommendation.lower():
             return "mdi:spray-bottle"
         elif "active" in recommendation.lower():
@@ -555,21 +612,17 @@ class GDDGrowthForecastSensor(GDDBaseSensor):
     _attr_icon = "mdi:chart-line-variant"
 
     @property
-    def native_value(self) -> str:
+    def _live_value(self) -> str:
         """Return growth forecast."""
-        if hasattr(self.coordinator, 'growth_forecast'):
-            return self.coordinator.growth_forecast
-        return "Unknown"
+        return self.snapshot.growth_forecast
 
     @property
-    def extra_state_attributes(self) -> dict:
+    def _live_attributes(self) -> dict:
         """Return forecast details."""
-        attrs = {}
-        if hasattr(self.coordinator, 'growth_rate_multiplier'):
-            attrs['growth_multiplier'] = self.coordinator.growth_rate_multiplier
-        if hasattr(self.coordinator, 'estimated_daily_gdd'):
-            attrs['estimated_daily_gdd'] = self.coordinator.estimated_daily_gdd
-        return attrs
+        return {
+            'growth_multiplier': self.snapshot.growth_multiplier,
+            'estimated_daily_gdd': self.snapshot.estimated_daily_gdd,
+        }
 
 
 class GDDAccumulatedGrowthSensor(GDDBaseSensor):
@@ -583,8 +636,194 @@ class GDDAccumulatedGrowthSensor(GDDBaseSensor):
     _attr_icon = "mdi:ruler"
 
     @property
-    def native_value(self) -> Optional[float]:
+    def _live_value(self) -> Optional[float]:
         """Return accumulated growth in millimeters."""
-        if hasattr(self.coordinator, 'accumulated_growth'):
-            return round(self.coordinator.accumulated_growth, 1)
-        return None
+        return round(self.snapshot.accumulated_growth, 1)
+
+
+class GDDUpdateLatencySensor(GDDBaseSensor):
+    """Diagnostic sensor showing coordinator update latency and write counters."""
+    
+    _attr_name = "GDD Update Latency"
+    _attr_unique_id = "gdd_update_latency"
+    _attr_native_unit_of_measurement = "ms"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = "diagnostic"
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:timer-outline"
+
+    @property
+    def _live_value(self) -> Optional[float]:
+        """Return the latency of the last update."""
+        last = self.coordinator.stats.update_latency.last_ms
+        return round(last, 2) if last is not None else None
+
+    @property
+    def _live_attributes(self) -> dict:
+        """Return the latency summary, store writes and last rollover."""
+        stats = self.coordinator.stats
+        latency = stats.update_latency.as_dict()
+        return {
+            'updates': latency["count"],
+            'mean_ms': latency["mean_ms"],
+            'max_ms': latency["max_ms"],
+            'forecast_parse_mean_ms': stats.forecast_parse.as_dict()["mean_ms"],
+            'store_writes': sum(counter.count for counter in stats.store_writes.values()),
+            'last_rollover': stats.last_rollover.isoformat() if stats.last_rollover else None,
+        }
+
+
+class GDDBackfillSensor(GDDBaseSensor):
+    """Diagnostic sensor showing the progress of the recorder backfill."""
+    
+    _attr_name = "GDD Backfill Progress"
+    _attr_unique_id = "gdd_backfill_progress"
+    _attr_native_unit_of_measurement = "%"
+    _attr_entity_category = "diagnostic"
+
+    @property
+    def _live_value(self) -> Optional[float]:
+        """Return the share of the backfill range read so far."""
+        return self.coordinator.backfill.percent
+
+    @property
+    def _live_attributes(self) -> dict:
+        """Return the backfill status, range and day counts."""
+        return self.coordinator.backfill.as_dict()
+
+    @property
+    def icon(self) -> str:
+        """Return icon based on the backfill status."""
+        if self.coordinator.backfill_running:
+            return "mdi:database-sync"
+        return "mdi:database-check"
+
+
+class GDDZoneSensor(GDDBaseSensor):
+    """Base class for sensors of one zone."""
+
+    _zone_label = ""
+    _zone_key = ""
+
+    def __init__(self, coordinator: GDDCoordinator, entry: ConfigEntry, zone_id: str):
+        super().__init__(coordinator, entry)
+        self.zone_id = zone_id
+        self._attr_name = f"{coordinator.zones[zone_id].name} {self._zone_label}"
+        self._attr_unique_id = f"gdd_zone_{zone_id}_{self._zone_key}"
+
+    @property
+    def zone(self) -> Optional[ZoneSnapshot]:
+        """This zone's values from the current snapshot."""
+        return self.snapshot.zones.get(self.zone_id)
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return super().available and (self._restored_data is not None or self.zone is not None)
+
+    @property
+    def _live_attributes(self) -> dict:
+        """Return the zone's settings."""
+        zone = self.zone
+        if zone is None:
+            return {}
+        return {
+            'zone': zone.name,
+            'base_temperature': zone.base_temp,
+            'calculation_method': zone.calculation_method,
+        }
+
+
+class GDDZoneDailySensor(GDDZoneSensor):
+    """Daily GDD for a zone."""
+
+    _zone_label = "Daily GDD"
+    _zone_key = "daily"
+    _attr_native_unit_of_measurement = "°C·day"
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_icon = "mdi:weather-sunny"
+
+    @property
+    def _live_value(self) -> Optional[float]:
+        """Return the zone's daily GDD."""
+        zone = self.zone
+        return round(zone.daily_gdd, 2) if zone else None
+
+    @property
+    def _live_attributes(self) -> dict:
+        """Return the zone's settings and today's estimate."""
+        attrs = super()._live_attributes
+        if self.zone is not None:
+            attrs['estimated_daily_gdd'] = round(self.zone.estimated_daily_gdd, 2)
+        return attrs
+
+
+class GDDZoneWeeklySensor(GDDZoneSensor):
+    """Weekly GDD for a zone."""
+
+    _zone_label = "Weekly GDD"
+    _zone_key = "weekly"
+    _attr_native_unit_of_measurement = "°C·day"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:fire"
+
+    @property
+    def _live_value(self) -> Optional[float]:
+        """Return the zone's weekly GDD."""
+        zone = self.zone
+        return round(zone.weekly_gdd, 2) if zone else None
+
+
+class GDDZoneSeasonalSensor(GDDZoneSensor):
+    """Seasonal GDD for a zone."""
+
+    _zone_label = "Seasonal GDD"
+    _zone_key = "seasonal"
+    _attr_native_unit_of_measurement = "°C·day"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:sun"
+
+    @property
+    def _live_value(self) -> Optional[float]:
+        """Return the zone's seasonal GDD."""
+        zone = self.zone
+        return round(zone.seasonal_gdd, 2) if zone else None
+
+    @property
+    def _live_attributes(self) -> dict:
+        """Return the zone's settings and projected target date."""
+        attrs = super()._live_attributes
+        zone = self.zone
+        if zone is not None and self.snapshot.threshold is not None:
+            projected = zone.projected_target_date
+            attrs['projected_target_date'] = projected.isoformat() if projected else None
+        return attrs
+
+
+class GDDZoneMowingSensor(GDDZoneSensor):
+    """Mowing recommendation for a zone."""
+
+    _zone_label = "Mowing Recommendation"
+    _zone_key = "mowing_recommendation"
+    _attr_native_unit_of_measurement = None
+    _attr_icon = "mdi:lawn-mower"
+
+    @property
+    def _live_value(self) -> Optional[str]:
+        """Return the zone's mowing recommendation."""
+        zone = self.zone
+        return zone.mowing_recommendation if zone else None
+
+    @property
+    def _live_attributes(self) -> dict:
+        """Return the zone's mowing info."""
+        zone = self.zone
+        if zone is None:
+            return {}
+        return {
+            **super()._live_attributes,
+            'maintenance_level': zone.maintenance_level,
+            'accumulated_growth_mm': round(zone.accumulated_growth, 1),
+            'days_since_mow': zone.days_since_mow,
+            'estimated_days_to_mow': zone.days_to_next_mow,
+        }
@@ -0,0 +1,193 @@
+"""Immutable per-update snapshot of every value the GDD sensors render."""
+from __future__ import annotations
+from dataclasses import dataclass, field, fields
+from datetime import date
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from .zones import ZoneSnapshot
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _frozen(values: Dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap a dict so snapshot attributes can't be changed after the fact."""
+    return MappingProxyType(values)
+
+
+@dataclass(frozen=True, slots=True)
+class GDDSnapshot:
+    """Values computed once per coordinator update and read by all sensors."""
+
+    # Temperatures
+    current_temp: Optional[float] = None
+    tracked_daily_min: Optional[float] = None
+    tracked_daily_max: Optional[float] = None
+    forecast_daily_min: Optional[float] = None
+    forecast_daily_max: Optional[float] = None
+    daily_min: Optional[float] = None
+    daily_max: Optional[float] = None
+    rolling_min: Optional[float] = None
+    rolling_max: Optional[float] = None
+    rolling_window_hours: float = 24.0
+    use_rolling_window: bool = False
+
+    # GDD
+    estimated_daily_gdd: float = 0.0
+    daily_gdd: float = 0.0
+    weekly_gdd: float = 0.0
+    seasonal_gdd: float = 0.0
+    average_weekly_gdd: Optional[float] = None
+
+    # Threshold progress
+    threshold: Optional[float] = None
+    progress: Optional[float] = None
+    progress_attributes: Mapping[str, Any] = field(default_factory=lambda: _EMPTY)
+    projected_target_date: Optional[date] = None
+    development_stage: str = "No Target Set"
+    development_attributes: Mapping[str, Any] = field(default_factory=lambda: _EMPTY)
+
+    # Climatology
+    normal_seasonal_gdd: Optional[float] = None
+    departure_from_normal: Optional[float] = None
+    climatology_attributes: Mapping[str, Any] = field(default_factory=lambda: _EMPTY)
+
+    # Data sources
+    data_source: str = "No Data"
+    data_source_info: Mapping[str, Any] = field(default_factory=lambda: _EMPTY)
+
+    # Turf
+    growth_multiplier: float = 1.0
+    estimated_growth_mm: float = 0.0
+    accumulated_growth: float = 0.0
+    days_since_mow: int = 0
+    days_to_next_mow: int = 7
+    mowing_recommendation: str = "Unknown"
+    pgr_recommendation: str = "Unknown"
+    growth_forecast: str = "Unknown"
+
+    # Zones, keyed by zone id
+    zones: Mapping[str, ZoneSnapshot] = field(default_factory=lambda: _EMPTY)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form persisted so sensors can render it on startup."""
+        data: Dict[str, Any] = {}
+        for item in fields(self):
+            value = getattr(self, item.name)
+            if item.name == "zones":
+                value = {zone_id: zone.as_dict() for zone_id, zone in value.items()}
+            elif isinstance(value, date):
+                value = value.isoformat()
+            elif isinstance(value, Mapping):
+                value = dict(value)
+            data[item.name] = value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GDDSnapshot":
+        """Rebuild a snapshot written by as_dict; missing fields keep their defaults."""
+        values: Dict[str, Any] = {}
+        for item in fields(cls):
+            if item.name not in data:
+                continue
+            value = data[item.name]
+            if item.name == "zones":
+                value = _frozen({zone_id: ZoneSnapshot.from_dict(zone) for zone_id, zone in value.items()})
+            elif item.name == "projected_target_date":
+                value = date.fromisoformat(value) if value else None
+            elif isinstance(value, dict):
+                value = _frozen(value)
+            values[item.name] = value
+        return cls(**values)
+
+
+def parse_threshold(state) -> tuple[Optional[float], bool]:
+    """Return (threshold, present) for the threshold helper state."""
+    if state is None:
+        return None, False
+    try:
+        return float(state.state), True
+    except (ValueError, TypeError):
+        return None, True
+
+
+def threshold_progress(
+    seasonal: float, threshold: Optional[float], projected_date: Optional[date] = None
+) -> tuple[Optional[float], Mapping[str, Any]]:
+    """Progress value and attributes (positive = progress made, negative = over target)."""
+    if threshold is None:
+        return None, _EMPTY
+
+    if seasonal <= threshold:
+        # Show positive progress toward target
+        progress = round(seasonal, 1)
+    else:
+        # Show negative when over target (excess)
+        progress = round(seasonal - threshold, 1)
+
+    return progress, _frozen({
+        "threshold": threshold,
+        "seasonal_gdd": seasonal,
+        "percentage_complete": round((seasonal / threshold) * 100, 1) if threshold > 0 else 0,
+        "gdd_remaining": round(threshold - seasonal, 1) if seasonal < threshold else 0,
+        "status": "Above Threshold" if seasonal >= threshold else "Below Threshold",
+        "projected_target_date": projected_date.isoformat() if projected_date else None,
+    })
+
+
+def development_stage(
+    seasonal: float, threshold: Optional[float], present: bool
+) -> tuple[str, Mapping[str, Any]]:
+    """Development stage label and attributes for the seasonal total."""
+    if not present:
+        return "No Target Set", _EMPTY
+    if threshold is None:
+        return "Invalid Target", _EMPTY
+
+    if seasonal < threshold * 0.25:
+        stage = "Early Development"
+    elif seasonal < threshold * 0.5:
+        stage = "Active Growth"
+    elif seasonal < threshold * 0.75:
+        stage = "Advanced Growth"
+    elif seasonal < threshold:
+        percentage = round((seasonal / threshold) * 100, 1) if threshold > 0 else 0
+        stage = f"Near Target ({percentage}%)"
+    elif abs(seasonal - threshold) < 5:  # Within 5 GDD
+        stage = "Target Reached"
+    else:
+        stage = "Target Exceeded"
+
+    return stage, _frozen({
+        "target_gdd": threshold,
+        "current_gdd": seasonal,
+        "completion_percentage": round((seasonal / threshold) * 100, 1) if threshold > 0 else 0,
+        "gdd_remaining": round(threshold - seasonal, 1) if seasonal < threshold else 0,
+        "development_phase": development_phase(seasonal, threshold),
+    })
+
+
+def development_phase(seasonal: float, threshold: float) -> str:
+    """Get a more detailed development phase description."""
+    if seasonal < threshold * 0.25:
+        return "Germination & Early Emergence"
+    elif seasonal < threshold * 0.5:
+        return "Vegetative Growth"
+    elif seasonal < threshold * 0.75:
+        return "Reproductive Development"
+    elif seasonal < threshold:
+        return "Maturation Phase"
+    else:
+        return "Harvest Ready"
+
+
+def data_source_label(info: Mapping[str, Any]) -> str:
+    """Describe the data source being used."""
+    if info.get("using_combined"):
+        return "Combined Forecast + Tracked"
+    elif info.get("using_forecast"):
+        return "Weather Forecast"
+    elif info.get("using_tracked"):
+        return "Hourly Tracking"
+    else:
+        return "No Data"
@@ -0,0 +1,72 @@
+"""Turf growth and mowing calculations shared by the coordinator and zones."""
+from __future__ import annotations
+
+from .const import TURF_GROWTH_RATES, MOWING_THRESHOLDS, DEFAULT_MAINTENANCE_LEVEL
+
+
+def growth_multiplier(daily_gdd: float, growth_config: dict = TURF_GROWTH_RATES) -> float:
+    """Calculate growth rate multiplier based on GDD conditions."""
+    optimal_min, optimal_max = growth_config["optimal_gdd_range"]
+    dormancy_threshold = growth_config["dormancy_threshold"]
+    stress_threshold = growth_config["stress_threshold"]
+
+    if daily_gdd <= dormancy_threshold:
+        # Dormant/minimal growth
+        return 0.1
+    elif daily_gdd < optimal_min:
+        # Slow growth, ramping up
+        return 0.3 + (daily_gdd - dormancy_threshold) * 0.7 / (optimal_min - dormancy_threshold)
+    elif optimal_min <= daily_gdd <= optimal_max:
+        # Optimal growth range
+        return 1.0
+    elif daily_gdd <= stress_threshold:
+        # Fast growth, stress building
+        excess_ratio = (daily_gdd - optimal_max) / (stress_threshold - optimal_max)
+        return 1.0 + (excess_ratio * 1.5)  # Up to 2.5x normal growth
+    else:
+        # Heat stress, reduced growth
+        return 0.8
+
+
+def daily_growth(daily_gdd: float, growth_config: dict = TURF_GROWTH_RATES) -> tuple[float, float]:
+    """Return (growth in mm, multiplier) for one day's GDD."""
+    multiplier = growth_multiplier(daily_gdd, growth_config)
+    return daily_gdd * growth_config["base_growth_rate"] * multiplier, multiplier
+
+
+def mowing_threshold(maintenance_level: str) -> float:
+    """Growth in mm before mowing is needed for a maintenance level."""
+    return MOWING_THRESHOLDS.get(maintenance_level, MOWING_THRESHOLDS[DEFAULT_MAINTENANCE_LEVEL])
+
+
+def mowing_recommendation(accumulated_growth: float, maintenance_level: str) -> str:
+    """Get mowing recommendation based on accumulated growth."""
+    threshold = mowing_threshold(maintenance_level)
+
+    if accumulated_growth < threshold * 0.5:
+        return "No mowing needed"
+    elif accumulated_growth < threshold * 0.8:
+        return "Mowing soon"
+    elif accumulated_growth < threshold:
+        return "Mowing recommended"
+    elif accumulated_growth < threshold * 1.5:
+        return "Mowing overdue"
+    else:
+        return "Mowing critical"
+
+
+def days_to_next_mow(
+    multiplier: float, accumulated_growth: float, estimated_growth_mm: float, maintenance_level: str
+) -> int:
+    """Estimate days until next mowing needed."""
+    if multiplier <= 0:
+        return 14  # Default for dormant conditions
+
+    # Calculate remaining growth needed
+    remaining_growth = max(0, mowing_threshold(maintenance_level) - accumulated_growth)
+
+    # Estimate based on recent growth rate
+    if estimated_growth_mm > 0:
+        return max(1, int(remaining_growth / estimated_growth_mm))
+
+    return 7  # Default weekly interval
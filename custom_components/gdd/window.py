@@ -0,0 +1,68 @@
+"""Rolling min/max over a sliding time window."""
+from __future__ import annotations
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+
+class RollingMinMax:
+    """Track the minimum and maximum over the last ``window`` of readings.
+
+    Two monotonic deques of (timestamp, value) pairs keep only the readings
+    that can still become the minimum or maximum, so every update is
+    amortized O(1) and the extremes are read from the deque heads.
+    """
+
+    def __init__(self, window: timedelta):
+        self.window = window
+        self._min: deque = deque()  # Values increasing from head to tail
+        self._max: deque = deque()  # Values decreasing from head to tail
+
+    def add(self, when: datetime, value: float) -> None:
+        """Add a reading and drop readings that fell out of the window."""
+        timestamp = when.timestamp()
+
+        min_queue = self._min
+        while min_queue and min_queue[-1][1] >= value:
+            min_queue.pop()
+        min_queue.append((timestamp, value))
+
+        max_queue = self._max
+        while max_queue and max_queue[-1][1] <= value:
+            max_queue.pop()
+        max_queue.append((timestamp, value))
+
+        self._expire(timestamp)
+
+    def expire(self, now: datetime) -> None:
+        """Drop readings older than the window relative to now."""
+        self._expire(now.timestamp())
+
+    def _expire(self, timestamp: float) -> None:
+        cutoff = timestamp - self.window.total_seconds()
+        while self._min and self._min[0][0] < cutoff:
+            self._min.popleft()
+        while self._max and self._max[0][0] < cutoff:
+            self._max.popleft()
+
+    @property
+    def min(self) -> Optional[float]:
+        """Lowest reading in the window."""
+        return self._min[0][1] if self._min else None
+
+    @property
+    def max(self) -> Optional[float]:
+        """Highest reading in the window."""
+        return self._max[0][1] if self._max else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Serialize the deques; they hold everything future queries need."""
+        return {
+            "min": [list(item) for item in self._min],
+            "max": [list(item) for item in self._max],
+        }
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        """Restore deques written by as_dict."""
+        self._min = deque((float(ts), float(value)) for ts, value in data.get("min", []))
+        self._max = deque((float(ts), float(value)) for ts, value in data.get("max", []))
@@ -0,0 +1,197 @@
+"""Zones: plots with their own base temperature, method and mowing state."""
+from __future__ import annotations
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from homeassistant.util import slugify
+
+from .const import (
+    CONF_ZONE_ID, CONF_ZONE_NAME, CONF_BASE_TEMP, CONF_CALCULATION_METHOD,
+    CONF_MAINTENANCE_LEVEL, DEFAULT_BASE, METHOD_SIMPLE_AVERAGE
+)
+from .calculations import calculate_gdd_batch
+from . import turf
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneSnapshot:
+    """Values computed once per update for one zone's sensors."""
+
+    zone_id: str
+    name: str
+    base_temp: float
+    calculation_method: str
+    maintenance_level: str
+    estimated_daily_gdd: float
+    daily_gdd: float
+    weekly_gdd: float
+    seasonal_gdd: float
+    accumulated_growth: float
+    days_since_mow: int
+    days_to_next_mow: int
+    mowing_recommendation: str
+    projected_target_date: Optional[date] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form persisted with the coordinator snapshot."""
+        data = asdict(self)
+        if self.projected_target_date is not None:
+            data["projected_target_date"] = self.projected_target_date.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ZoneSnapshot":
+        """Rebuild a snapshot written by as_dict."""
+        projected = data.get("projected_target_date")
+        return cls(**{
+            **{name: data[name] for name in cls.__dataclass_fields__ if name in data},
+            "projected_target_date": date.fromisoformat(projected) if projected else None,
+        })
+
+
+@dataclass(slots=True)
+class GDDZone:
+    """Running totals for one zone; weather inputs come from the coordinator."""
+
+    zone_id: str
+    name: str
+    base_temp: float
+    calculation_method: str = METHOD_SIMPLE_AVERAGE
+    maintenance_level: Optional[str] = None  # None follows the maintenance helper
+    estimated_daily_gdd: float = 0.0
+    daily_gdd: float = 0.0
+    weekly_gdd: float = 0.0
+    seasonal_gdd: float = 0.0
+    days_since_mow: int = 0
+    accumulated_growth: float = 0.0
+    estimated_growth_mm: float = 0.0
+    growth_multiplier: float = 1.0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "GDDZone":
+        """Create a zone from its config entry definition."""
+        name = config[CONF_ZONE_NAME]
+        return cls(
+            zone_id=config.get(CONF_ZONE_ID) or slugify(name),
+            name=name,
+            base_temp=float(config.get(CONF_BASE_TEMP, DEFAULT_BASE)),
+            calculation_method=config.get(CONF_CALCULATION_METHOD, METHOD_SIMPLE_AVERAGE),
+            maintenance_level=config.get(CONF_MAINTENANCE_LEVEL) or None,
+        )
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        """Restore running totals written by as_dict."""
+        self.daily_gdd = data.get("daily_gdd", 0.0)
+        self.weekly_gdd = data.get("weekly_gdd", 0.0)
+        self.seasonal_gdd = data.get("seasonal_gdd", 0.0)
+        self.days_since_mow = data.get("days_since_mow", 0)
+        self.accumulated_growth = data.get("accumulated_growth", 0.0)
+        self.estimated_growth_mm = data.get("estimated_growth_mm", 0.0)
+        self.growth_multiplier = data.get("growth_multiplier", 1.0)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Running totals persisted with the coordinator data."""
+        return {
+            "daily_gdd": self.daily_gdd,
+            "weekly_gdd": self.weekly_gdd,
+            "seasonal_gdd": self.seasonal_gdd,
+            "days_since_mow": self.days_since_mow,
+            "accumulated_growth": self.accumulated_growth,
+            "estimated_growth_mm": self.estimated_growth_mm,
+            "growth_multiplier": self.growth_multiplier,
+        }
+
+    def finish_day(self, daily_gdd: float, in_week: bool = True, in_season: bool = True) -> None:
+        """Add a finished day's GDD to turf growth, and to the totals if in season."""
+        self.daily_gdd = daily_gdd
+        if in_season:
+            self.seasonal_gdd += daily_gdd
+            if in_week:
+                self.weekly_gdd += daily_gdd
+        self.days_since_mow += 1
+        growth, self.growth_multiplier = turf.daily_growth(daily_gdd)
+        self.estimated_growth_mm = growth
+        self.accumulated_growth += growth
+
+    def add_past_day(self, daily_gdd: float, in_week: bool) -> None:
+        """Credit a day older than the last finished one to the totals only."""
+        self.seasonal_gdd += daily_gdd
+        if in_week:
+            self.weekly_gdd += daily_gdd
+
+    def reset_all(self) -> None:
+        """Reset all totals for a new season."""
+        self.daily_gdd = 0.0
+        self.weekly_gdd = 0.0
+        self.seasonal_gdd = 0.0
+        self.record_mowing()
+
+    def record_mowing(self) -> None:
+        """Record that this zone was mowed."""
+        self.days_since_mow = 0
+        self.accumulated_growth = 0.0
+
+    def snapshot(
+        self, default_maintenance_level: str, projected_target_date: Optional[date] = None
+    ) -> ZoneSnapshot:
+        """Freeze the zone's current values for its sensors."""
+        level = self.maintenance_level or default_maintenance_level
+        return ZoneSnapshot(
+            zone_id=self.zone_id,
+            name=self.name,
+            base_temp=self.base_temp,
+            calculation_method=self.calculation_method,
+            maintenance_level=level,
+            estimated_daily_gdd=self.estimated_daily_gdd,
+            daily_gdd=self.daily_gdd,
+            weekly_gdd=self.weekly_gdd,
+            seasonal_gdd=self.seasonal_gdd,
+            accumulated_growth=self.accumulated_growth,
+            days_since_mow=self.days_since_mow,
+            days_to_next_mow=turf.days_to_next_mow(
+                self.growth_multiplier, self.accumulated_growth, self.estimated_growth_mm, level
+            ),
+            mowing_recommendation=turf.mowing_recommendation(self.accumulated_growth, level),
+            projected_target_date=projected_target_date,
+        )
+
+
+def zones_from_config(configs: Iterable[Dict[str, Any]]) -> Dict[str, GDDZone]:
+    """Build zones keyed by id, keeping config order."""
+    zones: Dict[str, GDDZone] = {}
+    for config in configs or []:
+        zone = GDDZone.from_config(config)
+        zones.setdefault(zone.zone_id, zone)
+    return zones
+
+
+def calculate_zone_gdd(
+    zones: Iterable[GDDZone], min_temp: float, max_temp: float
+) -> Dict[str, float]:
+    """Calculate one day's GDD for every zone in a single batch."""
+    return {
+        zone_id: values[0]
+        for zone_id, values in calculate_zone_gdd_days(zones, [min_temp], [max_temp]).items()
+    }
+
+
+def calculate_zone_gdd_days(
+    zones: Iterable[GDDZone], min_temps: Sequence[float], max_temps: Sequence[float]
+) -> Dict[str, List[float]]:
+    """Calculate many days' GDD for every zone in a single batch.
+
+    Zones sharing a base temperature and method share one computed series.
+    """
+    zones = list(zones)
+    if not zones:
+        return {}
+
+    bases: List[float] = sorted({zone.base_temp for zone in zones})
+    methods = tuple(dict.fromkeys(zone.calculation_method for zone in zones))
+    result = calculate_gdd_batch(min_temps, max_temps, bases, methods)
+    base_index = {base: index for index, base in enumerate(bases)}
+    return {
+        zone.zone_id: [float(value) for value in result.daily[zone.calculation_method][base_index[zone.base_temp]]]
+        for zone in zones
+    }
@@ -0,0 +1,132 @@
+"""Make the integration importable as ``custom_components.gdd`` from the repository root."""
+import asyncio
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+WEATHER_ENTITY = "weather.test"
+
+
+class MemoryStore:
+    """Store kept in memory as JSON, shared by key like files on disk."""
+
+    disk: Dict[str, str] = {}
+
+    def __init__(self, hass, version, key, *args, **kwargs):
+        self.key = key
+
+    @property
+    def data(self):
+        return json.loads(self.disk[self.key]) if self.key in self.disk else None
+
+    @data.setter
+    def data(self, data):
+        self.disk[self.key] = json.dumps(data)
+
+    async def async_load(self):
+        return self.data
+
+    async def async_save(self, data):
+        self.data = data
+
+    def async_delay_save(self, data_func, delay=0):
+        self.data = data_func()
+
+    async def async_remove(self):
+        self.disk.pop(self.key, None)
+
+
+class Recorder:
+    """Recorded states served to recorder_history in place of the database."""
+
+    def __init__(self):
+        self.states: Dict[str, List[Any]] = {}
+
+    def add(self, when: datetime, temperature: float, entity_id: str = WEATHER_ENTITY) -> None:
+        from fakes import FakeState
+
+        state = FakeState(entity_id, "sunny", {"temperature": temperature})
+        state.last_updated = when
+        self.states.setdefault(entity_id, []).append(state)
+
+    def get_significant_states(self, hass, start_time, end_time, entity_ids, **kwargs):
+        return {
+            entity_id: [
+                state for state in self.states.get(entity_id, [])
+                if start_time <= state.last_updated < end_time
+            ]
+            for entity_id in entity_ids
+        }
+
+
+@pytest.fixture
+def memory_store():
+    """An in-memory Store class with its own empty disk."""
+    return type("Store", (MemoryStore,), {"disk": {}})
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    """Serve recorder queries from memory; hass.async_add_executor_job stands in for the recorder's."""
+    from custom_components.gdd import recorder_history
+
+    recorder = Recorder()
+    monkeypatch.setattr(recorder_history.history, "get_significant_states", recorder.get_significant_states)
+    monkeypatch.setattr(recorder_history, "get_instance", lambda hass: hass)
+    return recorder
+
+
+@pytest.fixture
+def imported_statistics(monkeypatch):
+    """Long-term statistics rows handed to the recorder, per statistic id."""
+    from custom_components.gdd import long_term_statistics
+
+    imported: Dict[str, List[Any]] = {}
+
+    def add_external_statistics(hass, metadata, rows):
+        imported.setdefault(metadata["statistic_id"], []).append(list(rows))
+
+    monkeypatch.setattr(long_term_statistics, "async_add_external_statistics", add_external_statistics)
+    return imported
+
+
+@pytest.fixture
+def make_coordinator(monkeypatch, memory_store, imported_statistics):
+    """Build and load coordinators on a fake hass with every Store in memory."""
+    from homeassistant import config_entries
+
+    from custom_components.gdd import climatology, coordinator, history
+    from custom_components.gdd.const import (
+        CONF_BASE_TEMP, CONF_CALCULATION_METHOD, CONF_WEATHER, METHOD_SIMPLE_AVERAGE,
+    )
+    from fakes import FakeConfigEntry, FakeHass
+
+    for module in (climatology, coordinator, history):
+        monkeypatch.setattr(module, "Store", memory_store)
+
+    async def make(entry_id: str = "test", hass=None, load: bool = True, **data):
+        hass = hass or FakeHass(asyncio.get_running_loop())
+        hass.config.components.add("recorder")
+        entry = FakeConfigEntry(entry_id, {
+            CONF_WEATHER: WEATHER_ENTITY,
+            CONF_BASE_TEMP: 10.0,
+            CONF_CALCULATION_METHOD: METHOD_SIMPLE_AVERAGE,
+            **data,
+        })
+        hass.config_entries.entries[entry_id] = entry
+        if hasattr(config_entries, "current_entry"):
+            config_entries.current_entry.set(entry)
+        built = coordinator.GDDCoordinator(hass, entry.data, entry_id)
+        if load:
+            await built.async_load()
+        return built
+
+    return make
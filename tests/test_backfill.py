@@ -0,0 +1,121 @@
+"""Tests for rebuilding finished days from recorder history."""
+import asyncio
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.gdd.const import BACKFILL_SPARSE_DAYS_LISTED, BACKFILL_SPARSE_READINGS  # noqa: E402
+from custom_components.gdd.recorder_history import BackfillProgress  # noqa: E402
+
+START = date(2024, 4, 1)
+
+
+def test_progress_summarizes_readings_with_a_capped_day_list():
+    progress = BackfillProgress()
+    assert progress.as_dict()["median_readings_per_day"] is None
+
+    for offset in range(3 * 365):
+        progress.readings[START + timedelta(days=offset)] = 24 if offset % 10 else offset % 4
+    attributes = progress.as_dict()
+
+    sparse = [day for day, count in progress.readings.items() if count < BACKFILL_SPARSE_READINGS]
+    assert attributes["days_with_readings"] == 3 * 365
+    assert attributes["sparse_days"] == len(sparse)
+    assert attributes["min_readings_per_day"] == 0
+    assert attributes["median_readings_per_day"] == 24
+    assert len(attributes["sparsest_days"]) == BACKFILL_SPARSE_DAYS_LISTED
+    assert attributes["sparsest_days"] == sorted(attributes["sparsest_days"])
+    # The sparsest days come first: every listed day has no readings
+    assert all(progress.readings[date.fromisoformat(day)] == 0 for day in attributes["sparsest_days"])
+
+
+def _record_days(recorder, first, days, low=5.0, high=25.0):
+    """Two readings per day; simple average at base 10 gives (low + high) / 2 - 10."""
+    for offset in range(days):
+        day = first + timedelta(days=offset)
+        recorder.add(datetime.combine(day, time(4), timezone.utc), low)
+        recorder.add(datetime.combine(day, time(15), timezone.utc), high)
+
+
+async def _backfill(coordinator, start, end):
+    coordinator.async_start_backfill(start, end)
+    await coordinator._backfill_task
+
+
+def _settled(coordinator, season_start=None, seasonal=100.0):
+    """A coordinator that has credited every day up to today."""
+    coordinator.last_calculation_date = dt_util.now().date().isoformat()
+    coordinator.season_start = season_start.isoformat() if season_start else None
+    coordinator.seasonal_gdd = seasonal
+    for zone in coordinator.zones.values():
+        zone.seasonal_gdd = seasonal
+
+
+ZONES = [{"zone_id": "front", "name": "Front", "base_temperature": 5.0, "calculation_method": "simple_average"}]
+
+
+def test_backfill_without_season_start_only_fills_history(make_coordinator, recorder, imported_statistics):
+    async def run():
+        coordinator = await make_coordinator(zones=ZONES)
+        today = dt_util.now().date()
+        _settled(coordinator)
+        _record_days(recorder, today - timedelta(days=10), 9)
+        await _backfill(coordinator, today - timedelta(days=10), today - timedelta(days=2))
+        return coordinator
+
+    coordinator = asyncio.run(run())
+    assert coordinator.backfill.status == "finished"
+    assert coordinator.backfill.days_applied == 9
+    assert len(coordinator.history) == 9
+    assert coordinator.climatology.days == 9
+    # Those days were already in the totals, so nothing is counted twice
+    assert coordinator.seasonal_gdd == pytest.approx(100.0)
+    assert coordinator.zones["front"].seasonal_gdd == pytest.approx(100.0)
+    assert coordinator.days_since_mow == 0
+    assert coordinator.daily_gdd == 0.0
+    coordinator.async_import_statistics()
+    (rows,) = imported_statistics["gdd:daily_gdd_test"]
+    assert len(rows) == 9 and rows[-1]["sum"] == pytest.approx(45.0)
+
+
+def test_backfill_credits_days_from_an_explicit_season_start_once(make_coordinator, recorder):
+    async def run():
+        coordinator = await make_coordinator(zones=ZONES)
+        today = dt_util.now().date()
+        _settled(coordinator, season_start=today - timedelta(days=4), seasonal=0.0)
+        _record_days(recorder, today - timedelta(days=10), 9)
+        await _backfill(coordinator, today - timedelta(days=10), today - timedelta(days=2))
+        first = (coordinator.seasonal_gdd, coordinator.zones["front"].seasonal_gdd)
+        # Running the same range again replaces the days rather than adding them
+        await _backfill(coordinator, today - timedelta(days=10), today - timedelta(days=2))
+        return coordinator, first
+
+    coordinator, first = asyncio.run(run())
+    assert len(coordinator.history) == 9
+    # Three of the backfilled days fall on or after the season start
+    assert first == (pytest.approx(3 * 5.0), pytest.approx(3 * 10.0))
+    assert coordinator.seasonal_gdd == pytest.approx(first[0])
+    assert coordinator.zones["front"].seasonal_gdd == pytest.approx(first[1])
+    assert coordinator.days_since_mow == 0
+
+
+def test_uncredited_days_advance_the_daily_state(make_coordinator, recorder):
+    async def run():
+        coordinator = await make_coordinator(zones=ZONES)
+        today = dt_util.now().date()
+        _settled(coordinator, seasonal=0.0)
+        coordinator.last_calculation_date = (today - timedelta(days=3)).isoformat()
+        _record_days(recorder, today - timedelta(days=5), 4)
+        await _backfill(coordinator, today - timedelta(days=5), today - timedelta(days=2))
+        return coordinator
+
+    coordinator = asyncio.run(run())
+    # Only the two days from last_calculation_date on are new
+    assert coordinator.seasonal_gdd == pytest.approx(2 * 5.0)
+    assert coordinator.zones["front"].seasonal_gdd == pytest.approx(2 * 10.0)
+    assert coordinator.days_since_mow == 2
+    assert coordinator.daily_gdd == pytest.approx(5.0)
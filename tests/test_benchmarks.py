@@ -0,0 +1,22 @@
+"""Smoke test that the benchmark harness runs against the integration."""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+
+import run_benchmarks  # noqa: E402
+
+
+def test_one_round_covers_every_benchmark():
+    document = asyncio.run(run_benchmarks.run(1, 2))
+    results = document["results"]
+    assert document["zones"] == 2
+    assert document["history_days"] == 365 * run_benchmarks.HISTORY_YEARS
+    assert results["update_cycle_with_save"]["store_writes"] > 0
+    assert results["sensor_render_all"]["entities"] > 0
+    assert all(result["rounds"] == 1 for result in results.values())
@@ -0,0 +1,72 @@
+"""Tests for the batch GDD engine."""
+import random
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.gdd.calculations import (  # noqa: E402
+    ALL_METHODS,
+    calculate_gdd,
+    calculate_gdd_batch,
+)
+
+BASES = (0.0, 5.0, 10.0, 12.5)
+
+
+def _season(seed, days=200):
+    rng = random.Random(seed)
+    mins, maxs = [], []
+    for _ in range(days):
+        low = rng.uniform(-10, 25)
+        mins.append(low)
+        maxs.append(low + rng.choice((0.0, rng.uniform(0, 20))))  # Include flat days
+    return mins, maxs
+
+
+def _assert_matches_scalar(result, mins, maxs):
+    for method in ALL_METHODS:
+        for base_index, base in enumerate(BASES):
+            expected = [calculate_gdd(low, high, base, method) for low, high in zip(mins, maxs)]
+            assert list(result.daily[method][base_index]) == pytest.approx(expected, abs=1e-9)
+            running = 0.0
+            for day, value in enumerate(expected):
+                running += value
+                assert result.cumulative[method][base_index][day] == pytest.approx(running, abs=1e-6)
+            assert result.total(method, base_index) == pytest.approx(running, abs=1e-6)
+
+
+def test_python_backend_matches_scalar_functions():
+    mins, maxs = _season(1)
+    result = calculate_gdd_batch(mins, maxs, BASES, use_numpy=False)
+    assert result.methods == ALL_METHODS
+    assert result.days == len(mins)
+    _assert_matches_scalar(result, mins, maxs)
+
+
+def test_numpy_backend_matches_scalar_functions():
+    pytest.importorskip("numpy")
+    mins, maxs = _season(2)
+    result = calculate_gdd_batch(mins, maxs, BASES, use_numpy=True)
+    _assert_matches_scalar(result, mins, maxs)
+
+
+def test_single_base_and_method_selection():
+    mins, maxs = _season(3, days=30)
+    result = calculate_gdd_batch(mins, maxs, 10, ["single_sine"], use_numpy=False)
+    assert result.base_temps == (10.0,)
+    assert set(result.daily) == {"single_sine"}
+    assert result.totals("single_sine") == [pytest.approx(result.total("single_sine"))]
+
+
+def test_empty_season_totals_zero():
+    result = calculate_gdd_batch([], [], BASES, use_numpy=False)
+    assert result.days == 0
+    assert result.totals("simple_average") == [0.0] * len(BASES)
+
+
+def test_invalid_input_raises():
+    with pytest.raises(ValueError):
+        calculate_gdd_batch([1.0, 2.0], [3.0], 10.0)
+    with pytest.raises(ValueError):
+        calculate_gdd_batch([1.0], [3.0], 10.0, ["unknown"])
@@ -0,0 +1,64 @@
+"""Tests for catching up on days missed while Home Assistant was down."""
+import asyncio
+from datetime import datetime, time, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from conftest import WEATHER_ENTITY  # noqa: E402
+
+
+def _record_day(recorder, day, low, high):
+    recorder.add(datetime.combine(day, time(4), timezone.utc), low)
+    recorder.add(datetime.combine(day, time(15), timezone.utc), high)
+
+
+def _down_since(coordinator, last_day):
+    """State as left by the last update before the downtime."""
+    coordinator.last_calculation_date = last_day.isoformat()
+    coordinator.tracked_daily_min = coordinator.tracked_daily_max = 15.0
+    coordinator.hass.states.set(WEATHER_ENTITY, "sunny", {"temperature": 15.0})
+
+
+def test_missed_days_are_rebuilt_from_the_recorder(make_coordinator, recorder):
+    async def run():
+        coordinator = await make_coordinator()
+        today = dt_util.now().date()
+        last_day = today - timedelta(days=3)
+        for offset in range(3):
+            _record_day(recorder, last_day + timedelta(days=offset), 5.0 + offset, 25.0 + offset)
+        _down_since(coordinator, last_day)
+
+        await coordinator._async_update_data()
+        return coordinator, today, last_day
+
+    coordinator, today, last_day = asyncio.run(run())
+    # The partly tracked last day comes from the recorder too, not from 15/15
+    assert [coordinator.history.get(last_day + timedelta(days=offset))["gdd"] for offset in range(3)] == [
+        pytest.approx(5.0), pytest.approx(6.0), pytest.approx(7.0)
+    ]
+    assert coordinator.seasonal_gdd == pytest.approx(18.0)
+    assert coordinator.daily_gdd == pytest.approx(7.0)
+    assert coordinator.days_since_mow == 3
+    assert coordinator.last_calculation_date == today.isoformat()
+
+
+def test_days_missing_from_the_recorder_fall_back_to_tracking(make_coordinator, recorder):
+    async def run():
+        coordinator = await make_coordinator()
+        today = dt_util.now().date()
+        last_day = today - timedelta(days=2)
+        _record_day(recorder, today - timedelta(days=1), 10.0, 30.0)
+        _down_since(coordinator, last_day)
+
+        await coordinator._async_update_data()
+        return coordinator, today
+
+    coordinator, today = asyncio.run(run())
+    # The last day is finished from its tracked 15/15, the day after from the recorder
+    assert coordinator.seasonal_gdd == pytest.approx(5.0 + 10.0)
+    assert coordinator.history.get(today - timedelta(days=1))["gdd"] == pytest.approx(10.0)
+    assert coordinator.days_since_mow == 2
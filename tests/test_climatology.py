@@ -0,0 +1,69 @@
+"""Tests for the day-of-year climatology and its compact store."""
+import asyncio
+import random
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.gdd import climatology as climatology_module  # noqa: E402
+from custom_components.gdd import history as history_module  # noqa: E402
+from custom_components.gdd.climatology import ClimatologyIndex  # noqa: E402
+from custom_components.gdd.history import GDDHistory  # noqa: E402
+
+START = date(2020, 1, 1)
+
+
+@pytest.fixture
+def history(monkeypatch, memory_store):
+    monkeypatch.setattr(history_module, "Store", memory_store)
+    monkeypatch.setattr(climatology_module, "Store", memory_store)
+    history = GDDHistory(None, "test")
+    rng = random.Random(5)
+    for offset in range(365 * 4):
+        low = rng.uniform(-5, 20)
+        history.record(START + timedelta(days=offset), low, low + 10, rng.uniform(0, 15), 10.0, "simple_average")
+    return history
+
+
+def _built(history):
+    index = ClimatologyIndex(None, "test")
+    index.rebuild(history.columns)
+    return index
+
+
+def test_store_holds_only_fixed_size_statistics(history):
+    index = _built(history)
+    fields = index._as_dict()["fields"]
+    assert all(set(stored) == {"mean", "m2"} for stored in fields.values())
+
+
+def test_percentiles_come_back_from_the_history(history):
+    index = _built(history)
+    asyncio.run(index.async_flush())
+
+    restored = ClimatologyIndex(None, "test")
+    restored.store.data = index.store.data
+    asyncio.run(restored.async_load())
+    day = START + timedelta(days=200)
+    assert not restored.has_percentiles
+    assert "p50" not in restored.statistics("gdd", day)
+    assert restored.statistics("gdd", day)["mean"] == index.statistics("gdd", day)["mean"]
+
+    restored.load_values(history.columns)
+    for offset in range(0, 366, 7):
+        for field in ("gdd", "min", "max"):
+            assert restored.statistics(field, day + timedelta(days=offset)) == index.statistics(
+                field, day + timedelta(days=offset)
+            )
+
+
+def test_add_and_remove_keep_statistics_in_step(history):
+    index = _built(history)
+    day = START + timedelta(days=40)
+    before = index.statistics("gdd", day)
+    index.add(day, 50.0, 1.0, 2.0)
+    assert index.statistics("gdd", day)["p90"] > before["p90"]
+    index.remove(day, 50.0, 1.0, 2.0)
+    assert index.statistics("gdd", day) == before
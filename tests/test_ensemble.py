@@ -0,0 +1,97 @@
+"""Tests for the analog-year ensemble of threshold crossing dates."""
+import asyncio
+import threading
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.gdd.ensemble import EnsembleCancelled, run_ensemble  # noqa: E402
+
+TODAY = date(2024, 5, 1)
+TARGETS = {None: (0.0, 10.0, "simple_average")}
+
+
+def _years(years, gdd_by_year, skip=()):
+    """Columns for whole years of flat days with the given GDD at base 10."""
+    days, mins, maxs = [], [], []
+    for year, gdd in zip(years, gdd_by_year):
+        day = date(year, 1, 1)
+        while day.year == year:
+            if day not in skip:
+                days.append(day.toordinal())
+                mins.append(10.0 + gdd)
+                maxs.append(10.0 + gdd)
+            day += timedelta(days=1)
+    return days, mins, maxs
+
+
+def _run(columns, threshold=50.0, targets=TARGETS, horizon=365, cancel=None):
+    return run_ensemble(TODAY, threshold, targets, *columns, horizon, cancel or threading.Event())
+
+
+def test_percentiles_follow_the_analog_years():
+    result = _run(_years((2020, 2021, 2022), (1.0, 2.0, 5.0)))[None]
+    assert result["analog_years"] == [2020, 2021, 2022]
+    assert result["years_reaching"] == 3
+    # 50 GDD at 5, 2 and 1 a day: 10, 25 and 50 days
+    assert result["p10"] == (TODAY + timedelta(days=9)).isoformat()
+    assert result["p50"] == (TODAY + timedelta(days=24)).isoformat()
+    assert result["p90"] == (TODAY + timedelta(days=49)).isoformat()
+
+
+def test_targets_start_from_their_own_totals():
+    targets = {
+        None: (0.0, 10.0, "simple_average"),
+        "zone": (40.0, 10.0, "simple_average"),
+        "done": (60.0, 10.0, "simple_average"),
+    }
+    results = _run(_years((2021, 2022), (2.0, 2.0)), targets=targets)
+    assert results["zone"]["p50"] == (TODAY + timedelta(days=4)).isoformat()
+    assert results["done"]["p50"] == TODAY.isoformat()
+
+
+def test_missing_days_use_the_normals_and_short_horizons_do_not_cross():
+    gap = {date(2022, 5, 1) + timedelta(days=offset) for offset in range(10)}
+    result = _run(_years((2021, 2022), (2.0, 2.0), skip=gap))[None]
+    assert result["p90"] == (TODAY + timedelta(days=24)).isoformat()
+
+    result = _run(_years((2021, 2022), (2.0, 2.0)), horizon=10)[None]
+    assert result["years_reaching"] == 0
+    assert result["p50"] is None
+
+
+def test_no_history_gives_empty_summaries():
+    result = _run(([], [], []))[None]
+    assert result["analog_years"] == [] and result["p50"] is None
+
+
+def test_cancel_stops_the_worker():
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(EnsembleCancelled):
+        _run(_years((2021, 2022), (2.0, 2.0)), cancel=cancel)
+
+
+def test_coordinator_replays_the_entry_and_zones(make_coordinator):
+    zones = [
+        {"zone_id": "front", "name": "Front", "base_temperature": 5.0, "calculation_method": "simple_average"}
+    ]
+
+    async def run():
+        coordinator = await make_coordinator(zones=zones)
+        coordinator.history.loaded = True
+        start = dt_util.now().date() - timedelta(days=3 * 365)
+        for offset in range(3 * 365):
+            coordinator._record_history_day(start + timedelta(days=offset), 12.0, 12.0, 2.0)
+        return await coordinator.async_run_ensemble(40.0, 60)
+
+    result = asyncio.run(run())
+    today = dt_util.now().date()
+    assert result["threshold"] == 40.0 and result["horizon_days"] == 60
+    assert result["p50"] == (today + timedelta(days=19)).isoformat()
+    # At base 5 the zone gathers 7 a day
+    assert result["zones"]["front"]["p50"] == (today + timedelta(days=5)).isoformat()
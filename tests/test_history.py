@@ -0,0 +1,95 @@
+"""Tests for the columnar history and its prefix-sum index."""
+import asyncio
+import random
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.gdd import history as history_module  # noqa: E402
+from custom_components.gdd.history import GDDHistory  # noqa: E402
+
+START = date(2023, 3, 1)
+
+
+@pytest.fixture
+def history(monkeypatch, memory_store):
+    monkeypatch.setattr(history_module, "Store", memory_store)
+    return GDDHistory(None, "test")
+
+
+def _record(history, day, gdd):
+    history.record(day, 5.0, 25.0, gdd, 10.0, "simple_average")
+
+
+def _brute_sum(history, start, end):
+    """Sum the stored (float32) GDD column row by row."""
+    return sum(
+        gdd for ordinal, gdd in zip(history.columns["day"], history.columns["gdd"])
+        if (start is None or ordinal >= start.toordinal()) and (end is None or ordinal <= end.toordinal())
+    )
+
+
+def _random_bound(rng):
+    if rng.random() < 0.1:
+        return None
+    return START + timedelta(days=rng.randrange(-30, 430))
+
+
+def test_sum_gdd_empty(history):
+    assert history.sum_gdd() == 0.0
+    assert history.sum_gdd(START, START + timedelta(days=10)) == 0.0
+
+
+def test_sum_gdd_matches_row_sums_with_gaps(history):
+    rng = random.Random(3)
+    for offset in range(400):
+        if rng.random() < 0.8:  # Leave gaps, as days without data do
+            _record(history, START + timedelta(days=offset), rng.uniform(0, 20))
+
+    for _ in range(500):
+        start, end = _random_bound(rng), _random_bound(rng)
+        assert history.sum_gdd(start, end) == pytest.approx(_brute_sum(history, start, end), abs=1e-6)
+
+
+def test_prefix_follows_inserts_replacements_and_clear(history):
+    rng = random.Random(7)
+    days = [START + timedelta(days=offset) for offset in range(120)]
+    for day in days[60:]:
+        _record(history, day, rng.uniform(0, 15))
+    assert history.sum_gdd() == pytest.approx(_brute_sum(history, None, None))
+
+    # Earlier days, replacements and a new first day only rebuild the stale tail
+    for _ in range(200):
+        day = rng.choice(days)
+        _record(history, day, rng.uniform(0, 15))
+        probe = rng.choice(days)
+        assert history.sum_gdd(probe) == pytest.approx(_brute_sum(history, probe, None), abs=1e-6)
+        assert history.sum_gdd(None, probe) == pytest.approx(_brute_sum(history, None, probe), abs=1e-6)
+
+    history.clear()
+    assert history.sum_gdd() == 0.0
+    _record(history, days[5], 4.0)
+    assert history.sum_gdd() == pytest.approx(4.0)
+
+
+def test_record_returns_previous_gdd(history):
+    assert history.record(START, 5.0, 25.0, 5.0, 10.0, "simple_average") is None
+    assert history.record(START, 6.0, 26.0, 6.0, 10.0, "simple_average") == pytest.approx(5.0)
+    assert len(history) == 1
+
+
+def test_round_trip_keeps_rows_and_sums(history):
+    rng = random.Random(11)
+    for offset in range(0, 300, 2):
+        _record(history, START + timedelta(days=offset), rng.uniform(0, 20))
+    asyncio.run(history.async_save())
+
+    restored = GDDHistory(None, "test")
+    restored.store.data = history.store.data
+    asyncio.run(restored.async_ensure_loaded())
+
+    assert list(restored.columns["day"]) == list(history.columns["day"])
+    assert list(restored.columns["gdd"]) == list(history.columns["gdd"])
+    assert restored.sum_gdd() == pytest.approx(history.sum_gdd())
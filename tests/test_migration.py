@@ -0,0 +1,78 @@
+"""Tests for migrating the shared pre-v3 storage to per-entry stores."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.gdd.const import LEGACY_PENDING_ENTRIES, STORAGE_KEY  # noqa: E402
+
+LEGACY = {"seasonal_gdd": 123.0, "days_since_mow": 4}
+
+
+async def _entries(make_coordinator, *entry_ids):
+    """Register the entries on one hass, as configured when the blob is first read."""
+    first = await make_coordinator(entry_ids[0], load=False)
+    others = [await make_coordinator(entry_id, hass=first.hass, load=False) for entry_id in entry_ids[1:]]
+    return [first, *others]
+
+
+def test_every_configured_entry_gets_a_copy_then_the_blob_goes(make_coordinator, memory_store):
+    memory_store(None, 1, STORAGE_KEY).data = LEGACY
+    legacy = memory_store(None, 1, STORAGE_KEY)
+
+    async def run():
+        first, second = await _entries(make_coordinator, "a", "b")
+        await first.async_load()
+        pending = legacy.data[LEGACY_PENDING_ENTRIES]
+
+        # An entry added after the upgrade starts empty and is not waited for
+        late = await make_coordinator("c", hass=first.hass)
+        await second.async_load()
+        await asyncio.sleep(0)
+        return first, second, late, pending
+
+    first, second, late, pending = asyncio.run(run())
+    assert pending == ["b"]
+    assert first.seasonal_gdd == second.seasonal_gdd == 123.0
+    assert first.days_since_mow == second.days_since_mow == 4
+    assert late.seasonal_gdd == 0.0
+    assert legacy.data is None
+    for entry_id in ("a", "b"):
+        assert memory_store(None, 1, f"{STORAGE_KEY}.{entry_id}").data["seasonal_gdd"] == 123.0
+
+
+def test_entries_no_longer_clobber_each_other(make_coordinator, memory_store):
+    async def run():
+        first, second = await _entries(make_coordinator, "a", "b")
+        await first.async_load()
+        await second.async_load()
+        first.seasonal_gdd = 10.0
+        second.seasonal_gdd = 20.0
+        await first.async_save()
+        await second.async_save()
+
+        # After a restart each entry reads its own store
+        again_first, again_second = await _entries(make_coordinator, "a", "b")
+        await again_first.async_load()
+        await again_second.async_load()
+        return again_first, again_second
+
+    first, second = asyncio.run(run())
+    assert (first.seasonal_gdd, second.seasonal_gdd) == (10.0, 20.0)
+
+
+def test_removed_entries_do_not_keep_the_blob(make_coordinator, memory_store):
+    memory_store(None, 1, STORAGE_KEY).data = LEGACY
+    legacy = memory_store(None, 1, STORAGE_KEY)
+
+    async def run():
+        first, _ = await _entries(make_coordinator, "a", "b")
+        first.hass.config_entries.entries.pop("b")
+        await first.async_load()
+        await asyncio.sleep(0)
+        return first
+
+    first = asyncio.run(run())
+    assert first.seasonal_gdd == 123.0
+    assert legacy.data is None
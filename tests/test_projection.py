@@ -0,0 +1,117 @@
+"""Tests for day-of-year normals and threshold projection."""
+import random
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.gdd.projection import (  # noqa: E402
+    DAYS_IN_CYCLE,
+    LEAP_DAY_SLOT,
+    DailyNormals,
+    build_normals,
+    day_of_year_index,
+    project_threshold_date,
+)
+
+
+def _normals(seed, zeros=False):
+    rng = random.Random(seed)
+    choices = (0.0, 0.0, None) if zeros else (None,)
+    return DailyNormals.from_means([
+        value if value is not None else rng.uniform(0, 10)
+        for value in (rng.choice(choices) for _ in range(DAYS_IN_CYCLE))
+    ])
+
+
+def _calendar_sum(normals, start, days):
+    return sum(normals.mean[day_of_year_index(start + timedelta(days=offset))] for offset in range(days))
+
+
+def _calendar_days(normals, start, amount, max_days):
+    if amount <= 0:
+        return 0
+    total = 0.0
+    for offset in range(min(max_days, DAYS_IN_CYCLE)):
+        total += normals.mean[day_of_year_index(start + timedelta(days=offset))]
+        if total >= amount:
+            return offset + 1
+    return None
+
+
+def test_day_of_year_index_uses_a_leap_calendar():
+    assert day_of_year_index(date(2023, 1, 1)) == 0
+    assert day_of_year_index(date(2023, 2, 28)) == LEAP_DAY_SLOT - 1
+    assert day_of_year_index(date(2024, 2, 29)) == LEAP_DAY_SLOT
+    assert day_of_year_index(date(2023, 3, 1)) == day_of_year_index(date(2024, 3, 1)) == LEAP_DAY_SLOT + 1
+    assert day_of_year_index(date(2023, 12, 31)) == DAYS_IN_CYCLE - 1
+
+
+def test_from_means_interpolates_gaps_around_the_year():
+    means = [None] * DAYS_IN_CYCLE
+    means[10] = 2.0
+    means[20] = 4.0
+    normals = DailyNormals.from_means(means)
+    assert normals.mean[15] == pytest.approx(3.0)
+    # Slots after 20 fall from 4.0 back to 2.0 across the year end
+    assert 2.0 < normals.mean[0] < normals.mean[DAYS_IN_CYCLE - 1] < 4.0
+    assert normals.prefix[-1] == pytest.approx(2 * sum(normals.mean))
+    assert DailyNormals.from_means([None] * DAYS_IN_CYCLE) is None
+
+
+@pytest.mark.parametrize("zeros", [False, True])
+def test_sum_days_follows_the_calendar(zeros):
+    normals = _normals(1, zeros)
+    rng = random.Random(2)
+    for _ in range(500):
+        start = date(2019, 1, 1) + timedelta(days=rng.randrange(365 * 8))
+        days = rng.randrange(0, 800)
+        assert normals.sum_days(start, days) == pytest.approx(_calendar_sum(normals, start, days), abs=1e-6)
+
+
+@pytest.mark.parametrize("zeros", [False, True])
+def test_days_to_accumulate_follows_the_calendar(zeros):
+    normals = _normals(3, zeros)
+    rng = random.Random(4)
+    for _ in range(500):
+        start = date(2019, 1, 1) + timedelta(days=rng.randrange(365 * 8))
+        amount = rng.uniform(0, 2000)
+        max_days = rng.randrange(1, 400)
+        assert normals.days_to_accumulate(start, amount, max_days) == _calendar_days(
+            normals, start, amount, max_days
+        )
+
+
+def test_feb_29_slot_is_skipped_in_non_leap_years():
+    means = [0.0] * DAYS_IN_CYCLE
+    means[LEAP_DAY_SLOT] = 100.0
+    means[LEAP_DAY_SLOT + 1] = 1.0
+    normals = DailyNormals.from_means(means)
+    assert normals.sum_days(date(2023, 2, 28), 2) == pytest.approx(1.0)
+    assert normals.sum_days(date(2024, 2, 28), 2) == pytest.approx(100.0)
+    assert normals.days_to_accumulate(date(2023, 2, 28), 1.0, 10) == 2
+    assert normals.days_to_accumulate(date(2024, 2, 28), 1.0, 10) == 2
+    assert normals.days_to_accumulate(date(2023, 2, 28), 50.0, 10) is None
+
+
+def test_build_normals_averages_each_slot_per_setting():
+    days = [date(2022, 6, 1), date(2023, 6, 1), date(2023, 6, 2)]
+    normals = build_normals(days, [10.0, 14.0, 12.0], [20.0, 24.0, 22.0], [(10.0, "simple_average")])
+    built = normals[(10.0, "simple_average")]
+    assert built.mean[day_of_year_index(date(2023, 6, 1))] == pytest.approx(7.0)
+    assert built.mean[day_of_year_index(date(2023, 6, 2))] == pytest.approx(7.0)
+    assert build_normals([], [], [], [(10.0, "simple_average")]) == {}
+
+
+def test_project_threshold_date_uses_forecast_then_normals():
+    today = date(2023, 6, 1)
+    normals = DailyNormals.from_means([2.0] * DAYS_IN_CYCLE)
+    near_term = [5.0, 5.0, 5.0]
+
+    assert project_threshold_date(today, 0.0, near_term, normals, 365) == today
+    assert project_threshold_date(today, 10.0, near_term, normals, 365) == today + timedelta(days=1)
+    # 15 from the forecast days, then 2 a day from the normals
+    assert project_threshold_date(today, 21.0, near_term, normals, 365) == today + timedelta(days=5)
+    assert project_threshold_date(today, 21.0, near_term, None, 365) is None
+    assert project_threshold_date(today, 1000.0, near_term, normals, 30) is None
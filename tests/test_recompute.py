@@ -0,0 +1,80 @@
+"""Tests for recomputing the recorded season and the base-temperature sweep."""
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.gdd.calculations import calculate_gdd  # noqa: E402
+
+TEMPERATURES = [(2.0, 12.0), (6.0, 20.0), (9.0, 27.0), (12.0, 30.0)]
+
+
+async def _recorded(make_coordinator, days=60, season_days=20):
+    """A coordinator whose history and totals agree, plus a manual offset."""
+    coordinator = await make_coordinator()
+    coordinator.history.loaded = True
+    today = dt_util.now().date()
+    first = today - timedelta(days=days)
+    season_start = today - timedelta(days=season_days)
+    coordinator.season_start = season_start.isoformat()
+    for offset in range(days):
+        day = first + timedelta(days=offset)
+        low, high = TEMPERATURES[offset % len(TEMPERATURES)]
+        gdd = calculate_gdd(low, high, 10.0, "simple_average")
+        coordinator._record_history_day(day, low, high, gdd)
+    coordinator.seasonal_gdd = coordinator.history.sum_gdd(season_start) + 7.0
+    coordinator.daily_gdd = coordinator.history.get(today - timedelta(days=1))["gdd"]
+    return coordinator, season_start
+
+
+def test_recompute_keeps_the_season_total_consistent(make_coordinator):
+    async def run():
+        coordinator, season_start = await _recorded(make_coordinator)
+        normal_before = coordinator.climatology.statistics("gdd", season_start)["mean"]
+        await coordinator.async_apply_settings(base_temp=5.0, calculation_method="single_sine")
+        again = await coordinator.async_recompute_season()
+        return coordinator, season_start, normal_before, again
+
+    coordinator, season_start, normal_before, again = asyncio.run(run())
+    yesterday = dt_util.now().date() - timedelta(days=1)
+    assert again == 0
+    # Every recorded year is rewritten, only the season moves the total
+    assert all(
+        record["base"] == 5.0 and record["method"] == "single_sine"
+        for record in coordinator.history.iter_records()
+    )
+    assert coordinator.seasonal_gdd == pytest.approx(coordinator.history.sum_gdd(season_start) + 7.0, abs=1e-3)
+    assert coordinator.daily_gdd == pytest.approx(coordinator.history.get(yesterday)["gdd"])
+    assert coordinator.climatology.statistics("gdd", season_start)["mean"] > normal_before
+
+
+def test_recompute_leaves_the_total_alone_before_the_season(make_coordinator):
+    async def run():
+        coordinator, _ = await _recorded(make_coordinator)
+        coordinator.season_start = dt_util.now().date().isoformat()
+        before = coordinator.seasonal_gdd
+        await coordinator.async_apply_settings(base_temp=0.0)
+        return coordinator, before
+
+    coordinator, before = asyncio.run(run())
+    assert coordinator.seasonal_gdd == pytest.approx(before)
+
+
+def test_sweep_includes_max_base_and_matches_the_scalar_methods(make_coordinator):
+    async def run():
+        coordinator, season_start = await _recorded(make_coordinator)
+        return coordinator, season_start, await coordinator.async_sweep_base_temperature(0.0, 1.0, 0.1)
+
+    coordinator, season_start, sweep = asyncio.run(run())
+    assert sweep["base_temperatures"] == [round(index * 0.1, 3) for index in range(11)]
+    assert sweep["start_date"] == season_start.isoformat()
+    assert sweep["days"] == 20
+    records = list(coordinator.history.iter_records(season_start))
+    for method, totals in sweep["methods"].items():
+        for base, total in zip(sweep["base_temperatures"], totals):
+            expected = sum(calculate_gdd(record["min"], record["max"], base, method) for record in records)
+            assert total == pytest.approx(expected, abs=0.01)
@@ -0,0 +1,82 @@
+"""Tests for daily GDD and hourly temperatures imported as long-term statistics."""
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.gdd.const import MAX_PENDING_HOURLY_STATISTICS, STATISTICS_IMPORT_BATCH  # noqa: E402
+from custom_components.gdd.long_term_statistics import (  # noqa: E402
+    HourlyTemperatures,
+    daily_gdd_rows,
+    statistic_id,
+)
+
+START = date(2023, 1, 1)
+HOUR = datetime(2024, 6, 1, 10, tzinfo=timezone.utc)
+
+
+def test_daily_rows_carry_the_running_sum():
+    days = [START.toordinal() + offset for offset in range(3)]
+    rows = daily_gdd_rows(days, [1.0, 2.0, 3.0], 10.0)
+    assert [row["state"] for row in rows] == [1.0, 2.0, 3.0]
+    assert [row["sum"] for row in rows] == [11.0, 13.0, 16.0]
+    assert rows[0]["start"] == dt_util.as_utc(dt_util.start_of_local_day(START))
+
+
+def test_statistic_ids_are_per_entry():
+    assert statistic_id("daily_gdd", "01ABC") == "gdd:daily_gdd_01abc"
+
+
+def test_history_imports_in_batches_and_reimports_from_changed_days(make_coordinator, imported_statistics):
+    days = STATISTICS_IMPORT_BATCH + 34
+
+    async def run():
+        coordinator = await make_coordinator()
+        coordinator.history.loaded = True
+        for offset in range(days):
+            coordinator._record_history_day(START + timedelta(days=offset), 5.0, 25.0, 5.0)
+        coordinator.async_import_statistics()
+        full = list(imported_statistics.pop("gdd:daily_gdd_test"))
+
+        # Rewriting one day re-imports from it, continuing the earlier sum
+        changed = START + timedelta(days=days - 10)
+        coordinator._record_history_day(changed, 5.0, 35.0, 10.0)
+        coordinator.async_import_statistics()
+        return full, imported_statistics["gdd:daily_gdd_test"], changed
+
+    full, partial, changed = asyncio.run(run())
+    assert [len(rows) for rows in full] == [STATISTICS_IMPORT_BATCH, 34]
+    assert full[1][0]["sum"] == pytest.approx(full[0][-1]["sum"] + 5.0)
+    assert full[1][-1]["sum"] == pytest.approx(5.0 * days)
+
+    (rows,) = partial
+    assert len(rows) == 10
+    assert rows[0]["start"] == dt_util.as_utc(dt_util.start_of_local_day(changed))
+    assert rows[0]["sum"] == pytest.approx(5.0 * (days - 10) + 10.0)
+    assert rows[-1]["sum"] == pytest.approx(5.0 * days + 5.0)
+
+
+def test_hourly_temperatures_close_each_hour():
+    hourly = HourlyTemperatures()
+    for minute, temp in ((0, 10.0), (20, 14.0), (40, 12.0)):
+        hourly.add(HOUR + timedelta(minutes=minute), temp)
+    assert hourly.pop_finished() == []
+
+    hourly.add(HOUR + timedelta(hours=1), 20.0)
+    (row,) = hourly.pop_finished()
+    assert row["start"] == HOUR
+    assert (row["mean"], row["min"], row["max"]) == (12.0, 10.0, 14.0)
+    assert hourly.pop_finished() == []
+
+
+def test_unimported_hours_stay_bounded():
+    hourly = HourlyTemperatures()
+    for hour in range(MAX_PENDING_HOURLY_STATISTICS + 20):
+        hourly.add(HOUR + timedelta(hours=hour), 15.0)
+    rows = hourly.pop_finished()
+    assert len(rows) == MAX_PENDING_HOURLY_STATISTICS
+    assert rows[-1]["start"] == HOUR + timedelta(hours=MAX_PENDING_HOURLY_STATISTICS + 18)
@@ -0,0 +1,74 @@
+"""Tests for the rolling min/max window."""
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.gdd.window import RollingMinMax  # noqa: E402
+
+START = datetime(2024, 5, 1, tzinfo=timezone.utc)
+WINDOW = timedelta(hours=24)
+
+
+def _readings(seed, count=2000):
+    rng = random.Random(seed)
+    when = START
+    readings = []
+    for _ in range(count):
+        when += timedelta(minutes=rng.choice((1, 5, 15, 60, 180)))
+        readings.append((when, round(rng.uniform(-5, 35), 1)))
+    return readings
+
+
+def _assert_monotonic(window):
+    mins = [value for _, value in window._min]
+    maxs = [value for _, value in window._max]
+    assert mins == sorted(mins) and len(set(mins)) == len(mins)
+    assert maxs == sorted(maxs, reverse=True) and len(set(maxs)) == len(maxs)
+
+
+def test_empty_window():
+    window = RollingMinMax(WINDOW)
+    assert window.min is None
+    assert window.max is None
+
+
+def test_matches_brute_force_over_sliding_window():
+    window = RollingMinMax(WINDOW)
+    readings = _readings(1)
+    for index, (when, value) in enumerate(readings):
+        window.add(when, value)
+        cutoff = when - WINDOW
+        in_window = [v for w, v in readings[:index + 1] if w >= cutoff]
+        assert window.min == min(in_window)
+        assert window.max == max(in_window)
+        _assert_monotonic(window)
+
+
+def test_expire_without_new_readings():
+    window = RollingMinMax(WINDOW)
+    window.add(START, 30.0)
+    window.add(START + timedelta(hours=12), 10.0)
+    window.add(START + timedelta(hours=13), 20.0)
+
+    window.expire(START + timedelta(hours=25))
+    assert (window.min, window.max) == (10.0, 20.0)
+
+    window.expire(START + timedelta(hours=38))
+    assert (window.min, window.max) == (None, None)
+
+
+def test_round_trip_continues_identically():
+    readings = _readings(2, 600)
+    original = RollingMinMax(WINDOW)
+    for when, value in readings[:300]:
+        original.add(when, value)
+
+    restored = RollingMinMax(WINDOW)
+    restored.restore(original.as_dict())
+    for when, value in readings[300:]:
+        original.add(when, value)
+        restored.add(when, value)
+        assert (restored.min, restored.max) == (original.min, original.max)